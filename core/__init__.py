@@ -1,4 +1,13 @@
-from .detector import SignLanguageDetector
-from .tts_manager import TTSManager
+_EXPORTS = {
+    'SignLanguageDetector': 'core.detector',
+    'TTSManager': 'core.tts_manager',
+}
 
-__all__ = ['SignLanguageDetector', 'TTSManager']
\ No newline at end of file
+__all__ = ['SignLanguageDetector', 'TTSManager']
+
+def __getattr__(name):
+    # Imported lazily so headless tools don't pay for TensorFlow or pyttsx3
+    if name in _EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module 'core' has no attribute {name!r}")
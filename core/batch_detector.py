@@ -0,0 +1,215 @@
+# core/batch_detector.py
+import os
+import csv
+import json
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from core.decision import DECISION_KEYS, Transcript
+from utils.frame_sources import collect_sources, open_source
+from utils.output_paths import output_paths
+
+logger = logging.getLogger(__name__)
+
+FRAME_FIELDS = ["source", "frame", "t", "hand", "prediction", "confidence", "letter"]
+
+_worker_classifier = None
+_worker_settings = None
+
+
+def _init_worker(model_path, class_names_path, settings):
+    # Each worker process loads its own interpreter once and keeps it for every file
+    global _worker_classifier, _worker_settings
+    from core.classifier import SignClassifier
+
+    # Workers already run in parallel, so one interpreter each is enough
+    _worker_classifier = SignClassifier(model_path, class_names_path, pool_size=1)
+    _worker_settings = {key: settings[key] for key in DECISION_KEYS if key in settings}
+
+
+def _new_detector():
+    from core.detector import SignLanguageDetector
+
+    detector = SignLanguageDetector(classifier=_worker_classifier)
+    detector.set_debug_mode(False)
+    detector.apply_settings(_worker_settings)
+    return detector
+
+
+def _record_writer(f, output_format):
+    if output_format == "csv":
+        writer = csv.DictWriter(f, fieldnames=FRAME_FIELDS)
+        writer.writeheader()
+        return writer.writerow
+    return lambda record: f.write(json.dumps(record) + "\n")
+
+
+def _detect_source(task):
+    source_index, spec, out_path, output_format, fps, word_gap = task
+    # A fresh detector per file, so neither hand tracking nor decisions carry over from the previous one
+    detector = _new_detector()
+    transcript = Transcript(word_gap=word_gap)
+    frames = 0
+    error = None
+
+    start_time = time.perf_counter()
+    try:
+        # Records go straight to the output file instead of back to the parent
+        with open(out_path, "w", newline="") as f, open_source(spec, fps=fps) as source:
+            write = _record_writer(f, output_format)
+            for frame_index, (frame, timestamp) in enumerate(source):
+                _, landmarks, prediction, confidence = detector.process_frame(frame, timestamp, draw=False)
+                hand = bool(landmarks)
+                letter = transcript.update(prediction, timestamp, hand)
+                write({
+                    "source": spec,
+                    "frame": frame_index,
+                    "t": round(timestamp, 4),
+                    "hand": hand,
+                    "prediction": str(prediction) if prediction is not None else None,
+                    "confidence": round(confidence, 4),
+                    "letter": letter,
+                })
+                frames += 1
+    except Exception as e:
+        error = str(e)
+    finally:
+        detector.hand_detector.release()
+
+    return source_index, frames, transcript.result(), time.perf_counter() - start_time, error
+
+
+class BatchDetector:
+    """
+    Runs the sign detector over video files and image folders with a pool
+    of processes
+
+    Frames of one source are processed in order by one worker, since the
+    decision depends on previous frames; sources are spread over workers.
+    """
+
+    def __init__(self, model_path="./models/sign_language_model.tflite",
+                 class_names_path="./models/class_names.npy", settings=None, workers=None,
+                 fps=30.0, word_gap=0.5, output_dir=None, output_format="jsonl"):
+        self.model_path = model_path
+        self.class_names_path = class_names_path
+        self.settings = settings or {}
+        self.workers = workers or os.cpu_count() or 1
+        self.fps = fps
+        self.word_gap = word_gap
+        self.output_dir = output_dir
+        self.output_format = output_format
+
+    def detect(self, sources, on_result=None):
+        """
+        Detect signs in every source
+
+        Per-frame predictions of each source are written by its worker to
+        the path from utils.output_paths.output_paths().
+
+        Args:
+            sources: List of video paths or image directories
+            on_result: Optional callback(spec, frames_path, transcript) called
+                as each source finishes, in completion order
+
+        Returns:
+            Tuple (transcripts, stats). transcripts maps each source to its
+            text, in the order of sources.
+        """
+        transcripts = {}
+        frames = 0
+        errors = 0
+        busy_seconds = 0.0
+        out_paths = output_paths(sources, self.output_dir, f".predictions.{self.output_format}")
+        tasks = [(i, spec, out_paths[i], self.output_format, self.fps, self.word_gap)
+                 for i, spec in enumerate(sources)]
+        workers = max(1, min(self.workers, len(tasks)))
+
+        start_time = time.perf_counter()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.model_path, self.class_names_path, self.settings)) as executor:
+            futures = [executor.submit(_detect_source, task) for task in tasks]
+            for future in as_completed(futures):
+                source_index, count, text, seconds, error = future.result()
+                spec = sources[source_index]
+                if error:
+                    errors += 1
+                    logger.error(f"{spec}: {error}")
+
+                frames += count
+                busy_seconds += seconds
+                transcripts[spec] = text
+                if on_result is not None:
+                    on_result(spec, out_paths[source_index], text)
+
+        transcripts = {spec: transcripts[spec] for spec in sources}
+        wall_time = time.perf_counter() - start_time
+
+        stats = {
+            "sources": len(sources),
+            "frames": frames,
+            "errors": errors,
+            "wall_seconds": wall_time,
+            "workers": workers,
+            "frames_per_second": frames / wall_time if wall_time > 0 else 0.0,
+            "frames_per_second_per_worker": frames / busy_seconds if busy_seconds > 0 else 0.0,
+        }
+
+        return transcripts, stats
+
+
+def write_transcripts(transcripts, out_path, output_format="jsonl"):
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+
+    with open(out_path, "w", newline="") as f:
+        if output_format == "csv":
+            writer = csv.writer(f)
+            writer.writerow(["source", "transcript"])
+            writer.writerows(transcripts.items())
+        else:
+            for spec, text in transcripts.items():
+                f.write(json.dumps({"source": spec, "transcript": text}) + "\n")
+
+    return out_path
+
+
+def add_arguments(parser):
+    parser.add_argument("paths", nargs="+", help="Video files, image folders or directories of videos")
+    parser.add_argument("--model", default="./models/sign_language_model.tflite", help="TFLite model path")
+    parser.add_argument("--class-names", default="./models/class_names.npy", help="Class names file")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--fps", type=float, default=30.0,
+                        help="Frame rate of image folders and videos that do not report one")
+    parser.add_argument("--output-dir", default=None, help="Directory for results (default: next to the input)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl", help="Output format")
+
+
+def run(args):
+    sources = collect_sources(args.paths)
+    if not sources:
+        print("No videos or image folders found")
+        return 1
+
+    # Same decision settings as the app
+    from utils.settings_service import get_settings_service
+    settings = get_settings_service().get_all()
+    settings["record_landmarks"] = False
+
+    detector = BatchDetector(args.model, args.class_names, settings, workers=args.workers, fps=args.fps,
+                             output_dir=args.output_dir, output_format=args.format)
+
+    def on_result(spec, out_path, text):
+        print(f"Wrote {out_path}: {text}")
+
+    transcripts, stats = detector.detect(sources, on_result)
+
+    out_path = write_transcripts(transcripts, os.path.join(args.output_dir or ".", f"transcripts.{args.format}"),
+                                 args.format)
+    print(f"Wrote {out_path}")
+
+    print(f"Processed {stats['frames']} frames from {stats['sources']} sources in {stats['wall_seconds']:.1f}s "
+          f"with {stats['workers']} workers ({stats['frames_per_second']:.1f} frames/s, "
+          f"{stats['frames_per_second_per_worker']:.1f} per worker)")
+
+    return 0 if stats["errors"] == 0 else 1
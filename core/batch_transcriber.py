@@ -0,0 +1,277 @@
+# core/batch_transcriber.py
+import os
+import json
+import time
+import wave
+import logging
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+import speech_recognition as sr
+from core.speech_recognizer import (get_recognizer_backend, VoskRecognizerBackend, SphinxRecognizerBackend,
+                                    vosk, DEFAULT_VOSK_MODEL_PATH)
+from utils.vad import segment_wav_file, SAMPLE_WIDTH
+from utils.output_paths import output_paths
+
+logger = logging.getLogger(__name__)
+
+_worker_backend = None
+
+
+def collect_wav_files(paths):
+    """
+    Expand files and directories into a sorted list of WAV files
+
+    Args:
+        paths: List of file or directory paths
+
+    Returns:
+        List of WAV file paths
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in names if name.lower().endswith(".wav"))
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            logger.warning(f"Skipping missing path: {path}")
+    return sorted(files)
+
+
+def format_timestamp(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+    if hours:
+        return f"{hours:d}:{minutes:02d}:{seconds:05.2f}"
+    return f"{minutes:02d}:{seconds:05.2f}"
+
+
+def _init_worker(backend_name, backend_options):
+    # Each worker process loads its recognizer once and keeps it for every segment
+    global _worker_backend
+    _worker_backend = get_recognizer_backend(backend_name, **backend_options)
+    _worker_backend.load()
+
+
+def _transcribe_segment(task):
+    file_index, start, end, pcm, sample_rate = task
+    audio = sr.AudioData(pcm, sample_rate, SAMPLE_WIDTH)
+
+    try:
+        result = _worker_backend.recognize(audio)
+        return file_index, start, end, result.text, result.latency, None
+    except Exception as e:
+        return file_index, start, end, "", 0.0, str(e)
+
+
+class BatchTranscriber:
+    """
+    Transcribes recorded WAV files with a pool of recognizer processes
+
+    Files are cut into speech segments with the voice activity segmenter
+    and the segments of all files are transcribed in parallel. At most
+    max_pending segments per worker are queued at a time, so the audio of
+    a large batch is never held in memory all at once.
+
+    Args:
+        backend_name: "vosk" or "sphinx", defaults to Vosk when its model exists
+        backend_options: Backend specific options
+        workers: Number of worker processes
+        max_pending: Segments queued per worker
+        mp_context: Optional multiprocessing context for the worker pool
+    """
+
+    def __init__(self, backend_name=None, backend_options=None, workers=None, max_pending=4, mp_context=None):
+        self.backend_options = backend_options or {}
+
+        if backend_name is None:
+            # Vosk only when its model is there too; otherwise every worker would fail to load it
+            model_path = self.backend_options.get("model_path", DEFAULT_VOSK_MODEL_PATH)
+            if vosk is not None and os.path.isdir(model_path):
+                backend_name = VoskRecognizerBackend.name
+            else:
+                backend_name = SphinxRecognizerBackend.name
+
+        self.backend_name = backend_name
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max(1, max_pending)
+        self.mp_context = mp_context
+
+    def check_backend(self):
+        """
+        Load the backend once in this process so a missing engine or model
+        is reported before any worker starts
+
+        Raises:
+            Whatever the backend raises while loading
+        """
+        get_recognizer_backend(self.backend_name, **self.backend_options).load()
+
+    def _segment_tasks(self, files, unreadable):
+        for file_index, path in enumerate(files):
+            try:
+                segments = segment_wav_file(path)
+            except Exception as e:
+                logger.error(f"Could not read {path}: {e}")
+                unreadable.add(file_index)
+                continue
+
+            for segment in segments:
+                yield file_index, segment.start, segment.end, segment.pcm, segment.sample_rate
+
+    def transcribe(self, files):
+        """
+        Transcribe WAV files
+
+        Args:
+            files: List of WAV file paths
+
+        Returns:
+            Tuple (transcripts, stats). transcripts maps each file path to a
+            list of {"start", "end", "text"} entries in time order. Files
+            that could not be read or whose segments all failed are left
+            out and listed in stats["failed_files"].
+
+        Raises:
+            RuntimeError: The worker pool could not be started or died
+        """
+        entries = {path: [] for path in files}
+        audio_seconds = sum(_wav_seconds(path) for path in files)
+        file_segments = [0] * len(files)
+        file_errors = [0] * len(files)
+        unreadable = set()
+
+        def collect(future):
+            file_index, start, end, text, latency, error = future.result()
+            file_segments[file_index] += 1
+            if error:
+                file_errors[file_index] += 1
+                logger.error(f"{files[file_index]} [{format_timestamp(start)}]: {error}")
+            elif text:
+                entries[files[file_index]].append({"start": start, "end": end, "text": text})
+
+        start_time = time.perf_counter()
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=self.mp_context, initializer=_init_worker,
+                                     initargs=(self.backend_name, self.backend_options)) as executor:
+                pending = set()
+                for task in self._segment_tasks(files, unreadable):
+                    pending.add(executor.submit(_transcribe_segment, task))
+                    if len(pending) >= self.workers * self.max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(future)
+
+                for future in wait(pending).done:
+                    collect(future)
+        except BrokenProcessPool as e:
+            raise RuntimeError(f"{self.backend_name} worker pool failed: {e}") from e
+
+        wall_time = time.perf_counter() - start_time
+
+        failed = [path for i, path in enumerate(files)
+                  if i in unreadable or (file_segments[i] and file_errors[i] == file_segments[i])]
+        transcripts = {path: sorted(entries[path], key=lambda entry: entry["start"])
+                       for path in files if path not in failed}
+
+        stats = {
+            "files": len(files),
+            "failed_files": failed,
+            "segments": sum(file_segments),
+            "transcribed_segments": sum(len(entries) for entries in transcripts.values()),
+            "errors": sum(file_errors),
+            "audio_seconds": audio_seconds,
+            "wall_seconds": wall_time,
+            "workers": self.workers,
+            "backend": self.backend_name,
+            # Below 1.0 means faster than real time
+            "real_time_factor": wall_time / audio_seconds if audio_seconds > 0 else 0.0,
+        }
+
+        return transcripts, stats
+
+
+def _wav_seconds(path):
+    try:
+        with wave.open(path, "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except Exception:
+        return 0.0
+
+
+def write_transcripts(transcripts, output_dir=None, output_format="txt"):
+    """
+    Write transcripts next to the audio or into output_dir
+
+    Args:
+        transcripts: Mapping of WAV path to transcript entries
+        output_dir: Optional output directory
+        output_format: "txt" for timestamped lines or "json"
+
+    Returns:
+        List of written file paths
+    """
+    written = []
+    paths = list(transcripts)
+
+    for path, out_path in zip(paths, output_paths(paths, output_dir, f".{output_format}")):
+        entries = transcripts[path]
+        with open(out_path, "w") as f:
+            if output_format == "json":
+                json.dump({"audio": path, "segments": entries}, f, indent=2)
+            else:
+                for entry in entries:
+                    f.write(f"[{format_timestamp(entry['start'])} - {format_timestamp(entry['end'])}] "
+                            f"{entry['text']}\n")
+
+        written.append(out_path)
+
+    return written
+
+
+def add_arguments(parser):
+    parser.add_argument("paths", nargs="+", help="WAV files or directories of WAV files")
+    parser.add_argument("--backend", choices=["vosk", "sphinx"], default=None,
+                        help="Local recognizer to use (default: vosk if its model is present, else sphinx)")
+    parser.add_argument("--model", default=None, help="Path to the Vosk model directory")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--output-dir", default=None, help="Directory for transcripts (default: next to audio)")
+    parser.add_argument("--format", choices=["txt", "json"], default="txt", help="Transcript format")
+
+
+def run(args):
+    files = collect_wav_files(args.paths)
+    if not files:
+        print("No WAV files found")
+        return 1
+
+    options = {}
+    if args.model:
+        options["model_path"] = args.model
+
+    transcriber = BatchTranscriber(args.backend, options, workers=args.workers)
+    try:
+        transcriber.check_backend()
+    except Exception as e:
+        print(f"Could not load the {transcriber.backend_name} recognizer: {e}")
+        return 1
+
+    try:
+        transcripts, stats = transcriber.transcribe(files)
+    except RuntimeError as e:
+        print(f"Transcription failed: {e}")
+        return 1
+
+    for out_path in write_transcripts(transcripts, args.output_dir, args.format):
+        print(f"Wrote {out_path}")
+    for path in stats["failed_files"]:
+        print(f"No transcript for {path}: every segment failed")
+
+    print(f"Transcribed {stats['transcribed_segments']} of {stats['segments']} speech segments, "
+          f"{stats['audio_seconds']:.1f}s of audio from {stats['files']} files "
+          f"in {stats['wall_seconds']:.1f}s with {stats['workers']} workers "
+          f"(real-time factor {stats['real_time_factor']:.3f})")
+
+    return 0 if stats["errors"] == 0 and not stats["failed_files"] else 1
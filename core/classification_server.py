@@ -0,0 +1,433 @@
+# core/classification_server.py
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from core.decision import DEFAULT_CONFIG, make_decision_state
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = "/tmp/hearme.sock"
+DEFAULT_PORT = 8765
+# asyncio has no Unix socket server on Windows
+UNIX_SOCKETS = sys.platform != "win32"
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+
+class Histogram:
+    """Counts of values per bucket, with an overflow bucket"""
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def add(self, value):
+        index = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.total += 1
+        self.sum += value
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th value"""
+        if self.total == 0:
+            return None
+        target = q * self.total
+        seen = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def to_dict(self):
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.total,
+            "mean": round(self.sum / self.total, 3) if self.total else None,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+        }
+
+
+class MicroBatcher:
+    """
+    Collects classification requests and runs them as one batch
+
+    The first request of a batch waits at most window_ms for others to
+    arrive, so a lone client pays at most that much extra latency while
+    many clients share one invoke(). Batches run on up to `workers`
+    background threads; classify_batch must be thread-safe when workers
+    is more than one.
+
+    Args:
+        classify_batch: Function mapping a list of landmark arrays to an
+            (n, classes) array
+        window_ms: Longest time to wait for a batch to fill
+        max_batch: Largest batch
+        workers: Batches classified at the same time
+    """
+
+    def __init__(self, classify_batch, window_ms=2.0, max_batch=32, workers=1):
+        self.classify_batch = classify_batch
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+        self.queue = asyncio.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="classifier")
+        self.slots = asyncio.Semaphore(workers)
+        self.batch_sizes = Histogram(BATCH_BUCKETS)
+        self.invoke_ms = Histogram(LATENCY_BUCKETS_MS)
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.executor.shutdown(wait=False)
+
+    async def classify(self, landmarks):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((landmarks, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Collect the next batch only once a worker is free to run it
+            await self.slots.acquire()
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            loop.create_task(self._invoke(batch))
+
+    async def _invoke(self, batch):
+        start = time.perf_counter()
+        try:
+            outputs = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.classify_batch, [landmarks for landmarks, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.slots.release()
+
+        self.invoke_ms.add((time.perf_counter() - start) * 1000.0)
+        self.batch_sizes.add(len(batch))
+        for (_, future), output in zip(batch, outputs):
+            if not future.done():
+                future.set_result(output)
+
+
+class ClassificationServer:
+    """
+    Classifies landmarks sent by many clients over a local socket
+
+    Clients send JSON lines and get one JSON line back per request:
+
+        {"session": "kiosk-1", "t": 12.03, "landmarks": [[x, y], ...], "handedness": "Right"}
+        -> {"session": "kiosk-1", "prediction": "A", "confidence": 0.93, "raw": "A", "latency_ms": 2.1}
+        {"session": "kiosk-1", "t": 12.06, "hand": false}   hand lost
+        {"type": "close", "session": "kiosk-1"}             forget the session
+        {"type": "stats"}                                   histograms and counters
+
+    Every session has its own landmark filter and stabilizer, so clients
+    never affect each other's decisions. Sessions idle for session_ttl
+    seconds are dropped.
+
+    Args:
+        classifier: SignClassifier, or any object with class_names and
+            classify_batch(landmarks_list)
+        config: Decision settings, defaults to core.decision.DEFAULT_CONFIG
+        window_ms: Micro-batching window
+        max_batch: Largest batch
+        session_ttl: Seconds before an idle session is dropped
+    """
+
+    def __init__(self, classifier, config=None, window_ms=2.0, max_batch=32, session_ttl=60.0):
+        self.classifier = classifier
+        self.config = {**DEFAULT_CONFIG, **(config or {})}
+        # A SignClassifier can run one batch per pooled interpreter
+        self.batcher = MicroBatcher(classifier.classify_batch, window_ms, max_batch,
+                                    workers=getattr(classifier, "pool_size", 1))
+        self.session_ttl = session_ttl
+        self.sessions = {}
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.requests = 0
+        self.errors = 0
+        self.clients = 0
+        self.server = None
+
+    def _session(self, session_id):
+        entry = self.sessions.get(session_id)
+        if entry is None:
+            entry = [make_decision_state(list(self.classifier.class_names), self.config), 0.0]
+            self.sessions[session_id] = entry
+        entry[1] = time.monotonic()
+        return entry[0]
+
+    def _expire_sessions(self):
+        cutoff = time.monotonic() - self.session_ttl
+        for session_id in [s for s, (_, last_seen) in self.sessions.items() if last_seen < cutoff]:
+            del self.sessions[session_id]
+
+    def get_stats(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "clients": self.clients,
+            "sessions": len(self.sessions),
+            "latency_ms": self.latency_ms.to_dict(),
+            "batch_size": self.batcher.batch_sizes.to_dict(),
+            "invoke_ms": self.batcher.invoke_ms.to_dict(),
+        }
+
+    async def handle_request(self, request):
+        kind = request.get("type", "classify")
+
+        if kind == "stats":
+            return self.get_stats()
+
+        session_id = str(request.get("session", "default"))
+
+        if kind == "close":
+            self.sessions.pop(session_id, None)
+            return {"session": session_id, "closed": True}
+
+        start = time.perf_counter()
+        self.requests += 1
+        decision = self._session(session_id)
+        timestamp = float(request.get("t", time.monotonic()))
+
+        landmarks = request.get("landmarks")
+        if request.get("hand", True) is False or not landmarks:
+            decision.hand_lost()
+            return {"session": session_id, "prediction": None, "confidence": 0.0, "hand": False}
+
+        hand = request.get("handedness") or 0
+        smoothed = decision.smooth(np.asarray(landmarks, dtype=np.float32), timestamp, hand)
+        output = np.asarray(await self.batcher.classify(smoothed))
+        prediction, confidence = decision.update(output, timestamp)
+
+        latency = (time.perf_counter() - start) * 1000.0
+        self.latency_ms.add(latency)
+
+        raw_index = int(np.argmax(output))
+        return {
+            "session": session_id,
+            "prediction": str(prediction) if prediction is not None else None,
+            "confidence": round(confidence, 4),
+            "raw": str(self.classifier.class_names[raw_index]),
+            "latency_ms": round(latency, 3),
+        }
+
+    async def _handle_client(self, reader, writer):
+        self.clients += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self.handle_request(json.loads(line))
+                except Exception as e:
+                    self.errors += 1
+                    response = {"error": str(e)}
+                writer.write((json.dumps(response) + "\n").encode("utf-8"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    async def _expire_loop(self):
+        while True:
+            await asyncio.sleep(min(self.session_ttl, 10.0))
+            self._expire_sessions()
+
+    async def start(self, socket_path=None, host="127.0.0.1", port=None):
+        self.batcher.start()
+        port = _default_port(socket_path, port)
+        if port is not None:
+            self.server = await asyncio.start_server(self._handle_client, host, port)
+            address = f"{host}:{port}"
+        else:
+            socket_path = socket_path or DEFAULT_SOCKET
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            self.server = await asyncio.start_unix_server(self._handle_client, socket_path)
+            address = socket_path
+        self._expire_task = asyncio.get_running_loop().create_task(self._expire_loop())
+        logger.info(f"Classification server listening on {address}")
+        return address
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self._expire_task.cancel()
+        await self.batcher.stop()
+
+
+def _default_port(socket_path, port):
+    # Without Unix sockets the server listens on TCP unless told otherwise
+    if port is None and socket_path is None and not UNIX_SOCKETS:
+        return DEFAULT_PORT
+    return port
+
+
+async def _open_connection(socket_path=None, host="127.0.0.1", port=None):
+    port = _default_port(socket_path, port)
+    if port is not None:
+        return await asyncio.open_connection(host, port)
+    return await asyncio.open_unix_connection(socket_path or DEFAULT_SOCKET)
+
+
+async def request(message, socket_path=None, host="127.0.0.1", port=None):
+    """Send one request on a new connection and return the response"""
+    reader, writer = await _open_connection(socket_path, host, port)
+    writer.write((json.dumps(message) + "\n").encode("utf-8"))
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+    return response
+
+
+async def load_test(clients=8, fps=30.0, duration=5.0, socket_path=None, host="127.0.0.1", port=None, seed=0):
+    """
+    Simulate kiosks streaming landmarks to a running server
+
+    Every client is one session sending a frame every 1/fps seconds and
+    waiting for the answer before the next frame.
+
+    Returns:
+        Dictionary with client-side latency percentiles, throughput and
+        the server's stats
+    """
+    rng = np.random.default_rng(seed)
+    latencies = []
+
+    async def client(index):
+        reader, writer = await _open_connection(socket_path, host, port)
+        base = rng.uniform(100, 500, size=(21, 2))
+        session = f"load-{index}"
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        frame = 0
+
+        while loop.time() - start < duration:
+            points = base + rng.normal(0, 2.0, size=base.shape)
+            message = {"session": session, "t": frame / fps, "landmarks": points.round(1).tolist(), "handedness": "Right"}
+
+            sent = time.perf_counter()
+            writer.write((json.dumps(message) + "\n").encode("utf-8"))
+            await writer.drain()
+            await reader.readline()
+            latencies.append((time.perf_counter() - sent) * 1000.0)
+
+            frame += 1
+            next_frame = start + frame / fps
+            await asyncio.sleep(max(0.0, next_frame - loop.time()))
+
+        writer.write((json.dumps({"type": "close", "session": session}) + "\n").encode("utf-8"))
+        await writer.drain()
+        await reader.readline()
+        writer.close()
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    wall_time = time.perf_counter() - wall_start
+
+    latencies.sort()
+
+    def percentile(q):
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))], 3) if latencies else None
+
+    return {
+        "clients": clients,
+        "fps_per_client": fps,
+        "requests": len(latencies),
+        "requests_per_second": round(len(latencies) / wall_time, 1) if wall_time > 0 else 0.0,
+        "latency_ms_p50": percentile(0.5),
+        "latency_ms_p99": percentile(0.99),
+        "server": await request({"type": "stats"}, socket_path, host, port),
+    }
+
+
+async def serve(classifier, config, args):
+    server = ClassificationServer(classifier, config, window_ms=args.window_ms, max_batch=args.max_batch)
+    address = await server.start(args.socket, port=args.port)
+    print(f"Listening on {address}", file=sys.stderr)
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        print(json.dumps(server.get_stats(), indent=2), file=sys.stderr)
+
+
+def add_arguments(parser):
+    parser.add_argument("--socket", default=None, help=f"Unix socket path (default: {DEFAULT_SOCKET})")
+    parser.add_argument("--port", type=int, default=None,
+                        help=f"Listen on this TCP port on localhost instead (default on Windows: {DEFAULT_PORT})")
+    parser.add_argument("--model", default="./models/sign_language_model.tflite", help="TFLite model path")
+    parser.add_argument("--class-names", default="./models/class_names.npy", help="Class names file")
+    parser.add_argument("--window-ms", type=float, default=2.0, help="Micro-batching window in ms")
+    parser.add_argument("--max-batch", type=int, default=32, help="Largest batch per invoke")
+    parser.add_argument("--interpreters", type=int, default=None,
+                        help="Interpreters classifying batches in parallel (default: up to 4)")
+    parser.add_argument("--load-test", action="store_true", help="Run the load generator against a running server")
+    parser.add_argument("--clients", type=int, default=8, help="Load test: number of simulated kiosks")
+    parser.add_argument("--fps", type=float, default=30.0, help="Load test: frames per second per kiosk")
+    parser.add_argument("--duration", type=float, default=5.0, help="Load test: seconds to run")
+
+
+def run(args):
+    if args.load_test:
+        report = asyncio.run(load_test(args.clients, args.fps, args.duration, args.socket, port=args.port))
+        print(json.dumps(report, indent=2))
+        return 0
+
+    from core.classifier import SignClassifier
+    from utils.settings_service import get_settings_service
+
+    classifier = SignClassifier(args.model, args.class_names, pool_size=args.interpreters)
+
+    settings = get_settings_service().get_all()
+    config = {key: settings[key] for key in DEFAULT_CONFIG if key in settings}
+
+    try:
+        asyncio.run(serve(classifier, config, args))
+    except KeyboardInterrupt:
+        pass
+    return 0
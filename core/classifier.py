@@ -0,0 +1,140 @@
+# core/classifier.py
+import os
+import queue
+import threading
+import numpy as np
+import tensorflow as tf
+
+DEFAULT_MODEL_PATH = "./models/sign_language_model.tflite"
+DEFAULT_CLASS_NAMES_PATH = "./models/class_names.npy"
+
+
+class _PooledInterpreter:
+    """One TFLite interpreter with its tensor details, used by one thread at a time"""
+
+    def __init__(self, model_path):
+        self.interpreter = tf.lite.Interpreter(model_path=model_path)
+        self.interpreter.allocate_tensors()
+        self._read_details()
+
+    def _read_details(self):
+        self.input_details = self.interpreter.get_input_details()
+        self.output_details = self.interpreter.get_output_details()
+
+    @property
+    def batch_size(self):
+        return int(self.input_details[0]['shape'][0])
+
+    def resize(self, batch_size):
+        if self.batch_size != batch_size:
+            features = self.input_details[0]['shape'][1]
+            self.interpreter.resize_tensor_input(self.input_details[0]['index'], [batch_size, features])
+            self.interpreter.allocate_tensors()
+            self._read_details()
+
+    def run(self, input_data):
+        self.resize(len(input_data))
+        self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self.output_details[0]['index'])
+
+
+class SignClassifier:
+    """
+    Thread-safe, stateless landmark classifier
+
+    Holds the loaded model as a small pool of interpreters. A call borrows
+    one interpreter and returns it when done, so up to pool_size threads
+    classify at once and further callers wait. Nothing depends on earlier
+    calls; per-stream state lives in DecisionState.
+
+    Args:
+        model_path: TFLite model path
+        class_names_path: Class names .npy path
+        pool_size: Number of interpreters, defaults to min(4, CPU count)
+    """
+
+    def __init__(self, model_path=DEFAULT_MODEL_PATH, class_names_path=DEFAULT_CLASS_NAMES_PATH, pool_size=None):
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+
+        if not os.path.exists(class_names_path):
+            raise FileNotFoundError(f"Class names file not found: {class_names_path}")
+
+        print(f"Loading TFLite model from: {model_path}")
+        self.model_path = model_path
+        self.class_names = np.load(class_names_path, allow_pickle=True)
+        print(f"Loaded {len(self.class_names)} classes: {self.class_names}")
+
+        self.pool_size = pool_size or min(4, os.cpu_count() or 1)
+        self._pool = queue.Queue()
+        for _ in range(self.pool_size):
+            self._pool.put(_PooledInterpreter(model_path))
+
+        first = self._pool.queue[0]
+        self.features = int(first.input_details[0]['shape'][1])
+        print(f"Model input shape: {first.input_details[0]['shape']}")
+        print(f"Model output shape: {first.output_details[0]['shape']}")
+
+    def prepare(self, landmarks):
+        """Flatten and scale one hand's landmarks to the model's input length"""
+        landmarks_flat = np.asarray(landmarks, dtype=np.float32).flatten() / 640.0
+
+        if len(landmarks_flat) != self.features:
+            print(f"Warning: Input shape mismatch. Expected {self.features}, got {len(landmarks_flat)}")
+            fitted = np.zeros(self.features, dtype=np.float32)
+            fitted[:min(self.features, len(landmarks_flat))] = landmarks_flat[:self.features]
+            landmarks_flat = fitted
+
+        return landmarks_flat
+
+    def _run(self, input_data):
+        interpreter = self._pool.get()
+        try:
+            return interpreter.run(input_data)
+        finally:
+            self._pool.put(interpreter)
+
+    def classify(self, landmarks):
+        """
+        Classify one hand
+
+        Returns:
+            Model output of shape (1, classes)
+        """
+        return self._run(np.expand_dims(self.prepare(landmarks), axis=0))
+
+    def classify_batch(self, landmarks_list):
+        """
+        Classify many hands in one invoke
+
+        Batches are padded to a power of two so each interpreter's input
+        tensor is only reallocated for a few sizes.
+
+        Returns:
+            Model output of shape (len(landmarks_list), classes)
+        """
+        count = len(landmarks_list)
+        input_data = np.zeros((1 << max(0, count - 1).bit_length(), self.features), dtype=np.float32)
+        for i, landmarks in enumerate(landmarks_list):
+            input_data[i] = self.prepare(landmarks)
+
+        return self._run(input_data)[:count]
+
+
+_classifiers = {}
+_classifiers_lock = threading.Lock()
+
+
+def get_shared_classifier(model_path=DEFAULT_MODEL_PATH, class_names_path=DEFAULT_CLASS_NAMES_PATH):
+    """
+    Get the process-wide classifier for a model, loading it on first use
+
+    Returns:
+        SignClassifier
+    """
+    key = (os.path.abspath(model_path), os.path.abspath(class_names_path))
+    with _classifiers_lock:
+        if key not in _classifiers:
+            _classifiers[key] = SignClassifier(model_path, class_names_path)
+        return _classifiers[key]
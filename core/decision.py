@@ -0,0 +1,129 @@
+# core/decision.py
+import numpy as np
+from core.stabilizer import create_stabilizer
+from utils.landmark_filter import LandmarkSmoother
+from utils.settings_service import DEFAULT_SETTINGS
+
+DECISION_KEYS = (
+    "confidence_threshold",
+    "stabilizer",
+    "stabilization_frames",
+    "stabilization_window_ms",
+    "stabilization_min_samples",
+    "landmark_filter",
+)
+
+# The app's defaults, so replays and headless runs decide like the app
+DEFAULT_CONFIG = {key: DEFAULT_SETTINGS[key] for key in DECISION_KEYS}
+DEFAULT_CONFIDENCE_THRESHOLD = DEFAULT_CONFIG["confidence_threshold"]
+
+
+class DecisionState:
+    """
+    Decision logic between the classifier and the user, for one stream
+
+    Holds everything that depends on previous frames: the landmark filter
+    state, the stabilizer and the last emitted letter. It does not touch
+    the model, so recorded classifier outputs can be replayed through it.
+    """
+
+    def __init__(self, class_names, confidence_threshold=DEFAULT_CONFIDENCE_THRESHOLD,
+                 stabilizer=None, landmark_filter="one_euro"):
+        self.class_names = class_names
+        self.confidence_threshold = confidence_threshold
+        self.stabilizer = stabilizer if stabilizer is not None else create_stabilizer(
+            "weighted", window=5, window_seconds=0.15, min_samples=3
+        )
+        self.landmark_smoother = LandmarkSmoother(landmark_filter)
+        self.last_prediction = None
+
+    def smooth(self, landmarks, timestamp, hand=0):
+        """Filter landmarks of the tracked hand, dropping state of other hands"""
+        self.landmark_smoother.keep_only((hand,))
+        return self.landmark_smoother.smooth(landmarks, timestamp, hand)
+
+    def update(self, probabilities, timestamp):
+        """
+        Feed one frame of classifier output
+
+        Args:
+            probabilities: Class probabilities for the frame
+            timestamp: Frame time in seconds
+
+        Returns:
+            Tuple (prediction or None, confidence of this frame)
+        """
+        probabilities = np.asarray(probabilities)
+        confidence = float(np.max(probabilities))
+        predicted_idx = int(np.argmax(probabilities))
+
+        # Only confident frames vote; a low-confidence frame keeps the current decision
+        if confidence > self.confidence_threshold:
+            decision = self.stabilizer.update(predicted_idx, confidence, timestamp)
+        else:
+            decision = self.stabilizer.current
+
+        prediction = None
+        if decision is not None:
+            prediction = self.class_names[decision]
+            self.last_prediction = prediction
+
+        return prediction, confidence
+
+    def hand_lost(self):
+        self.landmark_smoother.reset()
+        self.stabilizer.reset()
+        self.last_prediction = None
+
+
+def make_decision_state(class_names, config):
+    """Build a DecisionState the same way the detector does"""
+    window_ms = config.get("stabilization_window_ms")
+    stabilizer = create_stabilizer(
+        config["stabilizer"],
+        window=config["stabilization_frames"],
+        window_seconds=window_ms / 1000.0 if window_ms is not None else None,
+        min_samples=config["stabilization_min_samples"] if window_ms is not None else None,
+    )
+    return DecisionState(class_names, confidence_threshold=config["confidence_threshold"],
+                         stabilizer=stabilizer, landmark_filter=config.get("landmark_filter"))
+
+
+class Transcript:
+    """
+    Builds text from per-frame decisions
+
+    A letter is emitted when the shown prediction changes to it, the same
+    way the detection window shows it. A hand absence of at least word_gap
+    seconds ends the word.
+    """
+
+    def __init__(self, word_gap=0.5):
+        self.word_gap = word_gap
+        self.text = ""
+        self.shown = None
+        self._lost_since = None
+
+    def update(self, prediction, timestamp, hand=True):
+        """
+        Returns:
+            The letter emitted by this frame, or None
+        """
+        if not hand:
+            self.shown = None
+            if self._lost_since is None:
+                self._lost_since = timestamp
+            elif timestamp - self._lost_since >= self.word_gap and self.text and not self.text.endswith(" "):
+                self.text += " "
+            return None
+
+        self._lost_since = None
+        previous, self.shown = self.shown, prediction
+        if prediction is None or prediction == previous:
+            return None
+
+        self.text += str(prediction)
+        return str(prediction)
+
+    def result(self):
+        return self.text.strip()
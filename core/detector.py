@@ -1,105 +1,152 @@
 import cv2
 import numpy as np
-import tensorflow as tf
 from utils.hand_detector import HandDetector
-import os
+from utils.landmark_filter import LandmarkSmoother
+from core.stabilizer import create_stabilizer
+from core.decision import DecisionState, DEFAULT_CONFIG
+from core.landmark_recorder import LandmarkRecorder, new_recording_path
+from core.classifier import get_shared_classifier
+import threading
+import time
 
 class SignLanguageDetector:
     def __init__(self, model_path="./models/sign_language_model.tflite",
-                 class_names_path="./models/class_names.npy"):
+                 class_names_path="./models/class_names.npy", classifier=None):
         
-        if not os.path.exists(model_path):
-            raise FileNotFoundError(f"Model file not found: {model_path}")
-        
-        if not os.path.exists(class_names_path):
-            raise FileNotFoundError(f"Class names file not found: {class_names_path}")
-        
-        print(f"Loading TFLite model from: {model_path}")
-        self.interpreter = tf.lite.Interpreter(model_path=model_path)
-        self.interpreter.allocate_tensors()
-        
-        self.input_details = self.interpreter.get_input_details()
-        self.output_details = self.interpreter.get_output_details()
-        
-        print(f"Model input shape: {self.input_details[0]['shape']}")
-        print(f"Model output shape: {self.output_details[0]['shape']}")
-        
-        self.class_names = np.load(class_names_path, allow_pickle=True)
-        print(f"Loaded {len(self.class_names)} classes: {self.class_names}")
+        # The model is shared by every detector in the process; everything
+        # below it is per-stream state
+        self.classifier = classifier or get_shared_classifier(model_path, class_names_path)
+        self.class_names = self.classifier.class_names
         
         self.hand_detector = HandDetector(static_image_mode=False, max_num_hands=1, min_detection_confidence=0.5)
         
         self.current_phrase = ""
-        self.last_prediction = None
         self.last_prediction_time = 0
         
-        self.confidence_threshold = 0.6  
+        self.confidence_threshold = DEFAULT_CONFIG["confidence_threshold"]
         self.stabilization_frames = 5    
-        self.prediction_history = []
+        # Stabilize over time rather than frames so latency does not depend on FPS
+        self.stabilization_window = 0.15
+        self.min_stabilization_samples = 3
+        
+        # Landmarks are smoothed per hand before classification to remove jitter
+        self.decision = DecisionState(
+            self.class_names,
+            confidence_threshold=self.confidence_threshold,
+            stabilizer=create_stabilizer("weighted", **self._stabilizer_options()),
+            landmark_filter="one_euro"
+        )
+        self.frame_count = 0
+        self.recorder = None
+        # Settings and recording change on the settings watcher thread while
+        # frames arrive on the camera thread
+        self._lock = threading.RLock()
         
         self.debug_mode = True
     
-    def process_frame(self, frame):
+    @property
+    def last_prediction(self):
+        
+        return self.decision.last_prediction
+    
+    @last_prediction.setter
+    def last_prediction(self, value):
+        
+        self.decision.last_prediction = value
+    
+    def process_frame(self, frame, timestamp=None, draw=True, info=None):
+        
+        # Each frame sees one configuration; apply_settings waits for it to finish
+        with self._lock:
+            return self._process_frame(frame, timestamp, draw, info)
+    
+    def _process_frame(self, frame, timestamp, draw, info):
         
-        frame_with_hands = self.hand_detector.find_hands(frame.copy(), draw=True)
+        # Headless callers pass media timestamps and skip drawing the overlay
+        stage_start = time.perf_counter()
+        if draw:
+            frame_with_hands = self.hand_detector.find_hands(frame.copy(), draw=True)
+        else:
+            frame_with_hands = self.hand_detector.find_hands(frame, draw=False)
         landmarks = self.hand_detector.get_landmarks(frame)
+        landmarks_done = time.perf_counter()
         
         prediction = None
         confidence = 0.0
+        predictions = None
+        hand = None
+        if timestamp is None:
+            timestamp = time.monotonic()
         
         if landmarks and len(landmarks) > 0:
             
-            landmarks_flat = np.array(landmarks).flatten().astype(np.float32)
+            handedness = self.hand_detector.get_handedness()
+            hand = handedness[0] if handedness else 0
+            smoothed = self.decision.smooth(landmarks, timestamp, hand)
             
-            if self.debug_mode and len(self.prediction_history) % 30 == 0:
-                print(f"Raw landmarks shape: {landmarks_flat.shape}")
-                print(f"Landmarks range: [{landmarks_flat.min():.2f}, {landmarks_flat.max():.2f}]")
+            classify_start = time.perf_counter()
+            predictions = self.classify_landmarks(smoothed)
+            classify_done = time.perf_counter()
+            prediction, confidence = self.decision.update(predictions[0], timestamp)
             
-            landmarks_flat = landmarks_flat / 640.0
-            
-            input_shape = self.input_details[0]['shape']
-            input_data = np.expand_dims(landmarks_flat, axis=0)
-            
-            if input_data.shape[1] != input_shape[1]:
-                print(f"Warning: Input shape mismatch. Expected {input_shape[1]}, got {input_data.shape[1]}")
-                
-                if input_data.shape[1] > input_shape[1]:
-                    input_data = input_data[:, :input_shape[1]]
-                else:
-                    padding = np.zeros((1, input_shape[1] - input_data.shape[1]))
-                    input_data = np.concatenate([input_data, padding], axis=1)
-            
-            self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
-            self.interpreter.invoke()
-            
-            predictions = self.interpreter.get_tensor(self.output_details[0]['index'])
-            confidence = np.max(predictions[0])
-            predicted_idx = np.argmax(predictions[0])
-            
-            if confidence > self.confidence_threshold:
-                prediction = self.class_names[predicted_idx]
-                
-                self.prediction_history.append(prediction)
-                if len(self.prediction_history) > self.stabilization_frames:
-                    self.prediction_history.pop(0)
-                
-                if len(self.prediction_history) == self.stabilization_frames:
-                    if len(set(self.prediction_history)) == 1:  
-                        stabilized_prediction = self.prediction_history[0]
-                        
-                        if stabilized_prediction != self.last_prediction:
-                            self.last_prediction = stabilized_prediction
-                            return frame_with_hands, landmarks, stabilized_prediction, confidence
-                    else:
-                        
-                        return frame_with_hands, landmarks, None, confidence
+            if info is not None:
+                raw_index = int(np.argmax(predictions[0]))
+                info["raw_prediction"] = str(self.class_names[raw_index])
+                info["raw_confidence"] = float(predictions[0][raw_index])
+                info["handedness"] = hand or None
+                info["classify_ms"] = (classify_done - classify_start) * 1000.0
+                info["decision_ms"] = (time.perf_counter() - classify_done) * 1000.0
         
         if not landmarks:
-            self.prediction_history = []
-            self.last_prediction = None
+            self.decision.hand_lost()
+        
+        # Optional per-stage timings for headless callers
+        if info is not None:
+            info["landmarks_ms"] = (landmarks_done - stage_start) * 1000.0
+        
+        if self.recorder is not None:
+            self.recorder.record(
+                timestamp,
+                self.hand_detector.get_landmarks_3d(frame) if landmarks else None,
+                hand if hand != 0 else None,
+                predictions[0] if predictions is not None else None
+            )
         
         return frame_with_hands, landmarks, prediction, confidence
     
+    def classify_landmarks(self, landmarks):
+        
+        self.frame_count += 1
+        if self.debug_mode and self.frame_count % 30 == 1:
+            landmarks_flat = np.asarray(landmarks).flatten()
+            print(f"Raw landmarks shape: {landmarks_flat.shape}")
+            print(f"Landmarks range: [{landmarks_flat.min():.2f}, {landmarks_flat.max():.2f}]")
+        
+        return self.classifier.classify(landmarks)
+    
+    def classify_batch(self, landmarks_list):
+        
+        return self.classifier.classify_batch(landmarks_list)
+    
+    def new_session(self):
+        
+        # Shares the loaded model; hand tracking, decisions and the phrase are separate
+        session = SignLanguageDetector(classifier=self.classifier)
+        session.apply_settings(self.get_decision_settings())
+        session.set_debug_mode(self.debug_mode)
+        return session
+    
+    def get_decision_settings(self):
+        
+        return {
+            "confidence_threshold": self.confidence_threshold,
+            "stabilization_frames": self.stabilization_frames,
+            "stabilization_window_ms": self._window_ms(),
+            "stabilization_min_samples": self.min_stabilization_samples,
+            "stabilizer": self.decision.stabilizer.name,
+            "landmark_filter": self.decision.landmark_smoother.name,
+        }
+    
     def get_hand_crop(self, frame, landmarks):
         
         if not landmarks:
@@ -134,8 +181,7 @@ class SignLanguageDetector:
     def clear_phrase(self):
         
         self.current_phrase = ""
-        self.last_prediction = None
-        self.prediction_history = []
+        self.decision.hand_lost()
         return True
     
     def get_phrase(self):
@@ -145,6 +191,88 @@ class SignLanguageDetector:
     def set_confidence_threshold(self, threshold):
         
         self.confidence_threshold = max(0.0, min(1.0, threshold))
+        self.decision.confidence_threshold = self.confidence_threshold
+    
+    def set_stabilization_frames(self, frames):
+        
+        self.stabilization_frames = max(1, int(frames))
+        self.decision.stabilizer.configure(**self._stabilizer_options())
+    
+    def set_stabilization_window(self, seconds, min_samples=None):
+        
+        # None switches back to counting frames
+        self.stabilization_window = seconds
+        if min_samples is not None:
+            self.min_stabilization_samples = max(1, int(min_samples))
+        self.decision.stabilizer.configure(**self._stabilizer_options())
+    
+    def set_stabilizer(self, name):
+        
+        self.decision.stabilizer = create_stabilizer(name, **self._stabilizer_options())
+    
+    def _stabilizer_options(self):
+        
+        return {
+            "window": self.stabilization_frames,
+            "window_seconds": self.stabilization_window,
+            "min_samples": self.min_stabilization_samples if self.stabilization_window is not None else None,
+        }
+    
+    def apply_settings(self, settings):
+        
+        with self._lock:
+            self._apply_settings(settings)
+    
+    def _apply_settings(self, settings):
+        
+        # Called with changed settings, so only touch the keys that are present
+        if "confidence_threshold" in settings:
+            self.set_confidence_threshold(float(settings["confidence_threshold"]))
+        if "stabilization_frames" in settings:
+            self.set_stabilization_frames(settings["stabilization_frames"])
+        if "stabilization_window_ms" in settings or "stabilization_min_samples" in settings:
+            window_ms = settings.get("stabilization_window_ms", self._window_ms())
+            self.set_stabilization_window(
+                window_ms / 1000.0 if window_ms is not None else None,
+                settings.get("stabilization_min_samples")
+            )
+        if "stabilizer" in settings:
+            self.set_stabilizer(settings["stabilizer"])
+        if "landmark_filter" in settings:
+            self.set_landmark_filter(settings["landmark_filter"])
+        if "record_landmarks" in settings:
+            if settings["record_landmarks"]:
+                if self.recorder is None:
+                    self.start_recording()
+            else:
+                self.stop_recording()
+    
+    def set_landmark_filter(self, name, **options):
+        
+        # None disables smoothing
+        self.decision.landmark_smoother = LandmarkSmoother(name, **options)
+    
+    def start_recording(self, path=None, float16=False):
+        
+        path = path or new_recording_path()
+        recorder = LandmarkRecorder(path, len(self.class_names), self.class_names, float16=float16)
+        with self._lock:
+            previous, self.recorder = self.recorder, recorder
+            if previous is not None:
+                previous.close()
+        print(f"Recording landmarks to {path}")
+        return path
+    
+    def stop_recording(self):
+        
+        with self._lock:
+            if self.recorder is not None:
+                self.recorder.close()
+                self.recorder = None
+    
+    def _window_ms(self):
+        
+        return self.stabilization_window * 1000.0 if self.stabilization_window is not None else None
     
     def set_debug_mode(self, enabled):
         
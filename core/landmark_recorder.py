@@ -0,0 +1,276 @@
+# core/landmark_recorder.py
+import os
+import json
+import time
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+NUM_LANDMARKS = 21
+HANDEDNESS_CODES = {None: -1, "Left": 0, "Right": 1}
+HANDEDNESS_LABELS = {code: label for label, code in HANDEDNESS_CODES.items()}
+
+# One raw little-endian file per column, so each can be memory-mapped
+COLUMNS = ("timestamps", "landmarks", "handedness", "outputs")
+
+
+class LandmarkRecorder:
+    """
+    Records what the detector saw and predicted, without any video
+
+    A recording is a directory with one binary file per column plus a
+    meta.json describing dtypes and shapes. Frames are buffered and
+    appended one chunk at a time. A recording cut short by a crash stays
+    readable up to its last complete chunk.
+
+    Per frame: timestamp (float64), landmarks (21, 3), handedness code
+    (int8: -1 no hand, 0 left, 1 right) and model outputs (num_classes).
+    Landmarks and outputs are NaN for frames without a hand.
+    """
+
+    def __init__(self, path, num_classes, class_names=None, float16=False, chunk_size=256):
+        self.path = path
+        self.num_classes = int(num_classes)
+        self.chunk_size = chunk_size
+        self.value_dtype = np.dtype(np.float16 if float16 else np.float32).newbyteorder("<")
+
+        os.makedirs(path, exist_ok=True)
+
+        self._buffers = {
+            "timestamps": np.zeros(chunk_size, dtype="<f8"),
+            "landmarks": np.zeros((chunk_size, NUM_LANDMARKS, 3), dtype=self.value_dtype),
+            "handedness": np.zeros(chunk_size, dtype="i1"),
+            "outputs": np.zeros((chunk_size, self.num_classes), dtype=self.value_dtype),
+        }
+        self._files = {name: open(os.path.join(path, f"{name}.bin"), "ab") for name in COLUMNS}
+        self._pending = 0
+        self.frames = 0
+
+        self._write_meta(class_names)
+
+    def _write_meta(self, class_names):
+        meta = {
+            "version": FORMAT_VERSION,
+            "created": time.time(),
+            "num_classes": self.num_classes,
+            "class_names": [str(name) for name in class_names] if class_names is not None else None,
+            "columns": {
+                "timestamps": {"dtype": "<f8", "shape": []},
+                "landmarks": {"dtype": self.value_dtype.str, "shape": [NUM_LANDMARKS, 3]},
+                "handedness": {"dtype": "i1", "shape": []},
+                "outputs": {"dtype": self.value_dtype.str, "shape": [self.num_classes]},
+            },
+        }
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+
+    def record(self, timestamp, landmarks=None, handedness=None, outputs=None):
+        """
+        Add one frame
+
+        Args:
+            timestamp: Frame time in seconds
+            landmarks: Array-like (21, 2) or (21, 3), or None without a hand
+            handedness: "Left", "Right" or None
+            outputs: Model output for the frame, or None
+        """
+        if not self._files:
+            # Closed while a frame was on its way
+            return
+
+        i = self._pending
+        self._buffers["timestamps"][i] = timestamp
+        self._buffers["handedness"][i] = HANDEDNESS_CODES.get(handedness, -1) if landmarks is not None else -1
+
+        if landmarks is None:
+            self._buffers["landmarks"][i] = np.nan
+        else:
+            points = np.asarray(landmarks, dtype=np.float32)
+            self._buffers["landmarks"][i] = 0.0
+            self._buffers["landmarks"][i, :, :points.shape[1]] = points
+
+        if outputs is None:
+            self._buffers["outputs"][i] = np.nan
+        else:
+            self._buffers["outputs"][i] = np.asarray(outputs, dtype=np.float32).reshape(-1)[:self.num_classes]
+
+        self._pending += 1
+        self.frames += 1
+        if self._pending == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending == 0:
+            return
+        for name in COLUMNS:
+            self._files[name].write(self._buffers[name][:self._pending].tobytes())
+            self._files[name].flush()
+        self._pending = 0
+
+    def close(self):
+        if not self._files:
+            return
+        self.flush()
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+        logger.info(f"Recorded {self.frames} frames to {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LandmarkRecording:
+    """
+    Memory-mapped view of a recording
+
+    Columns are numpy memmaps, so scanning hours of frames only pages in
+    what is touched.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), "r") as f:
+            self.meta = json.load(f)
+
+        self.class_names = self.meta.get("class_names")
+        columns = {}
+        counts = []
+
+        for name, spec in self.meta["columns"].items():
+            dtype = np.dtype(spec["dtype"])
+            shape = tuple(spec["shape"])
+            file_path = os.path.join(path, f"{name}.bin")
+            row_bytes = dtype.itemsize * int(np.prod(shape))
+            rows = os.path.getsize(file_path) // row_bytes if os.path.exists(file_path) else 0
+            columns[name] = (file_path, dtype, shape)
+            counts.append(rows)
+
+        # Columns are written together, so a crash leaves at most one chunk missing somewhere
+        self.count = min(counts) if counts else 0
+        self._columns = {}
+        for name, (file_path, dtype, shape) in columns.items():
+            if self.count == 0:
+                self._columns[name] = np.zeros((0,) + shape, dtype=dtype)
+            else:
+                self._columns[name] = np.memmap(file_path, dtype=dtype, mode="r", shape=(self.count,) + shape)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def timestamps(self):
+        return self._columns["timestamps"]
+
+    @property
+    def landmarks(self):
+        return self._columns["landmarks"]
+
+    @property
+    def handedness(self):
+        return self._columns["handedness"]
+
+    @property
+    def outputs(self):
+        return self._columns["outputs"]
+
+    def iter_chunks(self, size=4096):
+        """Yield (start, stop) slices for processing the recording piecewise"""
+        for start in range(0, self.count, size):
+            yield start, min(start + size, self.count)
+
+    def duration(self):
+        if self.count == 0:
+            return 0.0
+        return float(self.timestamps[-1] - self.timestamps[0])
+
+    def to_session(self, labels=None):
+        """
+        Build a replay session from the recording
+
+        Args:
+            labels: Optional list of {"letter", "start", "end"}; defaults to
+                labels.json next to the recording
+
+        Returns:
+            Session dictionary for core.replay
+        """
+        if labels is None:
+            labels_path = os.path.join(self.path, "labels.json")
+            if os.path.exists(labels_path):
+                with open(labels_path, "r") as f:
+                    labels = json.load(f)
+
+        # Frames are read from the columns while replaying instead of being copied into dicts
+        return {
+            "name": os.path.basename(os.path.normpath(self.path)),
+            "class_names": self.class_names,
+            "labels": labels or [],
+            "recording": self,
+        }
+
+    def iter_frames(self, chunk_size=4096):
+        """
+        Yield (timestamp, landmarks, handedness, outputs) for every frame
+
+        The columns are read one chunk at a time. landmarks and handedness
+        are None when no hand was seen, outputs is None when the classifier
+        output was not recorded.
+        """
+        for start, stop in self.iter_chunks(chunk_size):
+            timestamps = self.timestamps[start:stop].tolist()
+            handedness = self.handedness[start:stop]
+            hands = (handedness >= 0).tolist()
+            labels = [HANDEDNESS_LABELS.get(code) for code in handedness.tolist()]
+            landmarks = np.asarray(self.landmarks[start:stop], dtype=np.float32)
+            outputs = np.asarray(self.outputs[start:stop], dtype=np.float32)
+            has_outputs = (~np.isnan(outputs).any(axis=1)).tolist()
+
+            for i in range(stop - start):
+                if not hands[i]:
+                    yield timestamps[i], None, None, None
+                else:
+                    yield timestamps[i], landmarks[i], labels[i], outputs[i] if has_outputs[i] else None
+
+
+def is_recording(path):
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, "meta.json"))
+
+
+def new_recording_path(directory="data/recordings"):
+    """
+    Create an empty recording directory named after the current time
+
+    A counter is appended when a recording was already started in the
+    same second, so two recordings never share a directory.
+
+    Returns:
+        The created directory path
+    """
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, time.strftime("%Y%m%d_%H%M%S"))
+    path = base + ".lmrec"
+    suffix = 1
+
+    while True:
+        try:
+            os.mkdir(path)
+            return path
+        except FileExistsError:
+            path = f"{base}_{suffix}.lmrec"
+            suffix += 1
+
+
+if __name__ == "__main__":
+    import sys
+
+    for recording_path in sys.argv[1:]:
+        recording = LandmarkRecording(recording_path)
+        present = int(np.count_nonzero(np.asarray(recording.handedness) >= 0))
+        print(f"{recording_path}: {len(recording)} frames, {recording.duration():.1f}s, "
+              f"hand visible in {present} frames, values {recording.meta['columns']['landmarks']['dtype']}")
@@ -0,0 +1,353 @@
+# core/multi_stream.py
+import os
+import sys
+import time
+import logging
+import threading
+from collections import deque
+from core.decision import Transcript
+from utils.frame_sources import open_source, is_camera_spec
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICIES = ("latest", "block")
+
+
+class Stream:
+    """
+    One frame source with its own detector session and frame buffer
+
+    Drop policies:
+        latest: keep at most max_pending frames, dropping the oldest when a
+            new one arrives (live cameras)
+        block: the capture thread waits for room, nothing is dropped (files)
+
+    Args:
+        name: Stream name used in results
+        source: FrameSource
+        detector: Detector session used only by this stream
+        drop_policy: "latest" or "block", defaults by source type
+        max_pending: Frames buffered before the policy applies
+    """
+
+    def __init__(self, name, source, detector, drop_policy=None, max_pending=1, word_gap=0.5):
+        if drop_policy is None:
+            drop_policy = "latest" if source.live else "block"
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+
+        self.name = name
+        self.source = source
+        self.detector = detector
+        self.drop_policy = drop_policy
+        self.max_pending = max(1, max_pending)
+        self.transcript = Transcript(word_gap=word_gap)
+
+        self.pending = deque()
+        self.source_lock = threading.Lock()
+        self.closed = False
+        self.busy = False
+        self.finished = False
+        self.captured = 0
+        self.processed = 0
+        self.dropped = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def ready(self):
+        return bool(self.pending) and not self.busy
+
+    @property
+    def done(self):
+        return self.finished and not self.pending and not self.busy
+
+    def read(self):
+        """Read the next frame, or None once the source ended or was closed"""
+        with self.source_lock:
+            if self.closed:
+                return None
+            return self.source.read()
+
+    def close(self):
+        # Waits for a read in progress on the capture thread
+        with self.source_lock:
+            if not self.closed:
+                self.closed = True
+                self.source.close()
+
+    def get_stats(self):
+        return {
+            "stream": self.name,
+            "drop_policy": self.drop_policy,
+            "captured": self.captured,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "transcript": self.transcript.result(),
+        }
+
+
+class MultiStreamProcessor:
+    """
+    Processes several frame sources with a fixed pool of worker threads
+
+    Each stream has a capture thread filling its buffer. Workers take
+    frames stream by stream in round-robin order, so a fast camera cannot
+    starve a slow one, and a stream is never processed by two workers at
+    once, which keeps its frames in order and its decision state private.
+    How far throughput scales with workers depends on how much of the
+    per-frame work runs outside the GIL; measure it with benchmark().
+
+    Args:
+        workers: Number of worker threads
+        on_result: Optional callback(stream, result) for every processed frame
+    """
+
+    def __init__(self, workers=None, on_result=None):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.on_result = on_result
+        self.streams = []
+        self.condition = threading.Condition()
+        self._cursor = 0
+        self._stopped = False
+
+    def add_stream(self, stream):
+        self.streams.append(stream)
+        return stream
+
+    def _capture(self, stream):
+        try:
+            while not self._stopped:
+                item = stream.read()
+                if item is None:
+                    break
+
+                with self.condition:
+                    stream.captured += 1
+                    if stream.drop_policy == "block":
+                        while len(stream.pending) >= stream.max_pending and not self._stopped:
+                            self.condition.wait()
+                    elif len(stream.pending) >= stream.max_pending:
+                        stream.pending.popleft()
+                        stream.dropped += 1
+                    stream.pending.append(item)
+                    self.condition.notify_all()
+        except Exception as e:
+            logger.error(f"{stream.name}: frame source failed: {e}")
+        finally:
+            with self.condition:
+                stream.finished = True
+                self.condition.notify_all()
+
+    def _next_stream(self):
+        # Round-robin from the stream after the last one served
+        count = len(self.streams)
+        for offset in range(count):
+            index = (self._cursor + offset) % count
+            if self.streams[index].ready:
+                self._cursor = index + 1
+                return self.streams[index]
+        return None
+
+    def _work(self):
+        while True:
+            with self.condition:
+                stream = self._next_stream()
+                while stream is None:
+                    if self._stopped or all(s.done for s in self.streams):
+                        return
+                    self.condition.wait()
+                    stream = self._next_stream()
+
+                stream.busy = True
+                frame, timestamp = stream.pending.popleft()
+                self.condition.notify_all()
+
+            start = time.perf_counter()
+            try:
+                result = self._process(stream, frame, timestamp)
+            except Exception as e:
+                logger.error(f"{stream.name}: {e}")
+                result = None
+            elapsed = time.perf_counter() - start
+
+            with self.condition:
+                stream.busy = False
+                stream.processed += 1
+                stream.busy_seconds += elapsed
+                self.condition.notify_all()
+
+            if result is not None and self.on_result is not None:
+                self.on_result(stream, result)
+
+    def _process(self, stream, frame, timestamp):
+        _, landmarks, prediction, confidence = stream.detector.process_frame(frame, timestamp, draw=False)
+        hand = bool(landmarks)
+        letter = stream.transcript.update(prediction, timestamp, hand)
+        return {
+            "t": timestamp,
+            "hand": hand,
+            "prediction": str(prediction) if prediction is not None else None,
+            "confidence": round(confidence, 4),
+            "letter": letter,
+        }
+
+    def stop(self):
+        with self.condition:
+            self._stopped = True
+            self.condition.notify_all()
+
+    def run(self):
+        """
+        Process every stream until all sources end or stop() is called
+
+        Returns:
+            Stats dictionary with totals and per-stream counters
+        """
+        start_time = time.perf_counter()
+
+        threads = [threading.Thread(target=self._capture, args=(stream,), daemon=True) for stream in self.streams]
+        workers = [threading.Thread(target=self._work, daemon=True) for _ in range(self.workers)]
+        for thread in threads + workers:
+            thread.start()
+
+        try:
+            for thread in workers:
+                while thread.is_alive():
+                    thread.join(0.2)
+        except KeyboardInterrupt:
+            self.stop()
+            for thread in workers:
+                thread.join()
+        finally:
+            self.stop()
+
+        wall_time = time.perf_counter() - start_time
+        processed = sum(stream.processed for stream in self.streams)
+
+        return {
+            "streams": len(self.streams),
+            "workers": self.workers,
+            "processed": processed,
+            "dropped": sum(stream.dropped for stream in self.streams),
+            "wall_seconds": round(wall_time, 3),
+            "frames_per_second": round(processed / wall_time, 2) if wall_time > 0 else 0.0,
+            "per_stream": [stream.get_stats() for stream in self.streams],
+        }
+
+
+def benchmark(make_detector, make_source, stream_counts=(1, 2, 4), worker_counts=(1, 2, 4)):
+    """
+    Measure how throughput scales with streams and workers
+
+    Sources use the block policy so every frame is processed and the
+    result measures capacity rather than the source frame rate.
+
+    Args:
+        make_detector: Function returning a new detector session
+        make_source: Function returning a new FrameSource
+        stream_counts: Numbers of concurrent streams to try
+        worker_counts: Worker pool sizes to try
+
+    Returns:
+        List of result dictionaries
+    """
+    results = []
+
+    for workers in worker_counts:
+        for streams in stream_counts:
+            processor = MultiStreamProcessor(workers=workers)
+            for i in range(streams):
+                processor.add_stream(Stream(f"stream-{i}", make_source(), make_detector(),
+                                            drop_policy="block", max_pending=2))
+
+            stats = processor.run()
+            for stream in processor.streams:
+                stream.close()
+
+            results.append({
+                "workers": workers,
+                "streams": streams,
+                "frames": stats["processed"],
+                "wall_seconds": stats["wall_seconds"],
+                "frames_per_second": stats["frames_per_second"],
+                "per_stream_fps": round(stats["frames_per_second"] / streams, 2),
+            })
+
+    return results
+
+
+def _parse_counts(text):
+    return tuple(int(value) for value in text.split(",") if value.strip())
+
+
+def add_arguments(parser):
+    parser.add_argument("sources", nargs="+", help="Camera indices, video files or image folders, one per stream")
+    parser.add_argument("--workers", type=int, default=None, help="Worker threads (default: up to 4)")
+    parser.add_argument("--drop-policy", choices=DROP_POLICIES, default=None,
+                        help="Applied to every stream (default: latest for cameras, block for files)")
+    parser.add_argument("--max-pending", type=int, default=1, help="Frames buffered per stream")
+    parser.add_argument("--model", default="./models/sign_language_model.tflite", help="TFLite model path")
+    parser.add_argument("--class-names", default="./models/class_names.npy", help="Class names file")
+    parser.add_argument("--fps", type=float, default=30.0,
+                        help="Frame rate of image folders and videos that do not report one")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Replay the first source as N streams with each worker count and report throughput")
+    parser.add_argument("--stream-counts", default="1,2,4", help="Benchmark: stream counts")
+    parser.add_argument("--worker-counts", default=f"1,2,{os.cpu_count() or 1}", help="Benchmark: worker counts")
+
+
+def run(args):
+    import json
+    from core.classifier import SignClassifier
+    from core.detector import SignLanguageDetector
+    from core.stream_detector import EventWriter
+    from utils.settings_service import get_settings_service
+
+    # Every benchmark stream reopens the source, which a camera does not allow
+    if args.benchmark and is_camera_spec(args.sources[0]):
+        print("--benchmark needs a video file or image folder, not a camera", file=sys.stderr)
+        return 1
+
+    # Keep stdout for JSON lines
+    out = sys.stdout
+    sys.stdout = sys.stderr
+
+    try:
+        worker_counts = _parse_counts(args.worker_counts) if args.benchmark else (args.workers or 4,)
+        classifier = SignClassifier(args.model, args.class_names, pool_size=max(worker_counts))
+        base = SignLanguageDetector(classifier=classifier)
+        base.set_debug_mode(False)
+        settings = get_settings_service().get_all()
+        settings["record_landmarks"] = False
+        base.apply_settings(settings)
+
+        if args.benchmark:
+            for result in benchmark(base.new_session, lambda: open_source(args.sources[0], fps=args.fps),
+                                    _parse_counts(args.stream_counts), worker_counts):
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+            return 0
+
+        writer = EventWriter(out)
+
+        def on_result(stream, result):
+            if result["letter"] is not None:
+                writer.write({"type": "letter", "stream": stream.name, "t": result["t"], "letter": result["letter"],
+                              "phrase": stream.transcript.result()})
+
+        processor = MultiStreamProcessor(workers=args.workers, on_result=on_result)
+        for spec in args.sources:
+            processor.add_stream(Stream(spec, open_source(spec, fps=args.fps), base.new_session(),
+                                        drop_policy=args.drop_policy, max_pending=args.max_pending))
+
+        stats = processor.run()
+        for stream in processor.streams:
+            stream.close()
+
+        writer.write({"type": "end", **stats})
+        writer.close()
+    finally:
+        sys.stdout = out
+
+    return 0
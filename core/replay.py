@@ -0,0 +1,314 @@
+# core/replay.py
+import os
+import json
+import logging
+import numpy as np
+from core.decision import DEFAULT_CONFIG, make_decision_state
+from core.landmark_recorder import LandmarkRecording, is_recording
+
+logger = logging.getLogger(__name__)
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+GOLDEN_PATH = "data/replay/golden_synthetic.json"
+
+def _top_to_probabilities(index, confidence, classes):
+    probabilities = np.full(classes, (1.0 - confidence) / max(1, classes - 1), dtype=np.float32)
+    probabilities[index] = confidence
+    return probabilities
+
+
+def _iter_frames(session, classes):
+    # Yields (timestamp, hand, landmarks, handedness, probabilities)
+    if "recording" in session:
+        for timestamp, landmarks, handedness, outputs in session["recording"].iter_frames():
+            yield timestamp, landmarks is not None, landmarks, handedness, outputs
+        return
+
+    for frame in session["frames"]:
+        if frame.get("hand", True) is False:
+            yield frame["t"], False, None, None, None
+            continue
+
+        probabilities = frame.get("probs")
+        if probabilities is None and "top" in frame:
+            probabilities = _top_to_probabilities(frame["top"][0], frame["top"][1], classes)
+        yield frame["t"], True, frame.get("landmarks"), frame.get("handedness"), probabilities
+
+
+def replay_session(session, config=None, classifier=None):
+    """
+    Replay one labeled session through the decision logic
+
+    Frames carry either classifier output ("probs", or "top": [index,
+    confidence]) or raw "landmarks" that are smoothed and passed to
+    classifier. Frames with "hand": false mean the hand was lost. Sessions
+    from LandmarkRecording.to_session() carry the "recording" itself
+    instead of "frames".
+
+    Args:
+        session: Session dictionary
+        config: Decision settings, defaults to DEFAULT_CONFIG
+        classifier: Function mapping smoothed landmarks to probabilities
+
+    Returns:
+        Dictionary with the emitted letters and per-label results
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    class_names = session.get("class_names") or list(LETTERS)
+    decision = make_decision_state(class_names, config)
+
+    start = None
+    commits = []
+    shown = None
+
+    for timestamp, hand, landmarks, handedness, probabilities in _iter_frames(session, len(class_names)):
+        if start is None:
+            start = timestamp
+
+        if not hand:
+            decision.hand_lost()
+            shown = None
+            continue
+
+        if landmarks is not None and classifier is not None:
+            # The live detector classifies (x, y) only
+            points = np.asarray(landmarks, dtype=np.float32)[:, :2]
+            smoothed = decision.smooth(points, timestamp, handedness or 0)
+            probabilities = np.asarray(classifier(smoothed)).reshape(-1)
+        elif probabilities is None:
+            continue
+
+        prediction, _ = decision.update(probabilities, timestamp)
+
+        # A letter reaches the user when the displayed prediction changes to it
+        if prediction is not None and prediction != shown:
+            commits.append((timestamp - start, str(prediction)))
+        shown = prediction
+
+    return score_commits(commits, session.get("labels", []), start if start is not None else 0.0)
+
+
+def score_commits(commits, labels, start=0.0):
+    """
+    Compare emitted letters with the labeled signs
+
+    Returns:
+        Dictionary with commits, time_to_letter per label, false and
+        duplicate commit counts
+    """
+    latencies = []
+    matched = [False] * len(labels)
+    false_commits = 0
+    duplicate_commits = 0
+
+    for t, letter in commits:
+        active = None
+        for i, label in enumerate(labels):
+            if label["start"] - start <= t <= label["end"] - start:
+                active = i
+                break
+
+        if active is None or labels[active]["letter"] != letter:
+            false_commits += 1
+        elif matched[active]:
+            duplicate_commits += 1
+        else:
+            matched[active] = True
+            latencies.append(t - (labels[active]["start"] - start))
+
+    return {
+        "commits": [[round(t, 3), letter] for t, letter in commits],
+        "time_to_letter": [round(latency, 3) for latency in latencies],
+        "letters": len(labels),
+        "missed": matched.count(False),
+        "false_commits": false_commits,
+        "duplicate_commits": duplicate_commits,
+    }
+
+
+def summarize(results):
+    """Aggregate per-session results into one report"""
+    latencies = sorted(latency for result in results.values() for latency in result["time_to_letter"])
+
+    def percentile(q):
+        if not latencies:
+            return None
+        return round(latencies[min(len(latencies) - 1, int(round(q * (len(latencies) - 1))))], 3)
+
+    return {
+        "sessions": len(results),
+        "letters": sum(r["letters"] for r in results.values()),
+        "missed": sum(r["missed"] for r in results.values()),
+        "false_commits": sum(r["false_commits"] for r in results.values()),
+        "duplicate_commits": sum(r["duplicate_commits"] for r in results.values()),
+        "time_to_letter_p50": percentile(0.5),
+        "time_to_letter_p90": percentile(0.9),
+        "time_to_letter_mean": round(sum(latencies) / len(latencies), 3) if latencies else None,
+    }
+
+
+def synthetic_session(word, fps=30.0, hold=1.0, gap=0.4, noise=0.15, seed=0):
+    """
+    A labeled session of a signer spelling word, with noisy classifier output
+
+    Between letters the hand is in transition and the classifier output is
+    low-confidence guesses. The session is fully determined by its seed.
+    """
+    rng = np.random.default_rng(seed)
+    frames = []
+    labels = []
+    t = 0.0
+    step = 1.0 / fps
+
+    def add_transition(duration):
+        nonlocal t
+        for _ in range(int(round(duration * fps))):
+            frames.append({"t": round(t, 6), "top": [int(rng.integers(26)), round(float(rng.uniform(0.3, 0.65)), 3)]})
+            t += step
+
+    for letter in word.upper():
+        add_transition(gap)
+        labels.append({"letter": letter, "start": round(t, 6), "end": round(t + hold, 6)})
+        target = LETTERS.index(letter)
+
+        for _ in range(int(round(hold * fps))):
+            if rng.random() < noise:
+                top = [int(rng.integers(26)), round(float(rng.uniform(0.6, 0.85)), 3)]
+            else:
+                top = [target, round(float(rng.uniform(0.7, 1.0)), 3)]
+            frames.append({"t": round(t, 6), "top": top})
+            t += step
+
+    add_transition(gap)
+    frames.append({"t": round(t, 6), "hand": False})
+
+    return {"name": f"{word.lower()}_{int(fps)}fps_{seed}", "labels": labels, "frames": frames}
+
+
+def synthetic_sessions():
+    """The fixed session set the golden file is generated from"""
+    words = ["HELLO", "THANKS", "ABC", "SIGN", "WORLD"]
+    return [synthetic_session(word, fps=fps, seed=seed)
+            for seed, word in enumerate(words)
+            for fps in (10.0, 30.0)]
+
+
+def load_sessions(paths):
+    sessions = []
+    for path in paths:
+        if is_recording(path):
+            sessions.append(LandmarkRecording(path).to_session())
+            continue
+        
+        with open(path, "r") as f:
+            data = json.load(f)
+        for i, session in enumerate(data if isinstance(data, list) else [data]):
+            session.setdefault("name", f"{os.path.basename(path)}#{i}")
+            sessions.append(session)
+    return sessions
+
+
+def run_replay(sessions, config=None, classifier=None):
+    """
+    Replay sessions and build a report
+
+    Returns:
+        Dictionary with the config, per-session results and summary
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    results = {session["name"]: replay_session(session, config, classifier) for session in sessions}
+    return {"config": config, "sessions": results, "summary": summarize(results)}
+
+
+def compare_with_golden(report, golden):
+    """
+    Returns:
+        List of human readable differences, empty when the report matches
+    """
+    differences = []
+
+    if report["config"] != golden.get("config"):
+        differences.append(f"config differs: {golden.get('config')} -> {report['config']}")
+
+    golden_sessions = golden.get("sessions", {})
+    for name, result in report["sessions"].items():
+        expected = golden_sessions.get(name)
+        if expected is None:
+            differences.append(f"{name}: not in golden file")
+        elif expected != result:
+            differences.append(f"{name}: commits {expected['commits']} -> {result['commits']}")
+
+    for name in golden_sessions:
+        if name not in report["sessions"]:
+            differences.append(f"{name}: missing from replay")
+
+    return differences
+
+
+def add_arguments(parser):
+    parser.add_argument("sessions", nargs="*",
+                        help="Session JSON files or landmark recordings (default: built-in synthetic sessions)")
+    parser.add_argument("--golden", default=None, help=f"Golden report to check against (default for synthetic: {GOLDEN_PATH})")
+    parser.add_argument("--update-golden", action="store_true", help="Write the report as the new golden file")
+    parser.add_argument("--model", default=None, help="TFLite model to classify recorded landmarks with")
+    parser.add_argument("--stabilizer", default=None, help="Stabilizer strategy")
+    parser.add_argument("--window-ms", type=float, default=None, help="Stabilization window in ms")
+    parser.add_argument("--threshold", type=float, default=None, help="Confidence threshold")
+    parser.add_argument("--landmark-filter", default=None, help="Landmark filter, or 'none'")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+
+
+def run(args):
+    sessions = load_sessions(args.sessions) if args.sessions else synthetic_sessions()
+    golden_path = args.golden or (None if args.sessions else GOLDEN_PATH)
+
+    config = {}
+    if args.stabilizer:
+        config["stabilizer"] = args.stabilizer
+    if args.window_ms is not None:
+        config["stabilization_window_ms"] = args.window_ms
+    if args.threshold is not None:
+        config["confidence_threshold"] = args.threshold
+    if args.landmark_filter:
+        config["landmark_filter"] = None if args.landmark_filter == "none" else args.landmark_filter
+
+    classifier = None
+    if args.model:
+        from core.detector import SignLanguageDetector
+        detector = SignLanguageDetector(model_path=args.model)
+        classifier = lambda landmarks: detector.classify_landmarks(landmarks)[0]
+
+    report = run_replay(sessions, config, classifier)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report["summary"], indent=2))
+
+    if args.update_golden:
+        os.makedirs(os.path.dirname(golden_path) or ".", exist_ok=True)
+        with open(golden_path, "w") as f:
+            json.dump(report, f, indent=1)
+        print(f"Wrote {golden_path}")
+        return 0
+
+    if golden_path and os.path.exists(golden_path):
+        with open(golden_path, "r") as f:
+            golden = json.load(f)
+        differences = compare_with_golden(report, golden)
+        if differences:
+            print(f"Decision output differs from {golden_path}:")
+            for difference in differences:
+                print(f"  {difference}")
+            return 1
+        print(f"Matches {golden_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay labeled sessions through the decision logic")
+    add_arguments(parser)
+    raise SystemExit(run(parser.parse_args()))
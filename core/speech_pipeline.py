@@ -0,0 +1,88 @@
+# core/speech_pipeline.py
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from core.speech_recognizer import RecognitionResult
+
+logger = logging.getLogger(__name__)
+
+
+class RecognitionPipeline:
+    """
+    Recognizes audio segments on a pool of workers.
+
+    The capturing thread hands segments to submit() and goes straight back
+    to listening. Segments are transcribed in parallel and on_result is
+    called with each result in the order the segments were submitted.
+    """
+
+    def __init__(self, backend, on_result, workers=2, max_pending=8):
+        self.backend = backend
+        self.on_result = on_result
+        self.workers = max(1, workers)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="recognizer")
+        self._pending = threading.BoundedSemaphore(max(1, max_pending))
+        self._lock = threading.Lock()
+        self._next_submit = 0
+        self._next_emit = 0
+        self._finished = {}
+
+        self.submitted_count = 0
+        self.dropped_count = 0
+
+    def submit(self, audio, block=False):
+        """
+        Queue an audio segment for recognition
+
+        Args:
+            audio: speech_recognition.AudioData
+            block: Wait for a free slot instead of dropping when the pool is backed up
+
+        Returns:
+            Sequence number of the segment, or None if it was dropped
+        """
+        if not self._pending.acquire(blocking=block):
+            self.dropped_count += 1
+            logger.warning("Recognition pipeline backed up, dropping audio segment")
+            return None
+
+        with self._lock:
+            seq = self._next_submit
+            self._next_submit += 1
+            self.submitted_count += 1
+
+        self._executor.submit(self._recognize, seq, audio)
+        return seq
+
+    def _recognize(self, seq, audio):
+        try:
+            result = self.backend.recognize(audio)
+        except Exception as e:
+            logger.error(f"Recognition of segment {seq} failed: {e}")
+            result = RecognitionResult("", error=str(e))
+        finally:
+            self._pending.release()
+
+        self._complete(seq, result)
+
+    def _complete(self, seq, result):
+        # Hold finished results until every earlier segment is done
+        with self._lock:
+            self._finished[seq] = result
+
+            ready = []
+            while self._next_emit in self._finished:
+                ready.append((self._next_emit, self._finished.pop(self._next_emit)))
+                self._next_emit += 1
+
+            for ready_seq, ready_result in ready:
+                try:
+                    self.on_result(ready_seq, ready_result)
+                except Exception as e:
+                    logger.error(f"Error handling recognition result {ready_seq}: {e}")
+
+    def close(self, wait=True):
+        """Stop accepting segments; with wait=True finish the ones already queued"""
+        self._executor.shutdown(wait=wait)
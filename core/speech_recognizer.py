@@ -0,0 +1,274 @@
+# core/speech_recognizer.py
+import os
+import json
+import time
+import threading
+import logging
+import speech_recognition as sr
+
+try:
+    import vosk
+except ImportError:
+    vosk = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VOSK_MODEL_PATH = "models/vosk"
+RECOGNITION_SAMPLE_RATE = 16000
+RECOGNITION_SAMPLE_WIDTH = 2
+
+
+class RecognitionResult:
+    """Outcome of recognizing one utterance"""
+
+    def __init__(self, text, is_final=True, latency=0.0, audio_duration=0.0, error=None):
+        self.text = text
+        self.is_final = is_final
+        self.latency = latency
+        self.audio_duration = audio_duration
+        self.error = error
+
+    def to_dict(self):
+        return {
+            "text": self.text,
+            "is_final": self.is_final,
+            "latency": self.latency,
+            "audio_duration": self.audio_duration,
+            "error": self.error,
+        }
+
+    def __repr__(self):
+        return f"RecognitionResult({self.text!r}, final={self.is_final}, latency={self.latency:.3f}s)"
+
+
+class RecognizerBackend:
+    """Base class for speech recognition engines"""
+
+    name = "base"
+    streaming = False
+    offline = True
+
+    @property
+    def is_loaded(self):
+        return True
+
+    def load(self):
+        """Load models; called once before the first recognition"""
+        pass
+
+    def recognize(self, audio):
+        """
+        Recognize a complete utterance
+
+        Args:
+            audio: speech_recognition.AudioData
+
+        Returns:
+            RecognitionResult
+        """
+        raise NotImplementedError
+
+    def create_stream(self, sample_rate):
+        """Create a RecognitionStream for incremental PCM input"""
+        raise NotImplementedError(f"{self.name} does not support streaming")
+
+
+class RecognitionStream:
+    """Incremental recognizer fed with raw 16-bit mono PCM chunks"""
+
+    def accept(self, pcm):
+        """
+        Feed audio
+
+        Returns:
+            RecognitionResult with is_final=False for a partial hypothesis,
+            is_final=True when an utterance ended, or None if nothing changed
+        """
+        raise NotImplementedError
+
+    def finish(self):
+        """Flush remaining audio and return the final RecognitionResult, or None"""
+        raise NotImplementedError
+
+
+class GoogleRecognizerBackend(RecognizerBackend):
+    """Google Web Speech API; needs a network connection"""
+
+    name = "google"
+    offline = False
+
+    def __init__(self, language="en-US"):
+        self.language = language
+        self._recognizer = sr.Recognizer()
+
+    def recognize(self, audio):
+        start = time.perf_counter()
+        duration = _audio_duration(audio)
+        try:
+            text = self._recognizer.recognize_google(audio, language=self.language)
+            return RecognitionResult(text, latency=time.perf_counter() - start, audio_duration=duration)
+        except sr.UnknownValueError:
+            return RecognitionResult("", latency=time.perf_counter() - start, audio_duration=duration)
+
+
+class SphinxRecognizerBackend(RecognizerBackend):
+    """CMU PocketSphinx through speech_recognition; fully offline"""
+
+    name = "sphinx"
+
+    def __init__(self, language="en-US"):
+        self.language = language
+        self._recognizer = sr.Recognizer()
+
+    def load(self):
+        # recognize_sphinx only imports PocketSphinx on first use; fail here instead
+        try:
+            import pocketsphinx
+        except ImportError as e:
+            raise RuntimeError("PocketSphinx is not installed (pip install pocketsphinx)") from e
+
+    def recognize(self, audio):
+        start = time.perf_counter()
+        duration = _audio_duration(audio)
+        try:
+            text = self._recognizer.recognize_sphinx(audio, language=self.language)
+            return RecognitionResult(text, latency=time.perf_counter() - start, audio_duration=duration)
+        except sr.UnknownValueError:
+            return RecognitionResult("", latency=time.perf_counter() - start, audio_duration=duration)
+
+
+class VoskRecognizerBackend(RecognizerBackend):
+    """Vosk (Kaldi) recognizer; offline with streaming partial results"""
+
+    name = "vosk"
+    streaming = True
+
+    def __init__(self, model_path=DEFAULT_VOSK_MODEL_PATH):
+        self.model_path = model_path
+        self.model = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self):
+        return self.model is not None
+
+    def load(self):
+        with self._lock:
+            if self.model is not None:
+                return
+
+            if vosk is None:
+                raise RuntimeError("vosk is not installed")
+            if not os.path.isdir(self.model_path):
+                raise FileNotFoundError(f"Vosk model not found: {self.model_path}")
+
+            start = time.perf_counter()
+            vosk.SetLogLevel(-1)
+            self.model = vosk.Model(self.model_path)
+            logger.info(f"Loaded Vosk model from {self.model_path} in {time.perf_counter() - start:.2f}s")
+
+    def recognize(self, audio):
+        self.load()
+
+        start = time.perf_counter()
+        pcm = audio.get_raw_data(convert_rate=RECOGNITION_SAMPLE_RATE,
+                                 convert_width=RECOGNITION_SAMPLE_WIDTH)
+
+        recognizer = vosk.KaldiRecognizer(self.model, RECOGNITION_SAMPLE_RATE)
+        recognizer.AcceptWaveform(pcm)
+        text = json.loads(recognizer.FinalResult()).get("text", "")
+
+        return RecognitionResult(text, latency=time.perf_counter() - start,
+                                 audio_duration=_audio_duration(audio))
+
+    def create_stream(self, sample_rate):
+        self.load()
+        return VoskRecognitionStream(vosk.KaldiRecognizer(self.model, sample_rate), sample_rate)
+
+
+class VoskRecognitionStream(RecognitionStream):
+
+    def __init__(self, recognizer, sample_rate):
+        self.recognizer = recognizer
+        self.sample_rate = sample_rate
+        self.last_partial = ""
+        self.utterance_samples = 0
+
+    def accept(self, pcm):
+        start = time.perf_counter()
+        self.utterance_samples += len(pcm) // RECOGNITION_SAMPLE_WIDTH
+
+        if self.recognizer.AcceptWaveform(pcm):
+            text = json.loads(self.recognizer.Result()).get("text", "")
+            return self._final(text, start)
+
+        partial = json.loads(self.recognizer.PartialResult()).get("partial", "")
+        if partial and partial != self.last_partial:
+            self.last_partial = partial
+            return RecognitionResult(partial, is_final=False, latency=time.perf_counter() - start)
+        return None
+
+    def finish(self):
+        start = time.perf_counter()
+        text = json.loads(self.recognizer.FinalResult()).get("text", "")
+        if not text:
+            return None
+        return self._final(text, start)
+
+    def _final(self, text, start):
+        # Latency is the time from the end of the utterance's audio to its result
+        result = RecognitionResult(text, latency=time.perf_counter() - start,
+                                   audio_duration=self.utterance_samples / float(self.sample_rate))
+        self.last_partial = ""
+        self.utterance_samples = 0
+        return result
+
+
+def _audio_duration(audio):
+    return len(audio.frame_data) / float(audio.sample_rate * audio.sample_width)
+
+
+_BACKEND_CLASSES = {
+    GoogleRecognizerBackend.name: GoogleRecognizerBackend,
+    SphinxRecognizerBackend.name: SphinxRecognizerBackend,
+    VoskRecognizerBackend.name: VoskRecognizerBackend,
+}
+
+_backend_cache = {}
+_backend_cache_lock = threading.Lock()
+
+
+def default_backend_name(vosk_model_path=DEFAULT_VOSK_MODEL_PATH):
+    """Prefer the local Vosk engine when it and its model are installed"""
+    if vosk is not None and os.path.isdir(vosk_model_path):
+        return VoskRecognizerBackend.name
+    return GoogleRecognizerBackend.name
+
+
+def get_recognizer_backend(name=None, **kwargs):
+    """
+    Get a shared recognizer backend
+
+    Backends are created once per process and reused, so models are only
+    loaded the first time a window starts listening.
+
+    Args:
+        name: "vosk", "sphinx" or "google" (default: best available)
+        **kwargs: Backend specific options
+
+    Returns:
+        RecognizerBackend instance
+    """
+    if name is None:
+        name = default_backend_name(kwargs.get("model_path", DEFAULT_VOSK_MODEL_PATH))
+
+    if name not in _BACKEND_CLASSES:
+        raise ValueError(f"Unknown speech recognition backend: {name}")
+
+    key = (name, tuple(sorted(kwargs.items())))
+    with _backend_cache_lock:
+        backend = _backend_cache.get(key)
+        if backend is None:
+            backend = _BACKEND_CLASSES[name](**kwargs)
+            _backend_cache[key] = backend
+        return backend
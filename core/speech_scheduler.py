@@ -0,0 +1,208 @@
+# core/speech_scheduler.py
+import heapq
+import itertools
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_LETTER = 10
+PRIORITY_NORMAL = 20
+PRIORITY_PHRASE = 30
+
+
+class SpeechItem:
+    """A single queued utterance"""
+
+    def __init__(self, text, priority=PRIORITY_NORMAL, ttl=None, key=None, utterance=None):
+        self.text = text
+        self.priority = priority
+        self.ttl = ttl
+        self.key = key if key is not None else text
+        self.utterance = utterance
+        self.created_at = time.monotonic()
+        self.cancelled = False
+
+    def is_stale(self, now=None):
+        if self.ttl is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        return now - self.created_at > self.ttl
+
+    def __repr__(self):
+        return f"SpeechItem({self.text!r}, priority={self.priority}, ttl={self.ttl})"
+
+
+class SpeechScheduler:
+    """
+    Bounded priority queue for speech items.
+
+    Higher priority items are served first, items of equal priority in
+    FIFO order. Items that outlive their TTL are dropped when they reach
+    the head of the queue, and an item whose key is already waiting is
+    coalesced into the queued one instead of being spoken twice.
+    """
+
+    def __init__(self, max_size=8):
+        self.max_size = max(1, int(max_size))
+
+        self._heap = []
+        self._by_key = {}
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self.enqueued_count = 0
+        self.dropped_count = 0
+        self.coalesced_count = 0
+
+    def __len__(self):
+        with self._cond:
+            return len(self._by_key)
+
+    def put(self, item):
+        """
+        Add an item to the queue
+
+        Returns:
+            True if the item was queued or coalesced, False if it was dropped
+        """
+        with self._cond:
+            if self._closed:
+                return False
+
+            queued = self._by_key.get(item.key)
+            if queued is not None:
+                # Refresh the waiting item rather than speaking the same text twice
+                self.coalesced_count += 1
+                if item.priority > queued.priority:
+                    queued.cancelled = True
+                    self._push(item)
+                else:
+                    queued.created_at = item.created_at
+                    queued.ttl = item.ttl
+                return True
+
+            if len(self._by_key) >= self.max_size:
+                victim = self._lowest_priority_item()
+                if victim is None or victim.priority > item.priority:
+                    self.dropped_count += 1
+                    logger.debug(f"Speech queue full, dropping {item}")
+                    return False
+
+                victim.cancelled = True
+                del self._by_key[victim.key]
+                self.dropped_count += 1
+                logger.debug(f"Speech queue full, evicting {victim}")
+
+            self._push(item)
+            self.enqueued_count += 1
+            self._cond.notify()
+            return True
+
+    def get(self, timeout=None):
+        """
+        Pop the most important fresh item
+
+        Returns:
+            SpeechItem, or None on timeout or after close()
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            while True:
+                item = self._pop_fresh()
+                if item is not None:
+                    return item
+
+                if self._closed:
+                    return None
+
+                if deadline is None:
+                    self._cond.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self._cond.wait(remaining)
+
+    def peek_priority(self):
+        """Priority of the next item that would be served, or None"""
+        with self._cond:
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return None
+            return self._heap[0][2].priority
+
+    def is_queued(self, item):
+        """True if this very item is waiting, rather than one it was coalesced into"""
+        with self._cond:
+            return self._by_key.get(item.key) is item and not item.cancelled
+
+    def record_coalesced(self):
+        with self._cond:
+            self.coalesced_count += 1
+
+    def cancel(self, predicate):
+        """Cancel every queued item for which predicate(item) is true"""
+        cancelled = 0
+        with self._cond:
+            for key, item in list(self._by_key.items()):
+                if predicate(item):
+                    item.cancelled = True
+                    del self._by_key[key]
+                    cancelled += 1
+        return cancelled
+
+    def clear(self):
+        with self._cond:
+            for item in self._by_key.values():
+                item.cancelled = True
+            self._heap = []
+            self._by_key = {}
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def get_stats(self):
+        with self._cond:
+            return {
+                "queued": len(self._by_key),
+                "enqueued": self.enqueued_count,
+                "dropped": self.dropped_count,
+                "coalesced": self.coalesced_count,
+            }
+
+    def _push(self, item):
+        self._by_key[item.key] = item
+        heapq.heappush(self._heap, (-item.priority, next(self._counter), item))
+
+    def _pop_fresh(self):
+        now = time.monotonic()
+        while self._heap:
+            _, _, item = heapq.heappop(self._heap)
+            if item.cancelled:
+                continue
+
+            del self._by_key[item.key]
+
+            if item.is_stale(now):
+                self.dropped_count += 1
+                logger.debug(f"Dropping stale speech {item}")
+                continue
+
+            return item
+        return None
+
+    def _lowest_priority_item(self):
+        # Lowest priority, and among equals the oldest one
+        victim = None
+        for item in self._by_key.values():
+            if victim is None or (item.priority, item.created_at) < (victim.priority, victim.created_at):
+                victim = item
+        return victim
@@ -0,0 +1,356 @@
+# core/stabilizer.py
+import time
+import numpy as np
+
+NO_CLASS = -1
+
+
+class RingBuffer:
+    """Fixed-size buffer of recent (class index, confidence, timestamp) votes"""
+
+    def __init__(self, size):
+        self.resize(size)
+
+    def resize(self, size):
+        self.size = max(1, int(size))
+        self.indices = np.full(self.size, NO_CLASS, dtype=np.int32)
+        self.confidences = np.zeros(self.size, dtype=np.float32)
+        self.timestamps = np.zeros(self.size, dtype=np.float64)
+        self.position = 0
+        self.count = 0
+
+    def push(self, index, confidence, timestamp):
+        self.indices[self.position] = index
+        self.confidences[self.position] = confidence
+        self.timestamps[self.position] = timestamp
+        self.position = (self.position + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def clear(self):
+        self.indices.fill(NO_CLASS)
+        self.confidences.fill(0.0)
+        self.position = 0
+        self.count = 0
+
+    @property
+    def full(self):
+        return self.count == self.size
+
+    def latest(self):
+        if self.count == 0:
+            return NO_CLASS
+        return int(self.indices[self.position - 1])
+
+    def scores(self, mask=None):
+        """Summed confidence per class over the filled slots"""
+        valid = self.indices >= 0
+        if mask is not None:
+            valid &= mask
+        if not valid.any():
+            return np.zeros(0, dtype=np.float64), 0
+        return np.bincount(self.indices[valid], weights=self.confidences[valid]), int(valid.sum())
+
+
+class Stabilizer:
+    """
+    Turns per-frame predictions into a stable decision
+
+    update() is called once per classified frame and returns the current
+    decision as a class index, or None while there is no stable class.
+
+    By default the decision is taken over the last `window` frames. With
+    window_seconds set it is taken over the votes of the last
+    window_seconds instead, so commit latency does not depend on the frame
+    rate: nothing is decided until votes span the whole window, and
+    min_samples votes are still required inside it.
+    """
+
+    name = "base"
+
+    def __init__(self, window=5, window_seconds=None, min_samples=None, capacity=64):
+        self.capacity = capacity
+        self.current = None
+        self.configure(window, window_seconds, min_samples)
+
+    def configure(self, window=5, window_seconds=None, min_samples=None):
+        self.frame_window = max(1, int(window))
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self.buffer = RingBuffer(self.frame_window if window_seconds is None else self.capacity)
+        self.current = None
+        self._first_vote = None
+
+    @property
+    def window(self):
+        return self.frame_window
+
+    def resize(self, window):
+        self.configure(window, self.window_seconds, self.min_samples)
+
+    def set_time_window(self, window_seconds, min_samples=None):
+        self.configure(self.frame_window, window_seconds, min_samples)
+
+    def reset(self):
+        self.buffer.clear()
+        self.current = None
+        self._first_vote = None
+
+    def update(self, index, confidence, timestamp=None):
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self._first_vote is None:
+            self._first_vote = timestamp
+
+        self.buffer.push(index, confidence, timestamp)
+
+        # Half a microsecond of slack for float timestamps
+        if self.window_seconds is not None and timestamp - self._first_vote < self.window_seconds - 5e-7:
+            return self.current
+
+        self.current = self.decide()
+        return self.current
+
+    def recent(self):
+        """Mask of buffered votes inside the time window, or None in frame mode"""
+        if self.window_seconds is None or self.buffer.count == 0:
+            return None
+        latest = self.buffer.timestamps[self.buffer.position - 1]
+        mask = self.buffer.timestamps >= latest - self.window_seconds
+
+        # At low frame rates the window stretches back to hold min_samples votes
+        if self.min_samples:
+            newest = (self.buffer.position - 1 - np.arange(min(self.min_samples, self.buffer.count))) % self.buffer.size
+            mask[newest] = True
+        return mask
+
+    def required_samples(self, default):
+        return self.min_samples if self.min_samples is not None else default
+
+    def decide(self):
+        raise NotImplementedError
+
+
+class ConsecutiveStabilizer(Stabilizer):
+    """Previous behaviour: the whole window must agree on one class"""
+
+    name = "consecutive"
+
+    def decide(self):
+        mask = self.recent()
+        if mask is None:
+            if not self.buffer.full:
+                return self.current
+            indices = self.buffer.indices
+        else:
+            indices = self.buffer.indices[mask & (self.buffer.indices >= 0)]
+            if len(indices) < max(1, self.required_samples(1)):
+                return self.current
+
+        if np.all(indices == indices[0]):
+            return int(indices[0])
+        return None
+
+
+class WeightedVoteStabilizer(Stabilizer):
+    """
+    Confidence-weighted majority over the window
+
+    A class wins once it holds at least vote_ratio of the total confidence
+    in the window and the window has enough votes, so a single noisy frame
+    no longer resets the decision. The current class is kept while it
+    still leads the window, even below vote_ratio, so a burst of noise
+    does not clear and then re-commit the same letter.
+    """
+
+    name = "weighted"
+
+    def __init__(self, window=5, vote_ratio=0.6, **kwargs):
+        super().__init__(window, **kwargs)
+        self.vote_ratio = vote_ratio
+
+    def decide(self):
+        scores, votes = self.buffer.scores(self.recent())
+        if votes < self.required_samples((self.window + 1) // 2) or scores.sum() <= 0:
+            return self.current
+
+        winner = int(np.argmax(scores))
+        if scores[winner] >= self.vote_ratio * scores.sum() or winner == self.current:
+            return winner
+        return None
+
+
+class HysteresisStabilizer(Stabilizer):
+    """
+    Weighted vote with separate thresholds for switching and holding
+
+    A new class is committed when its share of the window's confidence
+    reaches enter_ratio. The committed class is kept until its share drops
+    below exit_ratio, which stops flicker between similar letters.
+    """
+
+    name = "hysteresis"
+
+    def __init__(self, window=5, enter_ratio=0.6, exit_ratio=0.35, **kwargs):
+        super().__init__(window, **kwargs)
+        self.enter_ratio = enter_ratio
+        self.exit_ratio = exit_ratio
+
+    def decide(self):
+        scores, votes = self.buffer.scores(self.recent())
+        total = scores.sum()
+        if votes < self.required_samples((self.window + 1) // 2) or total <= 0:
+            return self.current
+
+        if self.current is not None and self.current < len(scores):
+            if scores[self.current] >= self.exit_ratio * total:
+                return self.current
+
+        winner = int(np.argmax(scores))
+        if scores[winner] >= self.enter_ratio * total:
+            return winner
+        return None
+
+
+STABILIZERS = {
+    ConsecutiveStabilizer.name: ConsecutiveStabilizer,
+    WeightedVoteStabilizer.name: WeightedVoteStabilizer,
+    HysteresisStabilizer.name: HysteresisStabilizer,
+}
+
+
+def create_stabilizer(name="weighted", window=5, **kwargs):
+    """
+    Create a stabilizer by name
+
+    Args:
+        name: One of STABILIZERS
+        window: Number of frames to vote over
+        **kwargs: window_seconds, min_samples and strategy specific options
+
+    Returns:
+        Stabilizer instance
+    """
+    if name not in STABILIZERS:
+        raise ValueError(f"Unknown stabilizer: {name}")
+    return STABILIZERS[name](window=window, **kwargs)
+
+
+def time_to_letter(stabilizer, frames, target):
+    """
+    Replay frames through a stabilizer
+
+    Args:
+        stabilizer: Stabilizer instance, reset before the replay
+        frames: Iterable of (timestamp, class_index, confidence); class_index
+            is NO_CLASS for frames without a confident prediction
+        target: Class index the signer was holding
+
+    Returns:
+        Tuple (seconds until the target was first decided or None,
+        number of decisions for other classes)
+    """
+    stabilizer.reset()
+    start = None
+    wrong = 0
+    previous = None
+
+    for timestamp, index, confidence in frames:
+        if start is None:
+            start = timestamp
+        if index == NO_CLASS:
+            continue
+
+        decision = stabilizer.update(index, confidence, timestamp)
+        if decision is not None and decision != previous:
+            if decision == target:
+                return timestamp - start, wrong
+            wrong += 1
+        previous = decision
+
+    return None, wrong
+
+
+def benchmark_stabilizers(sessions, stabilizers):
+    """
+    Compare stabilizers on recorded sessions
+
+    Args:
+        sessions: List of {"target": index, "frames": [[t, index, conf], ...]}
+        stabilizers: List of Stabilizer instances
+
+    Returns:
+        List of result dictionaries, one per stabilizer
+    """
+    results = []
+
+    for stabilizer in stabilizers:
+        times = []
+        wrong = 0
+        missed = 0
+
+        for session in sessions:
+            elapsed, errors = time_to_letter(stabilizer, session["frames"], session["target"])
+            wrong += errors
+            if elapsed is None:
+                missed += 1
+            else:
+                times.append(elapsed)
+
+        times.sort()
+        results.append({
+            "stabilizer": stabilizer.name,
+            "window": stabilizer.window,
+            "window_seconds": stabilizer.window_seconds,
+            "sessions": len(sessions),
+            "missed": missed,
+            "wrong_commits": wrong,
+            "time_to_letter_p50": times[len(times) // 2] if times else None,
+            "time_to_letter_mean": sum(times) / len(times) if times else None,
+        })
+
+    return results
+
+
+def synthetic_sessions(count=200, classes=26, fps=30.0, duration=2.0, noise=0.2, seed=0):
+    """Noisy sessions of a held sign, for benchmarking without recordings"""
+    rng = np.random.default_rng(seed)
+    sessions = []
+
+    for _ in range(count):
+        target = int(rng.integers(classes))
+        frames = []
+        for i in range(int(duration * fps)):
+            if rng.random() < noise:
+                index = int(rng.integers(classes))
+                confidence = float(rng.uniform(0.6, 0.8))
+            else:
+                index = target
+                confidence = float(rng.uniform(0.7, 1.0))
+            frames.append((i / fps, index, confidence))
+        sessions.append({"target": target, "frames": frames})
+
+    return sessions
+
+
+if __name__ == "__main__":
+    import sys
+    import json
+
+    if len(sys.argv) > 1:
+        sessions = []
+        for path in sys.argv[1:]:
+            with open(path, "r") as f:
+                data = json.load(f)
+            sessions.extend(data if isinstance(data, list) else [data])
+
+    candidates = [create_stabilizer(name, window=5) for name in STABILIZERS]
+    candidates += [create_stabilizer(name, window_seconds=0.2, min_samples=3) for name in STABILIZERS]
+
+    if len(sys.argv) > 1:
+        for result in benchmark_stabilizers(sessions, candidates):
+            print(json.dumps(result))
+    else:
+        # Frame windows get slower as the frame rate drops, time windows do not
+        for fps in (10.0, 30.0, 60.0):
+            for result in benchmark_stabilizers(synthetic_sessions(fps=fps), candidates):
+                print(json.dumps({"fps": fps, **result}))
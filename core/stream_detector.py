@@ -0,0 +1,277 @@
+# core/stream_detector.py
+import sys
+import json
+import time
+import queue
+import logging
+import threading
+from core.decision import Transcript
+from utils.frame_sources import open_source
+
+logger = logging.getLogger(__name__)
+
+
+class EventWriter:
+    """
+    Writes events as JSON lines from a background thread
+
+    Each event is written and flushed on its own, so a reader sees it as
+    soon as it happens. The queue is bounded: backlogged tells the
+    producer that the reader is not keeping up.
+
+    Args:
+        stream: Text stream to write to
+        max_pending: Events that may wait before the writer is backlogged
+    """
+
+    def __init__(self, stream, max_pending=64):
+        self.stream = stream
+        self.max_pending = max_pending
+        self.queue = queue.Queue()
+        self.closed = threading.Event()
+        self.written = 0
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    @property
+    def backlogged(self):
+        return self.queue.qsize() >= self.max_pending
+
+    def write(self, event):
+        if not self.closed.is_set():
+            self.queue.put(json.dumps(event, separators=(",", ":")) + "\n")
+
+    def _run(self):
+        while True:
+            line = self.queue.get()
+            if line is None:
+                return
+            if self.closed.is_set():
+                continue
+            try:
+                self.stream.write(line)
+                self.stream.flush()
+                self.written += 1
+            except (BrokenPipeError, ValueError):
+                # The reader went away; stop writing but keep draining
+                self.closed.set()
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+
+class LatestFrame:
+    """
+    Single-slot hand-off from the capture thread to the detector
+
+    A live camera cannot wait, so a frame that has not been picked up
+    when the next one arrives is dropped.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.item = None
+        self.finished = False
+        self.dropped = 0
+
+    def put(self, item):
+        with self.condition:
+            if self.item is not None:
+                self.dropped += 1
+            self.item = item
+            self.condition.notify()
+
+    def finish(self):
+        with self.condition:
+            self.finished = True
+            self.condition.notify()
+
+    def get(self):
+        with self.condition:
+            while self.item is None and not self.finished:
+                self.condition.wait()
+            item, self.item = self.item, None
+            return item
+
+
+class StreamDetector:
+    """
+    Runs the detector over a frame source and emits events
+
+    Events: "start", "hand_found", "hand_lost", "prediction" (every
+    classified frame, with raw and stabilized prediction and per-stage
+    timings in ms), "letter", "word" and "end".
+
+    A live source never waits: when the detector falls behind only the
+    newest frame is kept, and frames are skipped while the writer is
+    backlogged. File sources wait for the reader instead. Frame events
+    carry the number of frames dropped so far.
+
+    Args:
+        detector: SignLanguageDetector instance
+        writer: EventWriter
+        word_gap: Seconds without a hand that end a word
+    """
+
+    def __init__(self, detector, writer, word_gap=0.5):
+        self.detector = detector
+        self.writer = writer
+        self.transcript = Transcript(word_gap=word_gap)
+        self.hand_visible = False
+        self.frames = 0
+        self.dropped = 0
+
+    def _capture(self, source, slot, stop):
+        try:
+            while not stop.is_set():
+                start = time.perf_counter()
+                item = source.read()
+                if item is None:
+                    break
+                slot.put((item[0], item[1], (time.perf_counter() - start) * 1000.0))
+        except Exception as e:
+            logger.error(f"Frame source failed: {e}")
+        finally:
+            slot.finish()
+
+    def run(self, source):
+        """
+        Process the source until it ends, the reader goes away or the
+        caller interrupts
+
+        Returns:
+            Stats dictionary, also emitted as the "end" event
+        """
+        self.writer.write({"type": "start", "source": source.name, "live": source.live, "t": time.time()})
+        start_time = time.perf_counter()
+
+        slot = None
+        capture = None
+        stop = threading.Event()
+        if source.live:
+            slot = LatestFrame()
+            capture = threading.Thread(target=self._capture, args=(source, slot, stop), daemon=True)
+            capture.start()
+
+        try:
+            while not self.writer.closed.is_set():
+                if slot is not None:
+                    item = slot.get()
+                    if item is None:
+                        break
+                    frame, timestamp, capture_ms = item
+                else:
+                    capture_start = time.perf_counter()
+                    item = source.read()
+                    if item is None:
+                        break
+                    frame, timestamp = item
+                    capture_ms = (time.perf_counter() - capture_start) * 1000.0
+
+                if self.writer.backlogged:
+                    if source.live:
+                        self.dropped += 1
+                        continue
+                    # Files have no deadline, so wait for the reader instead of losing frames
+                    while self.writer.backlogged and not self.writer.closed.is_set():
+                        time.sleep(0.005)
+
+                self.process(frame, timestamp, capture_ms, (slot.dropped if slot else 0) + self.dropped)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+            # The caller closes the source next, which must not happen inside read()
+            if capture is not None:
+                capture.join()
+
+        wall_time = time.perf_counter() - start_time
+        stats = {
+            "type": "end",
+            "frames": self.frames,
+            "dropped": (slot.dropped if slot else 0) + self.dropped,
+            "wall_seconds": round(wall_time, 3),
+            "frames_per_second": round(self.frames / wall_time, 2) if wall_time > 0 else 0.0,
+            "transcript": self.transcript.result(),
+        }
+        self.writer.write(stats)
+        return stats
+
+    def process(self, frame, timestamp, capture_ms=0.0, dropped=0):
+        info = {}
+        start = time.perf_counter()
+        _, landmarks, prediction, confidence = self.detector.process_frame(frame, timestamp, draw=False, info=info)
+        total_ms = (time.perf_counter() - start) * 1000.0
+        self.frames += 1
+
+        hand = bool(landmarks)
+        if hand != self.hand_visible:
+            self.hand_visible = hand
+            event = {"type": "hand_found" if hand else "hand_lost", "t": timestamp}
+            if hand:
+                event["handedness"] = info.get("handedness")
+            self.writer.write(event)
+
+        text_before = self.transcript.text
+        letter = self.transcript.update(prediction, timestamp, hand)
+
+        if hand:
+            self.writer.write({
+                "type": "prediction",
+                "t": timestamp,
+                "frame": self.frames - 1,
+                "raw": info.get("raw_prediction"),
+                "raw_confidence": round(info.get("raw_confidence", 0.0), 4),
+                "prediction": str(prediction) if prediction is not None else None,
+                "confidence": round(confidence, 4),
+                "dropped": dropped,
+                "timings_ms": {
+                    "capture": round(capture_ms, 2),
+                    "landmarks": round(info.get("landmarks_ms", 0.0), 2),
+                    "classify": round(info.get("classify_ms", 0.0), 2),
+                    "decision": round(info.get("decision_ms", 0.0), 2),
+                    "total": round(total_ms, 2),
+                },
+            })
+
+        if letter is not None:
+            self.writer.write({"type": "letter", "t": timestamp, "letter": letter, "phrase": self.transcript.result()})
+        elif self.transcript.text != text_before:
+            self.writer.write({"type": "word", "t": timestamp, "phrase": self.transcript.result()})
+
+
+def add_arguments(parser):
+    parser.add_argument("source", nargs="?", default="0",
+                        help="Camera index, video file or image folder (default: camera 0)")
+    parser.add_argument("--model", default="./models/sign_language_model.tflite", help="TFLite model path")
+    parser.add_argument("--class-names", default="./models/class_names.npy", help="Class names file")
+    parser.add_argument("--fps", type=float, default=30.0,
+                        help="Frame rate of image folders and videos that do not report one")
+    parser.add_argument("--max-pending", type=int, default=64,
+                        help="Unwritten events before frames are dropped")
+
+
+def run(args):
+    # Anything printed while detecting goes to stderr so stdout stays valid JSONL
+    out = sys.stdout
+    sys.stdout = sys.stderr
+
+    try:
+        from core.detector import SignLanguageDetector
+        from utils.settings_service import get_settings_service
+
+        detector = SignLanguageDetector(model_path=args.model, class_names_path=args.class_names)
+        detector.set_debug_mode(False)
+        detector.apply_settings(get_settings_service().get_all())
+
+        writer = EventWriter(out, max_pending=args.max_pending)
+        with open_source(args.source, fps=args.fps) as source:
+            stats = StreamDetector(detector, writer).run(source)
+        writer.close()
+        detector.stop_recording()
+    finally:
+        sys.stdout = out
+
+    print(f"Streamed {stats['frames']} frames, dropped {stats['dropped']}", file=sys.stderr)
+    return 0
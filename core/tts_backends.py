@@ -0,0 +1,375 @@
+# core/tts_backends.py
+import os
+import re
+import time
+import wave
+import threading
+import logging
+
+try:
+    import pyttsx3
+except ImportError:
+    pyttsx3 = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 170
+DEFAULT_VOLUME = 0.9
+
+
+class SpeechResult:
+    """Timing information for one synthesized utterance"""
+
+    def __init__(self, text, success, synthesis_time=0.0, audio_duration=0.0, error=None):
+        self.text = text
+        self.success = success
+        self.synthesis_time = synthesis_time
+        self.audio_duration = audio_duration
+        self.error = error
+
+    def to_dict(self):
+        return {
+            "text": self.text,
+            "success": self.success,
+            "synthesis_time": self.synthesis_time,
+            "audio_duration": self.audio_duration,
+            "error": self.error,
+        }
+
+    def __repr__(self):
+        return (f"SpeechResult({self.text!r}, success={self.success}, "
+                f"synthesis={self.synthesis_time:.3f}s, audio={self.audio_duration:.3f}s)")
+
+
+def estimate_speech_duration(text, rate=DEFAULT_RATE):
+    """
+    Estimate how long text takes to speak
+
+    Args:
+        text: Text to speak
+        rate: Speaking rate in words per minute
+
+    Returns:
+        Estimated duration in seconds
+    """
+    words = len(re.findall(r"\w+", text))
+    return words * 60.0 / max(1, rate)
+
+
+class TTSBackend:
+    """Base class for speech output backends"""
+
+    name = "base"
+
+    def probe(self):
+        """
+        Check whether the backend can be used, without producing audio
+
+        Returns:
+            Dictionary with at least an "available" key
+        """
+        return {"available": True}
+
+    def speak(self, text):
+        """Synthesize and play text, returning a SpeechResult"""
+        raise NotImplementedError
+
+    def stop(self):
+        """Interrupt the utterance currently being spoken, if any"""
+        return False
+
+    def close(self):
+        pass
+
+
+class Pyttsx3Backend(TTSBackend):
+    """Speaks through the system speech engine via pyttsx3"""
+
+    name = "pyttsx3"
+
+    def __init__(self, rate=DEFAULT_RATE, volume=DEFAULT_VOLUME):
+        self.rate = rate
+        self.volume = volume
+        self._engine = None
+        self._lock = threading.Lock()
+
+    def _create_engine(self):
+        if pyttsx3 is None:
+            raise RuntimeError("pyttsx3 is not installed")
+
+        engine = pyttsx3.init()
+        engine.setProperty('rate', self.rate)
+        engine.setProperty('volume', self.volume)
+        return engine
+
+    def probe(self):
+        if pyttsx3 is None:
+            return {"available": False, "error": "pyttsx3 is not installed"}
+
+        engine = pyttsx3.init()
+
+        voices = engine.getProperty('voices') or []
+        driver = getattr(getattr(engine, 'proxy', None), '_driver', None)
+        driver_name = type(driver).__module__.split('.')[-1] if driver is not None else None
+
+        return {
+            "available": len(voices) > 0,
+            "driver": driver_name,
+            "voices": [getattr(voice, 'id', str(voice)) for voice in voices],
+        }
+
+    def speak(self, text):
+        timings = {}
+
+        try:
+            engine = self._create_engine()
+
+            def on_start(name):
+                timings.setdefault("started", time.perf_counter())
+
+            def on_finish(name, completed):
+                timings["finished"] = time.perf_counter()
+
+            callbacks = [
+                engine.connect('started-utterance', on_start),
+                engine.connect('finished-utterance', on_finish),
+            ]
+
+            with self._lock:
+                self._engine = engine
+
+            start = time.perf_counter()
+            engine.say(text)
+            engine.runAndWait()
+            end = time.perf_counter()
+
+            for token in callbacks:
+                engine.disconnect(token)
+            engine.stop()
+
+            # Without driver callbacks we can only report the total time
+            started = timings.get("started", start)
+            finished = timings.get("finished", end)
+
+            return SpeechResult(text, True,
+                                synthesis_time=started - start,
+                                audio_duration=finished - started)
+
+        except Exception as e:
+            logger.error(f"Error speaking text '{text}': {e}")
+            return SpeechResult(text, False, error=str(e))
+
+        finally:
+            with self._lock:
+                self._engine = None
+
+    def stop(self):
+        with self._lock:
+            if self._engine is None:
+                return False
+            self._engine.stop()
+        return True
+
+
+class WavFileBackend(TTSBackend):
+    """
+    Renders speech to WAV files instead of the sound card.
+
+    Uses the system speech engine's file output, so it works on machines
+    without audio hardware and measures real synthesis time.
+    """
+
+    name = "wav"
+
+    def __init__(self, output_dir="exports/tts", rate=DEFAULT_RATE, volume=DEFAULT_VOLUME,
+                 keep_files=True):
+        self.output_dir = output_dir
+        self.rate = rate
+        self.volume = volume
+        self.keep_files = keep_files
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def probe(self):
+        if pyttsx3 is None:
+            return {"available": False, "error": "pyttsx3 is not installed"}
+
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+        except OSError as e:
+            return {"available": False, "error": str(e)}
+
+        return {"available": True, "output_dir": self.output_dir}
+
+    def _next_path(self):
+        with self._lock:
+            self._counter += 1
+            index = self._counter
+        return os.path.join(self.output_dir, f"utterance_{index:05d}.wav")
+
+    def speak(self, text):
+        path = self._next_path()
+
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+
+            engine = pyttsx3.init()
+            engine.setProperty('rate', self.rate)
+            engine.setProperty('volume', self.volume)
+
+            start = time.perf_counter()
+            engine.save_to_file(text, path)
+            engine.runAndWait()
+            synthesis_time = time.perf_counter() - start
+            engine.stop()
+
+            audio_duration = wav_duration(path)
+
+            if not self.keep_files:
+                os.remove(path)
+
+            return SpeechResult(text, True,
+                                synthesis_time=synthesis_time,
+                                audio_duration=audio_duration)
+
+        except Exception as e:
+            logger.error(f"Error rendering text '{text}' to {path}: {e}")
+            return SpeechResult(text, False, error=str(e))
+
+
+class NullBackend(TTSBackend):
+    """
+    Records utterances without producing audio.
+
+    Audio duration is estimated from the speaking rate. With realtime=True
+    speak() also waits for that long, so queueing and interruption behave
+    as they would with a real engine.
+    """
+
+    name = "null"
+
+    def __init__(self, rate=DEFAULT_RATE, realtime=False):
+        self.rate = rate
+        self.realtime = realtime
+        self.spoken = []
+        self._interrupt = threading.Event()
+
+    def speak(self, text):
+        start = time.perf_counter()
+        duration = estimate_speech_duration(text, self.rate)
+
+        # A stop() that arrived before speak() cuts this utterance short too
+        if self.realtime:
+            interrupted = self._interrupt.wait(duration)
+        else:
+            interrupted = self._interrupt.is_set()
+        if interrupted:
+            self._interrupt.clear()
+            duration = time.perf_counter() - start
+
+        self.spoken.append(text)
+        return SpeechResult(text, True, synthesis_time=0.0, audio_duration=duration)
+
+    def stop(self):
+        self._interrupt.set()
+        return True
+
+
+def wav_duration(path):
+    """
+    Get duration of a WAV file
+
+    Args:
+        path: Path to WAV file
+
+    Returns:
+        Duration in seconds
+    """
+    with wave.open(path, "rb") as wav:
+        frames = wav.getnframes()
+        rate = wav.getframerate()
+    return frames / float(rate) if rate else 0.0
+
+
+def create_backend(name, **kwargs):
+    """
+    Create a TTS backend by name
+
+    Args:
+        name: "pyttsx3", "wav" or "null"
+        **kwargs: Backend specific options
+
+    Returns:
+        TTSBackend instance
+    """
+    backends = {
+        Pyttsx3Backend.name: Pyttsx3Backend,
+        WavFileBackend.name: WavFileBackend,
+        NullBackend.name: NullBackend,
+    }
+
+    if name not in backends:
+        raise ValueError(f"Unknown TTS backend: {name}")
+
+    return backends[name](**kwargs)
+
+
+def benchmark_backend(backend, texts, repeats=3):
+    """
+    Measure synthesis latency and throughput of a backend
+
+    Args:
+        backend: TTSBackend instance
+        texts: List of texts to speak
+        repeats: How many times to speak each text
+
+    Returns:
+        Dictionary with latency and throughput statistics
+    """
+    results = []
+    start = time.perf_counter()
+
+    for _ in range(repeats):
+        for text in texts:
+            results.append(backend.speak(text))
+
+    wall_time = time.perf_counter() - start
+    ok = [r for r in results if r.success]
+
+    synthesis = sorted(r.synthesis_time for r in ok)
+    audio = sum(r.audio_duration for r in ok)
+
+    def percentile(values, q):
+        if not values:
+            return 0.0
+        index = min(len(values) - 1, int(round(q * (len(values) - 1))))
+        return values[index]
+
+    return {
+        "backend": backend.name,
+        "utterances": len(results),
+        "failures": len(results) - len(ok),
+        "synthesis_p50": percentile(synthesis, 0.5),
+        "synthesis_p95": percentile(synthesis, 0.95),
+        "audio_seconds": audio,
+        "wall_seconds": wall_time,
+        "utterances_per_second": len(results) / wall_time if wall_time > 0 else 0.0,
+        "real_time_factor": wall_time / audio if audio > 0 else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    import json
+
+    backend_name = sys.argv[1] if len(sys.argv) > 1 else "null"
+    sample_texts = [
+        "letter A",
+        "Hello",
+        "How are you today",
+        "The quick brown fox jumps over the lazy dog",
+    ]
+
+    backend = create_backend(backend_name)
+    print(f"Probe: {backend.probe()}")
+    print(json.dumps(benchmark_backend(backend, sample_texts), indent=2))
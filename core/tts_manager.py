@@ -1,23 +1,131 @@
 # core/tts_manager.py
-import pyttsx3
 import threading
-import queue
 import time
+import json
+import os
+import re
+import sys
+import itertools
 import logging
+from collections import deque
+from core.speech_scheduler import (
+    SpeechItem, SpeechScheduler,
+    PRIORITY_LETTER, PRIORITY_NORMAL, PRIORITY_PHRASE
+)
+from core.tts_backends import Pyttsx3Backend, NullBackend
 
 logger = logging.getLogger(__name__)
 
+PROBE_CACHE_PATH = "data/tts_probe.json"
+PROBE_CACHE_MAX_AGE = 7 * 24 * 3600
+
+FIRST_CHUNK_WORDS = 6
+MAX_CHUNK_WORDS = 16
+
+def split_into_chunks(text, first_chunk_words=FIRST_CHUNK_WORDS, max_chunk_words=MAX_CHUNK_WORDS):
+    """
+    Split text into sentence or clause sized chunks for streaming speech
+    
+    The first chunk is kept short so the time until the first word is heard
+    does not depend on the length of the text.
+    
+    Args:
+        text: Text to split
+        first_chunk_words: Maximum number of words in the first chunk
+        max_chunk_words: Maximum number of words in every other chunk
+        
+    Returns:
+        List of non-empty chunk strings
+    """
+    clauses = [c.strip() for c in re.split(r"(?<=[.!?;:,])\s+|\n+", text) if c.strip()]
+    
+    chunks = []
+    for clause in clauses:
+        words = clause.split()
+        while words:
+            limit = first_chunk_words if not chunks else max_chunk_words
+            chunks.append(" ".join(words[:limit]))
+            words = words[limit:]
+    
+    return chunks
+
+
+class Utterance:
+    """A phrase being spoken chunk by chunk"""
+    
+    def __init__(self, utterance_id, text, chunks):
+        self.utterance_id = utterance_id
+        self.text = text
+        self.chunks = chunks
+        self.next_index = 0
+        self.cancelled = False
+        self.created_at = time.monotonic()
+        self.first_audio_at = None
+        self.finished_at = None
+    
+    @property
+    def done(self):
+        return self.cancelled or self.next_index >= len(self.chunks)
+    
+    def get_metrics(self):
+        return {
+            "utterance_id": self.utterance_id,
+            "characters": len(self.text),
+            "chunks": len(self.chunks),
+            "spoken_chunks": self.next_index,
+            "cancelled": self.cancelled,
+            "time_to_first_audio": (self.first_audio_at - self.created_at
+                                    if self.first_audio_at is not None else None),
+            "total_time": (self.finished_at - self.created_at
+                           if self.finished_at is not None else None),
+        }
+
+
 class TTSManager:
-    def __init__(self):
+    def __init__(self, max_queue_size=8, letter_ttl=2.0, speech_ttl=10.0, phrase_ttl=None,
+                 probe_timeout=3.0, probe_cache_path=PROBE_CACHE_PATH, backend=None):
         logger.info("Initializing TTS Manager...")
         
-        self.is_available = self._test_tts()
+        self.primary_backend = backend if backend is not None else Pyttsx3Backend()
+        self.backend = self.primary_backend
+        self.has_audio = True
         
-        if not self.is_available:
-            logger.error("TTS is not available on this system")
-            return
+        # Seconds an item may wait before it is considered stale (None = never)
+        self.ttl_by_priority = {
+            PRIORITY_LETTER: letter_ttl,
+            PRIORITY_NORMAL: speech_ttl,
+            PRIORITY_PHRASE: phrase_ttl,
+        }
+        
+        self.speech_queue = SpeechScheduler(max_size=max_queue_size)
+        self.is_running = False
+        
+        self._current_item = None
+        self._interrupted = threading.Event()
+        self.interrupted_count = 0
+        self.spoken_count = 0
+        self.recent_results = deque(maxlen=100)
+        
+        self._utterance_ids = itertools.count(1)
+        self._utterances = {}
+        self.utterance_metrics = deque(maxlen=50)
+        
+        self.probe_timeout = probe_timeout
+        self.probe_cache_path = probe_cache_path
+        self.probe_result = None
+        self._probe_done = threading.Event()
+        
+        # Trust a cached successful probe straight away; otherwise assume TTS
+        # works and let the background probe correct us before anything is spoken.
+        cached = self._load_probe_cache()
+        self.is_available = True
+        if cached is not None:
+            self.probe_result = cached
+            logger.info("Using cached TTS probe result")
+            self._probe_done.set()
+        else:
+            threading.Thread(target=self._run_probe, daemon=True).start()
         
-        self.speech_queue = queue.Queue()
         self.is_running = True
         
         self.worker_thread = threading.Thread(target=self._process_queue, daemon=True)
@@ -25,66 +133,213 @@ class TTSManager:
         
         logger.info("TTS Manager initialized and ready")
     
-    def _test_tts(self):
+    def _fall_back_to_null_backend(self):
+        # Keep the speech pipeline running silently rather than disabling it
+        logger.error(f"TTS backend '{self.backend.name}' is not available, speech will not be audible")
+        self.backend = NullBackend()
+        self.has_audio = False
+    
+    def _run_probe(self):
+        result = {}
+        
+        def probe():
+            try:
+                result.update(self.primary_backend.probe())
+            except Exception as e:
+                result.update({"available": False, "error": str(e)})
+        
+        start = time.perf_counter()
+        
+        # The probe runs on its own thread so a hung audio stack can't hold us up
+        probe_thread = threading.Thread(target=probe, daemon=True)
+        probe_thread.start()
+        probe_thread.join(self.probe_timeout)
+        
+        if probe_thread.is_alive():
+            result = {"available": False, "error": f"probe timed out after {self.probe_timeout}s"}
+        
+        result["probe_time"] = time.perf_counter() - start
+        
+        self.probe_result = result
+        
+        if result["available"]:
+            logger.info(f"TTS probe successful: backend={self.primary_backend.name}, "
+                        f"driver={result.get('driver')} ({result['probe_time']:.3f}s)")
+            self.backend = self.primary_backend
+            self.has_audio = True
+            self._save_probe_cache(result)
+        else:
+            # Failures are not cached so the next launch (or self_test) tries again
+            logger.error(f"TTS probe failed: {result.get('error', 'no voices found')}")
+            if self.backend is self.primary_backend:
+                self._fall_back_to_null_backend()
+        
+        self._probe_done.set()
+        return result
+    
+    def _probe_cache_key(self):
+        return {
+            "platform": sys.platform,
+            "backend": self.primary_backend.name,
+        }
+    
+    def _load_probe_cache(self):
+        if not self.probe_cache_path or not os.path.exists(self.probe_cache_path):
+            return None
+        
         try:
-            engine = pyttsx3.init()
-            engine.setProperty('rate', 170)
-            engine.setProperty('volume', 0.9)
+            with open(self.probe_cache_path, "r") as f:
+                cached = json.load(f)
             
-            engine.say("test")
-            engine.runAndWait()
-            engine.stop()
+            if cached.get("key") != self._probe_cache_key():
+                return None
+            if time.time() - cached.get("timestamp", 0) > PROBE_CACHE_MAX_AGE:
+                return None
+            if not cached["result"].get("available"):
+                return None
             
-            logger.info("TTS test successful")
-            return True
+            return cached["result"]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable TTS probe cache: {e}")
+            return None
+    
+    def _save_probe_cache(self, result):
+        if not self.probe_cache_path:
+            return
+        
+        try:
+            directory = os.path.dirname(self.probe_cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
             
+            with open(self.probe_cache_path, "w") as f:
+                json.dump({
+                    "key": self._probe_cache_key(),
+                    "timestamp": time.time(),
+                    "result": result,
+                }, f, indent=2)
         except Exception as e:
-            logger.error(f"TTS test failed: {e}")
-            return False
+            logger.warning(f"Could not save TTS probe cache: {e}")
+    
+    def wait_until_ready(self, timeout=None):
+        """Block until the availability probe has finished"""
+        self._probe_done.wait(timeout)
+        return self.has_audio
+    
+    def self_test(self, text="test"):
+        """
+        Run a fresh probe and a full, audible speech test for diagnostics
+        
+        Returns:
+            Dictionary with the probe result, backend and timing of the utterance
+        """
+        self._run_probe()
+        
+        result = self._speak_text(text)
+        
+        return {
+            "probe": self.probe_result,
+            "backend": self.backend.name,
+            "has_audio": self.has_audio,
+            "result": result.to_dict(),
+        }
     
     def _speak_text(self, text):
+        logger.info(f"Speaking: '{text}'")
+        
+        result = self.backend.speak(text)
+        self.recent_results.append(result)
+        
+        if result.success:
+            logger.info(f"Finished speaking: '{text}' "
+                        f"(synthesis {result.synthesis_time:.3f}s, audio {result.audio_duration:.3f}s)")
+        return result
+    
+    def _interrupt_current(self):
+        if self._current_item is None:
+            return False
+        
         try:
-            logger.info(f"Speaking: '{text}'")
+            if not self.backend.stop():
+                return False
+        except Exception as e:
+            logger.error(f"Error interrupting speech: {e}")
+            return False
+        
+        self._interrupted.set()
+        self.interrupted_count += 1
+        return True
+    
+    def _speak_utterance(self, item):
+        utterance = item.utterance
+        
+        while not utterance.done and self.is_running:
+            start = time.monotonic()
+            result = self._speak_text(utterance.chunks[utterance.next_index])
             
-            engine = pyttsx3.init()
-            engine.setProperty('rate', 170)
-            engine.setProperty('volume', 0.9)
+            if utterance.first_audio_at is None and result.success:
+                utterance.first_audio_at = start + result.synthesis_time
             
-            engine.say(text)
-            engine.runAndWait()
-            engine.stop()
+            # An interrupted chunk is repeated when the utterance resumes
+            interrupted = self._interrupted.is_set()
+            self._interrupted.clear()
+            if not interrupted:
+                utterance.next_index += 1
+                if result.success:
+                    self.spoken_count += 1
             
-            logger.info(f"Finished speaking: '{text}'")
-            return True
+            if utterance.done:
+                break
             
-        except Exception as e:
-            logger.error(f"Error speaking text '{text}': {e}")
-            return False
+            next_priority = self.speech_queue.peek_priority()
+            if next_priority is not None and next_priority > item.priority:
+                # Let the more important speech through, then carry on
+                resumed = SpeechItem(
+                    utterance.text, priority=item.priority, ttl=item.ttl,
+                    key=item.key, utterance=utterance
+                )
+                if self.speech_queue.put(resumed) and self.speech_queue.is_queued(resumed):
+                    return
+                
+                # Queue full, or merged into another item with the same text
+                logger.warning(f"Could not re-queue the rest of '{utterance.text}', dropping it")
+                utterance.cancelled = True
+                break
+        
+        utterance.finished_at = time.monotonic()
+        self._utterances.pop(utterance.utterance_id, None)
+        self.utterance_metrics.append(utterance.get_metrics())
     
     def _process_queue(self):
         logger.debug("TTS worker thread started")
         
+        # Nothing is spoken until we know which backend to use
+        self._probe_done.wait(self.probe_timeout + 1.0)
+        
         while self.is_running:
             try:
-                text = self.speech_queue.get(timeout=1)
-                
-                if text is None:
-                    break
-                
-                self._speak_text(text)
+                item = self.speech_queue.get(timeout=1)
                 
-                self.speech_queue.task_done()
+                if item is None:
+                    continue
                 
-            except queue.Empty:
-                continue
+                self._current_item = item
+                if item.utterance is not None:
+                    self._speak_utterance(item)
+                else:
+                    if self._speak_text(item.text).success:
+                        self.spoken_count += 1
+                    self._interrupted.clear()
+                self._current_item = None
                 
             except Exception as e:
                 logger.error(f"Error in TTS worker: {e}")
+                self._current_item = None
                 time.sleep(0.1)
         
         logger.debug("TTS worker thread stopped")
     
-    def speak(self, text):
+    def speak(self, text, priority=PRIORITY_NORMAL, ttl=None, key=None, chunked=False):
         if not self.is_available:
             logger.warning("TTS not available, cannot speak")
             return
@@ -96,40 +351,99 @@ class TTSManager:
         if not text:
             return
         
-        logger.info(f"Queueing speech: '{text}'")
+        if ttl is None:
+            ttl = self.ttl_by_priority.get(priority)
         
-        try:
-            self.speech_queue.put(text, block=False)
-        except queue.Full:
+        utterance = None
+        if chunked:
+            utterance = Utterance(next(self._utterance_ids), text, split_into_chunks(text))
+        
+        item = SpeechItem(text, priority=priority, ttl=ttl, key=key, utterance=utterance)
+        
+        current = self._current_item
+        if current is not None and current.key == item.key and priority <= current.priority:
+            # Already being spoken, no point in saying it again right after
+            self.speech_queue.record_coalesced()
+            return
+        
+        logger.info(f"Queueing speech: '{text}' (priority {priority})")
+        
+        if not self.speech_queue.put(item):
             logger.warning("TTS queue full, dropping speech")
-        except Exception as e:
-            logger.error(f"Error queueing speech: {e}")
+            return
+        
+        if utterance is not None:
+            self._utterances[utterance.utterance_id] = utterance
+        
+        if current is not None and priority > current.priority:
+            logger.info(f"Interrupting '{current.text}' for higher priority speech")
+            self._interrupt_current()
+        
+        return utterance.utterance_id if utterance is not None else None
+    
+    def cancel_utterance(self, utterance_id):
+        """Cancel the remaining chunks of a phrase queued with speak_phrase()"""
+        utterance = self._utterances.pop(utterance_id, None)
+        if utterance is None:
+            return False
+        
+        utterance.cancelled = True
+        self.speech_queue.cancel(lambda item: item.utterance is utterance)
+        
+        current = self._current_item
+        if current is not None and current.utterance is utterance:
+            self._interrupt_current()
+        return True
+    
+    def set_voice(self, rate=None, volume=None):
+        """Change speaking rate and volume, applied from the next utterance"""
+        if rate is not None and hasattr(self.backend, "rate"):
+            self.backend.rate = rate
+        if volume is not None and hasattr(self.backend, "volume"):
+            self.backend.volume = volume
     
     def speak_letter(self, letter):
         if letter and len(letter) == 1 and letter.isalpha():
-            self.speak(f"letter {letter}")
+            self.speak(f"letter {letter}", priority=PRIORITY_LETTER)
     
     def speak_phrase(self, phrase):
-        self.speak(phrase)
+        return self.speak(phrase, priority=PRIORITY_PHRASE, chunked=True)
+    
+    def get_stats(self):
+        stats = self.speech_queue.get_stats()
+        stats["spoken"] = self.spoken_count
+        stats["interrupted"] = self.interrupted_count
+        stats["backend"] = self.backend.name
+        
+        results = [r for r in self.recent_results if r.success]
+        if results:
+            stats["avg_synthesis_time"] = sum(r.synthesis_time for r in results) / len(results)
+            stats["avg_audio_duration"] = sum(r.audio_duration for r in results) / len(results)
+        
+        first_audio = [m["time_to_first_audio"] for m in self.utterance_metrics
+                       if m["time_to_first_audio"] is not None]
+        if first_audio:
+            stats["avg_time_to_first_audio"] = sum(first_audio) / len(first_audio)
+        return stats
     
     def stop(self):
         logger.info("Stopping TTS...")
         
-        while not self.speech_queue.empty():
-            try:
-                self.speech_queue.get_nowait()
-                self.speech_queue.task_done()
-            except queue.Empty:
-                break
+        for utterance in list(self._utterances.values()):
+            utterance.cancelled = True
+        self._utterances.clear()
+        
+        self.speech_queue.clear()
+        self._interrupt_current()
     
     def cleanup(self):
         logger.info("Cleaning up TTS Manager...")
         self.is_running = False
         
-        try:
-            self.speech_queue.put(None, block=False)
-        except:
-            pass
+        self.speech_queue.close()
+        self._interrupt_current()
         
         if hasattr(self, 'worker_thread') and self.worker_thread.is_alive():
-            self.worker_thread.join(timeout=2.0)
\ No newline at end of file
+            self.worker_thread.join(timeout=2.0)
+        
+        self.backend.close()
\ No newline at end of file
@@ -1,9 +1,12 @@
-
-import customtkinter as ctk
-from ui.main_window import MainWindow
+import argparse
+import importlib
 import os
+import sys
 
-def main():
+def run_gui():
+    import customtkinter as ctk
+    from ui.main_window import MainWindow
+    
     ctk.set_appearance_mode("light")
     ctk.set_default_color_theme("blue")
     
@@ -13,6 +16,43 @@ def main():
 
     app = MainWindow()
     app.mainloop()
+    return 0
+
+# name: (module, help). A module provides add_arguments(parser) and run(args).
+COMMANDS = {
+    "transcribe": ("core.batch_transcriber", "Transcribe recorded WAV files"),
+    "build-atlas": ("utils.sign_atlas", "Pack sign images into the thumbnail atlas"),
+    "replay": ("core.replay", "Replay labeled sessions through the decision logic"),
+    "batch": ("core.batch_detector", "Detect signs in video files and image folders"),
+    "stream": ("core.stream_detector", "Stream detections as JSON lines on stdout"),
+    "serve": ("core.classification_server", "Classify landmarks for many clients over a local socket"),
+    "multi": ("core.multi_stream", "Detect signs on several cameras or files at once"),
+}
+
+def build_parser(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(prog="hearme", description="HearMe sign language app")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    # Only the selected command's module is imported, so one command's
+    # dependencies (or the GUI's) are never needed by another
+    selected = next((arg for arg in argv if not arg.startswith("-")), None)
+    for name, (module_name, help_text) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if name == selected:
+            module = importlib.import_module(module_name)
+            module.add_arguments(command_parser)
+            command_parser.set_defaults(handler=module.run)
+    
+    return parser
+
+def main(argv=None):
+    args = build_parser(argv).parse_args(argv)
+    
+    if args.command is None:
+        return run_gui()
+    
+    return args.handler(args)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""Regenerate the WAV fixtures used by the tests"""
+import os
+import wave
+import numpy as np
+
+SAMPLE_RATE = 16000
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def silence(seconds, rng):
+    return rng.normal(0, 20, int(seconds * SAMPLE_RATE))
+
+
+def tone(seconds):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return 3000 * np.sin(2 * np.pi * 200 * t) + 1500 * np.sin(2 * np.pi * 400 * t)
+
+
+def write_wav(name, parts):
+    samples = np.clip(np.concatenate(parts), -32768, 32767).astype(np.int16)
+    with wave.open(os.path.join(HERE, name), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.tobytes())
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+
+    # Speech 1.0-1.6s, then 2.6-2.9s and 3.05-3.35s with a 150 ms pause
+    write_wav("two_phrases.wav", [
+        silence(1.0, rng), tone(0.6), silence(1.0, rng),
+        tone(0.3), silence(0.15, rng), tone(0.3), silence(1.0, rng),
+    ])
+
+    # 2.5 s of uninterrupted speech starting at 0.3s
+    write_wav("long_speech.wav", [silence(0.3, rng), tone(2.5), silence(0.5, rng)])
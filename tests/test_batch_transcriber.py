@@ -0,0 +1,92 @@
+import os
+import sys
+import shutil
+import argparse
+import multiprocessing
+import pytest
+from core import batch_transcriber, speech_recognizer
+from core.batch_transcriber import BatchTranscriber, write_transcripts
+from core.speech_recognizer import RecognizerBackend, RecognitionResult
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+pytestmark = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                                reason="stub backends reach the workers by fork")
+
+
+class StubBackend(RecognizerBackend):
+    """Transcribes a segment as its length in samples"""
+
+    name = "stub"
+
+    def recognize(self, audio):
+        return RecognitionResult(f"{len(audio.frame_data) // 2} samples")
+
+
+class FailingBackend(RecognizerBackend):
+    name = "failing"
+
+    def recognize(self, audio):
+        raise RuntimeError("missing PocketSphinx module")
+
+
+@pytest.fixture(autouse=True)
+def stub_backends(monkeypatch):
+    monkeypatch.setitem(speech_recognizer._BACKEND_CLASSES, "stub", StubBackend)
+    monkeypatch.setitem(speech_recognizer._BACKEND_CLASSES, "failing", FailingBackend)
+
+
+@pytest.fixture
+def same_named_files(tmp_path):
+    paths = []
+    for folder, fixture in (("a", "two_phrases.wav"), ("b", "long_speech.wav")):
+        os.makedirs(tmp_path / folder)
+        path = str(tmp_path / folder / "x.wav")
+        shutil.copy(os.path.join(FIXTURES, fixture), path)
+        paths.append(path)
+    return paths
+
+
+def transcriber(backend, **options):
+    return BatchTranscriber(backend, workers=2, mp_context=multiprocessing.get_context("fork"), **options)
+
+
+def test_transcribes_segments_in_time_order(same_named_files):
+    # One segment in flight per worker still gets through every segment
+    transcripts, stats = transcriber("stub", max_pending=1).transcribe(same_named_files)
+
+    first, second = same_named_files
+    assert len(transcripts[first]) == 2
+    assert transcripts[first][0]["start"] < transcripts[first][1]["start"]
+    assert len(transcripts[second]) == 1
+    assert transcripts[second][0]["text"].endswith("samples")
+    assert stats["segments"] == stats["transcribed_segments"] == 3
+    assert stats["errors"] == 0
+    assert stats["failed_files"] == []
+
+
+def test_same_basenames_get_separate_transcripts(same_named_files, tmp_path):
+    transcripts, _ = transcriber("stub").transcribe(same_named_files)
+    written = write_transcripts(transcripts, str(tmp_path / "out"))
+
+    assert written == [str(tmp_path / "out" / "a_x.txt"), str(tmp_path / "out" / "b_x.txt")]
+    with open(written[0]) as f:
+        assert len(f.read().splitlines()) == 2
+    with open(written[1]) as f:
+        assert len(f.read().splitlines()) == 1
+
+
+def test_no_transcript_when_every_segment_fails(same_named_files, tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_transcriber, "BatchTranscriber",
+                        lambda *args, **kwargs: transcriber("failing"))
+    args = argparse.Namespace(paths=same_named_files, backend="failing", model=None, workers=2,
+                              output_dir=str(tmp_path / "out"), format="txt")
+
+    assert batch_transcriber.run(args) == 1
+    assert not os.path.exists(tmp_path / "out")
+
+
+def test_missing_pocketsphinx_is_reported_before_transcribing(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pocketsphinx", None)
+    with pytest.raises(RuntimeError, match="PocketSphinx"):
+        BatchTranscriber("sphinx").check_backend()
@@ -0,0 +1,76 @@
+import time
+import asyncio
+import numpy as np
+import pytest
+from core.classification_server import UNIX_SOCKETS, ClassificationServer, load_test, request
+
+pytestmark = pytest.mark.skipif(not UNIX_SOCKETS, reason="needs Unix sockets")
+
+CLASS_NAMES = list("ABC")
+
+
+class StubClassifier:
+    """Answers "A" for every hand and records the batch sizes it was called with"""
+
+    class_names = CLASS_NAMES
+    pool_size = 1
+
+    def __init__(self, invoke_seconds=0.001):
+        self.invoke_seconds = invoke_seconds
+        self.batches = []
+
+    def classify_batch(self, landmarks_list):
+        self.batches.append(len(landmarks_list))
+        # Stands in for one interpreter invoke, which costs about the same for any small batch
+        time.sleep(self.invoke_seconds)
+        outputs = np.zeros((len(landmarks_list), len(CLASS_NAMES)), dtype=np.float32)
+        outputs[:, 0] = 0.9
+        return outputs
+
+
+def run_server(tmp_path, scenario, **options):
+    async def main():
+        classifier = StubClassifier()
+        server = ClassificationServer(classifier, **options)
+        socket_path = str(tmp_path / "hearme.sock")
+        await server.start(socket_path)
+        try:
+            return classifier, await scenario(socket_path)
+        finally:
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+def test_classify_and_close_session(tmp_path):
+    points = np.full((21, 2), 200.0).tolist()
+
+    async def scenario(socket_path):
+        responses = []
+        # Enough frames to fill the 150 ms stabilization window
+        for frame in range(8):
+            message = {"session": "kiosk", "t": frame / 30.0, "landmarks": points}
+            responses.append(await request(message, socket_path))
+        responses.append(await request({"type": "close", "session": "kiosk"}, socket_path))
+        return responses
+
+    _, responses = run_server(tmp_path, scenario)
+    assert [r["raw"] for r in responses[:8]] == ["A"] * 8
+    assert responses[0]["prediction"] is None
+    assert responses[7]["prediction"] == "A"
+    assert responses[8] == {"session": "kiosk", "closed": True}
+
+
+def test_concurrent_clients_share_batches(tmp_path):
+    async def scenario(socket_path):
+        return await load_test(clients=16, fps=30.0, duration=1.0, socket_path=socket_path)
+
+    classifier, report = run_server(tmp_path, scenario, window_ms=2.0)
+
+    # Each client waits for its answer, so about fps * duration requests each
+    assert report["requests"] >= 16 * 20
+    assert report["server"]["errors"] == 0
+    # Clients sending at the same rate land in the same window
+    assert max(classifier.batches) > 1
+    assert report["server"]["batch_size"]["mean"] >= 4
+    assert report["latency_ms_p99"] < 100
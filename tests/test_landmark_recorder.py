@@ -0,0 +1,64 @@
+import numpy as np
+from core.landmark_recorder import LandmarkRecorder, LandmarkRecording, new_recording_path
+
+
+def test_new_recording_path_is_unique_within_a_second(tmp_path):
+    paths = [new_recording_path(str(tmp_path)) for _ in range(3)]
+    assert len(set(paths)) == 3
+    assert all(path.endswith(".lmrec") for path in paths)
+
+
+def test_recording_round_trip(tmp_path):
+    path = new_recording_path(str(tmp_path))
+    landmarks = np.arange(42, dtype=np.float32).reshape(21, 2)
+
+    with LandmarkRecorder(path, num_classes=3, class_names=["A", "B", "C"], chunk_size=2) as recorder:
+        recorder.record(0.0)
+        recorder.record(0.1, landmarks, "Right", [0.1, 0.7, 0.2])
+        recorder.record(0.2, landmarks, "Left")
+
+    recording = LandmarkRecording(path)
+    assert len(recording) == 3
+    assert list(recording.handedness) == [-1, 1, 0]
+    assert np.allclose(recording.landmarks[1, :, :2], landmarks)
+    assert np.allclose(recording.outputs[1], [0.1, 0.7, 0.2])
+    assert np.isnan(recording.outputs[2]).all()
+
+
+def test_record_after_close_is_ignored(tmp_path):
+    path = new_recording_path(str(tmp_path))
+    recorder = LandmarkRecorder(path, num_classes=2)
+    recorder.record(0.0)
+    recorder.close()
+
+    recorder.record(0.1)
+    recorder.close()
+    assert len(LandmarkRecording(path)) == 1
+
+
+def test_recording_replays_like_frame_dicts(tmp_path):
+    from core.replay import replay_session
+
+    path = new_recording_path(str(tmp_path))
+    landmarks = np.zeros((21, 2), dtype=np.float32)
+    frames = []
+    with LandmarkRecorder(path, num_classes=3, class_names=["A", "B", "C"], chunk_size=16) as recorder:
+        for i in range(60):
+            t = i / 30.0
+            if 25 <= i < 30:
+                recorder.record(t)
+                frames.append({"t": t, "hand": False})
+                continue
+            probs = [0.9, 0.05, 0.05] if i < 25 else [0.05, 0.9, 0.05]
+            recorder.record(t, landmarks, "Right", probs)
+            frames.append({"t": t, "landmarks": landmarks, "handedness": "Right",
+                           "probs": np.asarray(probs, dtype=np.float32)})
+
+    labels = [{"letter": "A", "start": 0.0, "end": 0.8}, {"letter": "B", "start": 1.0, "end": 2.0}]
+    session = LandmarkRecording(path).to_session(labels)
+    assert "frames" not in session
+
+    expected = replay_session({"class_names": ["A", "B", "C"], "labels": labels, "frames": frames})
+    result = replay_session(session)
+    assert result == expected
+    assert [commit[1] for commit in result["commits"]] == ["A", "B"]
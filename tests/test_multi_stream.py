@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("cv2")
+
+from core.multi_stream import MultiStreamProcessor, Stream
+
+
+class FakeSource:
+    live = False
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.index = 0
+        self.closed = False
+
+    def read(self):
+        assert not self.closed, "read after close"
+        if self.index >= self.frames:
+            return None
+        self.index += 1
+        return object(), self.index / 30.0
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDetector:
+    def process_frame(self, frame, timestamp, draw=False):
+        return frame, [(0, 0)], "A", 0.9
+
+
+def test_processes_every_frame_of_file_sources():
+    processor = MultiStreamProcessor(workers=2)
+    for i in range(3):
+        processor.add_stream(Stream(f"s{i}", FakeSource(20), FakeDetector(), max_pending=2))
+
+    stats = processor.run()
+    assert stats["processed"] == 60
+    assert stats["dropped"] == 0
+    assert [s["transcript"] for s in stats["per_stream"]] == ["A", "A", "A"]
+
+
+def test_close_stops_further_reads():
+    source = FakeSource(5)
+    stream = Stream("s", source, FakeDetector())
+    assert stream.read() is not None
+
+    stream.close()
+    stream.close()
+    assert stream.read() is None
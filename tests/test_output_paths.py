@@ -0,0 +1,31 @@
+import os
+from utils.output_paths import output_paths
+
+
+def test_output_paths_next_to_sources(tmp_path):
+    sources = [str(tmp_path / "a" / "clip.mp4"), str(tmp_path / "frames")]
+    assert output_paths(sources, suffix=".predictions.jsonl") == [
+        str(tmp_path / "a" / "clip.predictions.jsonl"),
+        str(tmp_path / "frames.predictions.jsonl"),
+    ]
+
+
+def test_output_paths_keep_same_named_sources_apart(tmp_path):
+    out = tmp_path / "out"
+    sources = [str(tmp_path / "day1" / "clip.mp4"), str(tmp_path / "day2" / "clip.mp4"),
+               str(tmp_path / "day2" / "clip.avi")]
+
+    paths = output_paths(sources, str(out), ".predictions.csv")
+    assert paths == [
+        str(out / "day1_clip.predictions.csv"),
+        str(out / "day2_clip.predictions.csv"),
+        str(out / "day2_clip_2.predictions.csv"),
+    ]
+    assert os.path.isdir(out)
+
+
+def test_output_paths_single_source_uses_its_name(tmp_path):
+    out = tmp_path / "out"
+    assert output_paths([str(tmp_path / "videos" / "hello.mp4")], str(out), ".predictions.jsonl") == [
+        str(out / "hello.predictions.jsonl"),
+    ]
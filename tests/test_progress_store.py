@@ -0,0 +1,72 @@
+import pickle
+from utils.progress_store import ProgressStore, next_accuracy
+
+
+def make_store(tmp_path, legacy_path=None):
+    return ProgressStore(str(tmp_path / "progress.db"), legacy_path=legacy_path)
+
+
+def test_pickle_progress_is_migrated_once(tmp_path):
+    legacy_path = tmp_path / "learning_progress.pkl"
+    with open(legacy_path, "wb") as f:
+        pickle.dump({"progress": {"A": 40, "B": 12}}, f)
+
+    store = make_store(tmp_path, str(legacy_path))
+    store.close()
+
+    accuracy = store.load_accuracy()
+    assert accuracy["A"] == 40
+    assert accuracy["B"] == 12
+    assert accuracy["C"] == 0
+    assert not legacy_path.exists()
+    assert (tmp_path / "learning_progress.pkl.migrated").exists()
+
+    # An old pickle turning up again does not overwrite newer progress
+    with open(legacy_path, "wb") as f:
+        pickle.dump({"progress": {"A": 90}}, f)
+    store = make_store(tmp_path, str(legacy_path))
+    store.close()
+    assert store.load_accuracy()["A"] == 40
+
+
+def test_attempts_update_letter_stats(tmp_path):
+    store = make_store(tmp_path)
+    outcomes = [True, True, False, True, False, False, False, False]
+    for correct in outcomes:
+        store.record_attempt("A", correct, 0.9)
+    store.record_attempt("B", False, 0.8)
+    store.close()
+
+    expected = 0
+    for correct in outcomes:
+        expected = next_accuracy(expected, correct)
+
+    stats = store.load()
+    assert stats["A"]["attempts"] == len(outcomes)
+    assert stats["A"]["correct"] == sum(outcomes)
+    assert stats["A"]["accuracy"] == expected
+    assert stats["A"]["last_attempt"] is not None
+    assert stats["B"] == {"accuracy": 0, "attempts": 1, "correct": 0,
+                          "last_attempt": stats["B"]["last_attempt"]}
+    assert store.written == len(outcomes) + 1
+
+
+def test_accuracy_is_clamped(tmp_path):
+    store = make_store(tmp_path)
+    store.set_accuracy({"A": 99})
+    store.record_attempt("A", True)
+    store.record_attempt("A", True)
+    store.flush()
+    assert store.load_accuracy()["A"] == 100
+
+    store.set_accuracy({"A": 0})
+    store.record_attempt("A", False)
+    store.close()
+    assert store.load_accuracy()["A"] == 0
+
+
+def test_attempts_after_close_are_ignored(tmp_path):
+    store = make_store(tmp_path)
+    store.close()
+    store.record_attempt("A", True)
+    assert store.load()["A"]["attempts"] == 0
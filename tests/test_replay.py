@@ -0,0 +1,33 @@
+import json
+import os
+from core.replay import GOLDEN_PATH, compare_with_golden, run_replay, synthetic_sessions
+from utils.settings_service import DEFAULT_SETTINGS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_synthetic_replay_matches_golden():
+    with open(os.path.join(ROOT, GOLDEN_PATH), "r") as f:
+        golden = json.load(f)
+
+    report = run_replay(synthetic_sessions())
+    assert compare_with_golden(report, golden) == []
+
+
+def test_golden_config_is_the_app_default():
+    with open(os.path.join(ROOT, GOLDEN_PATH), "r") as f:
+        golden = json.load(f)
+
+    assert golden["config"] == {key: DEFAULT_SETTINGS[key] for key in golden["config"]}
+
+
+def test_weighted_stabilizer_does_not_flicker():
+    report = run_replay(synthetic_sessions())
+    summary = report["summary"]
+
+    # Noise inside a held letter must not clear and re-commit it
+    assert summary["duplicate_commits"] <= 1
+    assert summary["false_commits"] <= 1
+    # Only the double L of HELLO is missed: no confident frame separates the two
+    missed = {name for name, result in report["sessions"].items() if result["missed"]}
+    assert missed <= {"hello_10fps_0", "hello_30fps_0"}
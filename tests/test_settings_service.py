@@ -0,0 +1,22 @@
+import json
+from utils.settings_service import SettingsService
+
+
+def test_update_writes_only_stored_and_changed_keys(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text('{"theme": "dark"}')
+    service = SettingsService(str(path), defaults={"theme": "light", "tts_rate": 170})
+
+    assert service.update(tts_rate=150) == {"tts_rate": 150}
+    assert json.loads(path.read_text()) == {"theme": "dark", "tts_rate": 150}
+    assert service.get_all() == {"theme": "dark", "tts_rate": 150}
+
+
+def test_update_notifies_subscribers_of_changes(tmp_path):
+    service = SettingsService(str(tmp_path / "settings.json"), defaults={"theme": "light"})
+    seen = []
+    service.subscribe(seen.append, keys=["theme"])
+
+    service.update(theme="light")
+    service.update(theme="dark", language="en")
+    assert seen == [{"theme": "dark"}]
@@ -0,0 +1,62 @@
+import os
+import numpy as np
+from PIL import Image
+from utils.sign_atlas import SignAtlas
+
+
+def write_sign(directory, letter, color):
+    Image.new("RGBA", (8, 8), color).save(os.path.join(directory, f"{letter}.png"))
+
+
+def make_atlas(tmp_path):
+    source_dir = tmp_path / "signs"
+    source_dir.mkdir()
+    write_sign(source_dir, "A", (255, 0, 0, 255))
+    write_sign(source_dir, "B", (0, 0, 255, 255))
+    return SignAtlas(str(source_dir), str(tmp_path / "atlas.bin"), str(tmp_path / "atlas.json"),
+                     sizes=((4, 4),), letters="AB")
+
+
+def test_close_releases_the_mapping(tmp_path):
+    atlas = make_atlas(tmp_path).open()
+    assert tuple(atlas.get_array("A", (4, 4))[0, 0]) == (255, 0, 0, 255)
+
+    atlas.close()
+    assert atlas._data is None
+    assert atlas._blocks == {}
+    assert atlas.index is None
+
+
+def test_reopen_rebuilds_changed_sources(tmp_path):
+    atlas = make_atlas(tmp_path).open()
+    assert tuple(atlas.get_array("B", (4, 4))[0, 0]) == (0, 0, 255, 255)
+
+    write_sign(tmp_path / "signs", "B", (0, 255, 0, 255))
+    os.utime(tmp_path / "signs" / "B.png", ns=(0, 1))
+    atlas.open()
+
+    assert tuple(atlas.get_array("B", (4, 4))[0, 0]) == (0, 255, 0, 255)
+    assert isinstance(atlas.get_pil_image("A", (4, 4)), Image.Image)
+    assert np.array(atlas.get_array("A", (4, 4))).shape == (4, 4, 4)
+
+
+def test_ensure_open_reuses_the_mapping(tmp_path):
+    atlas = make_atlas(tmp_path).ensure_open()
+    data = atlas._data
+
+    assert atlas.ensure_open()._data is data
+
+    write_sign(tmp_path / "signs", "A", (0, 255, 0, 255))
+    os.utime(tmp_path / "signs" / "A.png", ns=(0, 1))
+    assert atlas.ensure_open()._data is not data
+    assert tuple(atlas.get_array("A", (4, 4))[0, 0]) == (0, 255, 0, 255)
+
+
+def test_missing_letters_get_placeholders_without_gui_modules(tmp_path):
+    source_dir = tmp_path / "signs"
+    source_dir.mkdir()
+    atlas = SignAtlas(str(source_dir), str(tmp_path / "atlas.bin"), str(tmp_path / "atlas.json"),
+                      sizes=((16, 16),), letters="Z").open()
+
+    assert not atlas.has_image("Z")
+    assert atlas.get_array("Z", (16, 16))[..., 3].min() == 255
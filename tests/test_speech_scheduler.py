@@ -0,0 +1,105 @@
+import time
+import threading
+from core.speech_scheduler import (SpeechItem, SpeechScheduler, PRIORITY_LETTER, PRIORITY_NORMAL,
+                                   PRIORITY_PHRASE)
+
+
+def drain(scheduler):
+    items = []
+    while True:
+        item = scheduler.get(timeout=0)
+        if item is None:
+            return items
+        items.append(item.text)
+
+
+def test_higher_priority_first_then_fifo():
+    scheduler = SpeechScheduler()
+    scheduler.put(SpeechItem("a", PRIORITY_LETTER))
+    scheduler.put(SpeechItem("b", PRIORITY_NORMAL))
+    scheduler.put(SpeechItem("c", PRIORITY_PHRASE))
+    scheduler.put(SpeechItem("d", PRIORITY_NORMAL))
+
+    assert scheduler.peek_priority() == PRIORITY_PHRASE
+    assert drain(scheduler) == ["c", "b", "d", "a"]
+
+
+def test_stale_items_are_dropped():
+    scheduler = SpeechScheduler()
+    stale = SpeechItem("old", ttl=0.5)
+    stale.created_at -= 1.0
+    scheduler.put(stale)
+    scheduler.put(SpeechItem("fresh", ttl=0.5))
+
+    assert drain(scheduler) == ["fresh"]
+    assert scheduler.get_stats()["dropped"] == 1
+
+
+def test_same_key_is_coalesced():
+    scheduler = SpeechScheduler()
+    first = SpeechItem("hello", PRIORITY_NORMAL, ttl=1.0)
+    first.created_at -= 0.9
+    scheduler.put(first)
+    second = SpeechItem("hello", PRIORITY_NORMAL, ttl=1.0)
+    assert scheduler.put(second)
+
+    # The waiting item is refreshed instead of queueing the text twice
+    assert scheduler.is_queued(first)
+    assert not scheduler.is_queued(second)
+    time.sleep(0.15)
+    assert drain(scheduler) == ["hello"]
+    assert scheduler.get_stats()["coalesced"] == 1
+
+
+def test_coalescing_with_higher_priority_replaces_the_item():
+    scheduler = SpeechScheduler()
+    low = SpeechItem("hello", PRIORITY_LETTER)
+    high = SpeechItem("hello", PRIORITY_PHRASE)
+    scheduler.put(low)
+    scheduler.put(high)
+
+    assert scheduler.is_queued(high)
+    assert not scheduler.is_queued(low)
+    assert scheduler.get(timeout=0) is high
+    assert scheduler.get(timeout=0) is None
+
+
+def test_full_queue_evicts_lowest_priority():
+    scheduler = SpeechScheduler(max_size=2)
+    scheduler.put(SpeechItem("letter", PRIORITY_LETTER))
+    scheduler.put(SpeechItem("normal", PRIORITY_NORMAL))
+
+    assert scheduler.put(SpeechItem("phrase", PRIORITY_PHRASE))
+    assert drain(scheduler) == ["phrase", "normal"]
+
+
+def test_full_queue_drops_less_important_item():
+    scheduler = SpeechScheduler(max_size=1)
+    scheduler.put(SpeechItem("phrase", PRIORITY_PHRASE))
+
+    assert not scheduler.put(SpeechItem("letter", PRIORITY_LETTER))
+    assert drain(scheduler) == ["phrase"]
+    assert scheduler.get_stats()["dropped"] == 1
+
+
+def test_cancel_and_clear():
+    scheduler = SpeechScheduler()
+    for text in ("a", "b", "c"):
+        scheduler.put(SpeechItem(text))
+
+    assert scheduler.cancel(lambda item: item.text == "b") == 1
+    assert len(scheduler) == 2
+    scheduler.clear()
+    assert scheduler.get(timeout=0) is None
+
+
+def test_close_wakes_waiting_consumer():
+    scheduler = SpeechScheduler()
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(scheduler.get()))
+    consumer.start()
+
+    scheduler.close()
+    consumer.join(1.0)
+    assert results == [None]
+    assert not scheduler.put(SpeechItem("late"))
@@ -0,0 +1,84 @@
+import io
+import json
+import time
+import threading
+import pytest
+
+pytest.importorskip("cv2")
+
+from core.stream_detector import EventWriter, StreamDetector
+
+
+class StubSource:
+    """Live source that fails the test if it is closed during a read"""
+
+    name = "stub"
+
+    def __init__(self, frames, live=True, frame_seconds=0.002):
+        self.frames = frames
+        self.live = live
+        self.frame_seconds = frame_seconds
+        self.index = 0
+        self.reading = threading.Lock()
+        self.closed_during_read = False
+
+    def read(self):
+        with self.reading:
+            if self.index >= self.frames:
+                return None
+            time.sleep(self.frame_seconds)
+            self.index += 1
+            return object(), self.index / 30.0
+
+    def close(self):
+        if self.reading.locked():
+            self.closed_during_read = True
+
+
+class StubDetector:
+    """Sees a hand in every frame after the first and always decides A"""
+
+    def process_frame(self, frame, timestamp, draw=False, info=None):
+        hand = timestamp > 1 / 30.0
+        if info is not None:
+            info["raw_prediction"] = "A"
+            info["raw_confidence"] = 0.9
+        return frame, [(0, 0)] if hand else [], "A" if hand else None, 0.9 if hand else 0.0
+
+
+def run_stream(source):
+    out = io.StringIO()
+    writer = EventWriter(out)
+    stats = StreamDetector(StubDetector(), writer).run(source)
+    writer.close()
+    source.close()
+    return stats, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+@pytest.mark.parametrize("live", [True, False])
+def test_events_and_transcript(live):
+    stats, events = run_stream(StubSource(10, live=live))
+
+    types = [event["type"] for event in events]
+    assert types[0] == "start" and types[-1] == "end"
+    assert "hand_found" in types
+    assert [event["letter"] for event in events if event["type"] == "letter"] == ["A"]
+    assert stats["transcript"] == "A"
+    if not live:
+        assert stats["frames"] == 10 and stats["dropped"] == 0
+
+
+def test_live_source_is_not_closed_during_read():
+    source = StubSource(1000, frame_seconds=0.001)
+    detector = StubDetector()
+    out = io.StringIO()
+    writer = EventWriter(out)
+    stream = StreamDetector(detector, writer)
+
+    # The reader goes away while frames are still coming in
+    threading.Timer(0.05, writer.closed.set).start()
+    stream.run(source)
+    source.close()
+    writer.close()
+
+    assert not source.closed_during_read
@@ -0,0 +1,160 @@
+import time
+from core.speech_scheduler import PRIORITY_NORMAL
+from core.tts_backends import NullBackend
+from core.tts_manager import TTSManager, split_into_chunks
+
+
+def make_manager(rate=1200):
+    return TTSManager(backend=NullBackend(rate=rate, realtime=True), probe_cache_path=None)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_stop_before_speak_is_not_lost():
+    backend = NullBackend(rate=60, realtime=True)
+    backend.stop()
+
+    start = time.perf_counter()
+    result = backend.speak("this would take several seconds")
+    assert time.perf_counter() - start < 0.5
+    assert result.audio_duration < 0.5
+
+    # The stop is used up by the utterance it cut short
+    assert not backend._interrupt.is_set()
+
+
+def test_chunked_phrase_is_spoken_in_order():
+    manager = make_manager()
+    try:
+        text = "Good morning everyone and welcome. " + " ".join(f"word{i}" for i in range(20))
+        manager.speak_phrase(text)
+        wait_for(lambda: len(manager.utterance_metrics) == 1)
+
+        assert manager.backend.spoken == split_into_chunks(text)
+        metrics = manager.utterance_metrics[0]
+        assert metrics["spoken_chunks"] == metrics["chunks"]
+        assert not metrics["cancelled"]
+        assert manager.interrupted_count == 0
+    finally:
+        manager.cleanup()
+
+
+def test_phrase_interrupts_and_utterance_resumes():
+    manager = make_manager()
+    try:
+        text = "one two three four five six, seven eight nine ten"
+        chunks = split_into_chunks(text)
+        manager.speak(text, priority=PRIORITY_NORMAL, chunked=True)
+        wait_for(lambda: manager._current_item is not None)
+        time.sleep(0.05)
+
+        manager.speak_phrase("urgent")
+        wait_for(lambda: len(manager.utterance_metrics) == 2)
+
+        # The cut chunk is repeated once the phrase has been spoken
+        assert manager.interrupted_count == 1
+        assert manager.backend.spoken == [chunks[0], "urgent"] + chunks
+        assert all(m["spoken_chunks"] == m["chunks"] for m in manager.utterance_metrics)
+    finally:
+        manager.cleanup()
+
+
+def test_cancel_utterance_stops_remaining_chunks():
+    manager = make_manager()
+    try:
+        text = "one two three four five six, seven eight nine ten"
+        utterance_id = manager.speak_phrase(text)
+        wait_for(lambda: manager._current_item is not None)
+
+        assert manager.cancel_utterance(utterance_id)
+        wait_for(lambda: len(manager.utterance_metrics) == 1)
+        metrics = manager.utterance_metrics[0]
+        assert metrics["cancelled"]
+        assert metrics["spoken_chunks"] < metrics["chunks"]
+    finally:
+        manager.cleanup()
+
+
+class SlowSynthesisBackend(NullBackend):
+    """Null backend whose synthesis time grows with the length of the text"""
+
+    seconds_per_word = 0.0005
+
+    def speak(self, text):
+        synthesis_time = len(text.split()) * self.seconds_per_word
+        time.sleep(synthesis_time)
+        result = super().speak(text)
+        result.synthesis_time = synthesis_time
+        return result
+
+
+def test_time_to_first_audio_does_not_grow_with_length():
+    manager = TTSManager(backend=SlowSynthesisBackend(), probe_cache_path=None)
+    first_audio = []
+    try:
+        for words in (10, 100, 1000):
+            manager.speak_phrase(" ".join(["word"] * words))
+            wait_for(lambda: len(manager.utterance_metrics) == 1)
+            metrics = manager.utterance_metrics.pop()
+            assert metrics["spoken_chunks"] == metrics["chunks"]
+            first_audio.append(metrics["time_to_first_audio"])
+    finally:
+        manager.cleanup()
+
+    # Synthesizing the whole 1000 word phrase up front would take 0.5s
+    assert max(first_audio) < 0.1
+    assert max(first_audio) - min(first_audio) < 0.05
+
+
+class FlakyBackend(NullBackend):
+    """Null backend whose probe fails until it is told otherwise"""
+
+    name = "flaky"
+
+    def __init__(self):
+        super().__init__()
+        self.working = False
+
+    def probe(self):
+        return {"available": self.working, "error": None if self.working else "no audio device"}
+
+
+def test_failed_probe_is_not_cached(tmp_path):
+    cache_path = str(tmp_path / "tts_probe.json")
+    manager = TTSManager(backend=FlakyBackend(), probe_cache_path=cache_path)
+    try:
+        assert not manager.wait_until_ready(5.0)
+        assert manager.backend.name == "null"
+    finally:
+        manager.cleanup()
+    assert not (tmp_path / "tts_probe.json").exists()
+
+
+def test_self_test_probes_again_and_restores_backend(tmp_path):
+    cache_path = str(tmp_path / "tts_probe.json")
+    backend = FlakyBackend()
+    manager = TTSManager(backend=backend, probe_cache_path=cache_path)
+    try:
+        assert not manager.wait_until_ready(5.0)
+
+        backend.working = True
+        report = manager.self_test("hello")
+        assert report["probe"]["available"]
+        assert report["backend"] == "flaky"
+        assert report["has_audio"]
+        assert backend.spoken == ["hello"]
+    finally:
+        manager.cleanup()
+
+    # The successful probe is cached and trusted on the next launch
+    manager = TTSManager(backend=FlakyBackend(), probe_cache_path=cache_path)
+    try:
+        assert manager.wait_until_ready(0)
+        assert manager.probe_result["available"]
+    finally:
+        manager.cleanup()
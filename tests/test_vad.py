@@ -0,0 +1,119 @@
+import os
+import json
+import pytest
+from utils import vad
+from utils.settings_service import SettingsService
+from utils.vad import (EnergyVAD, VoiceActivitySegmenter, CalibrationStore, create_vad, read_wav_pcm,
+                       segment_wav_file)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+FRAME = 0.03
+
+
+def fixture(name):
+    return os.path.join(FIXTURES, name)
+
+
+def segments(name, **options):
+    return segment_wav_file(fixture(name), vad=EnergyVAD(), **options)
+
+
+def test_read_wav_pcm():
+    pcm, sample_rate = read_wav_pcm(fixture("two_phrases.wav"))
+    assert sample_rate == 16000
+    assert len(pcm) == 2 * int(4.35 * 16000)
+
+
+def test_segment_boundaries_include_pre_roll_and_tail():
+    first, second = segments("two_phrases.wav")
+
+    # Speech starts at 1.0s; 150 ms of pre-roll is kept before it
+    assert first.start == pytest.approx(0.85, abs=FRAME)
+    # Speech ends at 1.6s; the hangover is trimmed down to a 150 ms tail
+    assert first.end == pytest.approx(1.75, abs=FRAME)
+    assert second.start == pytest.approx(2.45, abs=FRAME)
+    assert second.end == pytest.approx(3.5, abs=FRAME)
+
+
+def test_no_pre_roll_starts_at_speech():
+    first, _ = segments("two_phrases.wav", pre_roll_ms=0)
+    assert first.start == pytest.approx(1.0, abs=FRAME)
+    assert first.end == pytest.approx(1.6, abs=2 * FRAME)
+
+
+def test_short_pause_within_hangover_keeps_one_segment():
+    # The 150 ms pause in the second phrase is shorter than the 300 ms hangover
+    assert len(segments("two_phrases.wav", hangover_ms=300)) == 2
+
+
+def test_pause_longer_than_hangover_splits_segment():
+    result = segments("two_phrases.wav", hangover_ms=90)
+    assert len(result) == 3
+    assert result[1].end <= result[2].start
+
+
+def test_max_length_split():
+    result = segments("long_speech.wav", max_segment_s=1.0)
+
+    assert len(result) == 3
+    for segment in result:
+        assert segment.duration <= 1.0 + 1e-6
+    for previous, following in zip(result, result[1:]):
+        assert following.start == pytest.approx(previous.end)
+
+
+def test_feeding_in_small_chunks_gives_same_segments():
+    pcm, sample_rate = read_wav_pcm(fixture("two_phrases.wav"))
+    segmenter = VoiceActivitySegmenter(sample_rate, vad=EnergyVAD())
+
+    result = []
+    for offset in range(0, len(pcm), 700):
+        result.extend(segmenter.feed(pcm[offset:offset + 700]))
+    result.extend(segmenter.flush())
+
+    expected = segments("two_phrases.wav")
+    assert [(s.start, s.end) for s in result] == [(s.start, s.end) for s in expected]
+
+
+def test_webrtc_only_for_supported_rates(monkeypatch):
+    class FakeWebRTC:
+        @staticmethod
+        def Vad(aggressiveness):
+            return object()
+
+    monkeypatch.setattr(vad, "webrtcvad", FakeWebRTC)
+    assert isinstance(create_vad(sample_rate=16000), vad.WebRTCVAD)
+    assert isinstance(create_vad(sample_rate=44100), EnergyVAD)
+    assert isinstance(VoiceActivitySegmenter(44100).vad, EnergyVAD)
+
+
+def test_calibration_store_only_writes_mic_calibration(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text('{"theme": "dark"}')
+    service = SettingsService(str(path))
+    store = CalibrationStore(service, min_interval=0)
+
+    # Another writer changes a setting after the service has read the file
+    path.write_text('{"theme": "light", "tts_rate": 120}')
+    os.utime(path, ns=(0, 1))
+    service.reload()
+
+    store.put("USB Mic", 412.345)
+    assert store.get("USB Mic") == 412.3
+
+    saved = json.loads(path.read_text())
+    assert saved["theme"] == "light"
+    assert saved["tts_rate"] == 120
+    assert saved["mic_calibration"] == {"USB Mic": 412.3}
+
+
+def test_calibration_store_rate_limits_writes(tmp_path):
+    service = SettingsService(str(tmp_path / "settings.json"))
+    store = CalibrationStore(service, min_interval=60)
+
+    store.put("mic", 300.0)
+    store.put("mic", 500.0)
+    assert store.get("mic") == 300.0
+
+    store.put("mic", 500.0, force=True)
+    assert store.get("mic") == 500.0
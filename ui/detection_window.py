@@ -4,11 +4,14 @@ from PIL import Image, ImageTk
 import threading
 import numpy as np
 import time
+from utils.settings_service import get_settings_service
 
 class DetectionWindow(ctk.CTkToplevel):
-    def __init__(self, parent, detector, tts):
+    def __init__(self, parent, detector, tts, window_manager=None):
         super().__init__(parent)
         
+        self.window_manager = window_manager
+        
         self.WIDTH = 390
         self.HEIGHT = 844
         
@@ -30,13 +33,20 @@ class DetectionWindow(ctk.CTkToplevel):
         self.tts_cooldown = 1.0
         self.current_phrase = ""
         
+        self.settings = get_settings_service()
+        self.camera_index = self.settings.get("camera_index", 0)
+        self._unsubscribe_settings = self.settings.subscribe(
+            lambda changes: self.after(0, self.set_camera_index, changes["camera_index"]),
+            keys=("camera_index",)
+        )
+        
         self.setup_ui()
         
         self.start_camera()
         
         self.center_window()
         
-        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.protocol("WM_DELETE_WINDOW", self.close)
     
     def center_window(self):
         self.update_idletasks()
@@ -56,7 +66,7 @@ class DetectionWindow(ctk.CTkToplevel):
         back_button = ctk.CTkButton(
             header_frame,
             text="← Back",
-            command=self.on_closing,
+            command=self.close,
             width=80,
             height=35,
             fg_color="transparent",
@@ -226,24 +236,63 @@ class DetectionWindow(ctk.CTkToplevel):
         return hex_color
     
     def start_camera(self):
-        self.cap = cv2.VideoCapture(0)
-        self.camera_thread = threading.Thread(target=self.update_camera)
+        # Each camera thread owns its capture and stop event, so one that
+        # outlives stop_camera() cannot touch the next camera
+        self.is_running = True
+        self.camera_stop = threading.Event()
+        cap = cv2.VideoCapture(self.camera_index)
+        self.camera_thread = threading.Thread(target=self.update_camera, args=(cap, self.camera_stop))
         self.camera_thread.daemon = True
         self.camera_thread.start()
     
-    def update_camera(self):
-        while self.is_running and self.cap.isOpened():
-            ret, frame = self.cap.read()
+    def update_camera(self, cap, stop):
+        while not stop.is_set() and cap.isOpened():
+            ret, frame = cap.read()
             if ret:
                 processed_frame, landmarks, prediction, confidence = self.detector.process_frame(frame)
                 
-                self.after(0, self.update_display, processed_frame, prediction, confidence)
+                self.after(0, self.update_display, processed_frame, prediction, confidence, stop)
             
             time.sleep(0.03)
         
-        self.cap.release()
+        cap.release()
+    
+    def stop_camera(self):
+        self.is_running = False
+        if getattr(self, 'camera_stop', None) is not None:
+            self.camera_stop.set()
+        if getattr(self, 'camera_thread', None) is not None:
+            # The camera thread releases its capture when it exits
+            self.camera_thread.join(timeout=1.0)
+            self.camera_thread = None
+    
+    def set_camera_index(self, index):
+        if index == self.camera_index:
+            return
+        
+        self.camera_index = index
+        if self.is_running:
+            self.stop_camera()
+            self.start_camera()
     
-    def update_display(self, frame, prediction, confidence):
+    def on_show(self):
+        self.start_camera()
+    
+    def on_hide(self):
+        self.stop_camera()
+        self.camera_label.configure(image="", text="Starting camera...")
+    
+    def close(self):
+        if self.window_manager is not None:
+            self.window_manager.hide(self)
+        else:
+            self.on_closing()
+    
+    def update_display(self, frame, prediction, confidence, stop=None):
+        # Frames still queued from a stopped camera thread are dropped
+        if not self.is_running or (stop is not None and stop.is_set()):
+            return
+        
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         img = Image.fromarray(rgb_frame)
         
@@ -283,10 +332,9 @@ class DetectionWindow(ctk.CTkToplevel):
     
     def speak_phrase(self):
         if self.current_phrase:
-            self.tts.speak(self.current_phrase)
+            self.tts.speak_phrase(self.current_phrase)
     
     def on_closing(self):
-        self.is_running = False
-        if hasattr(self, 'cap') and self.cap:
-            self.cap.release()
+        self._unsubscribe_settings()
+        self.stop_camera()
         self.destroy()
\ No newline at end of file
@@ -4,12 +4,15 @@ import threading
 import time
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-import random
+from utils.progress_store import ProgressStore, next_accuracy
+from utils.settings_service import get_settings_service
 
 class LearningWindow(ctk.CTkToplevel):
-    def __init__(self, parent):
+    def __init__(self, parent, window_manager=None):
         super().__init__(parent)
         
+        self.window_manager = window_manager
+        
         self.WIDTH = 390
         self.HEIGHT = 844
         
@@ -25,6 +28,7 @@ class LearningWindow(ctk.CTkToplevel):
         self.orange = "#FF9800"
         self.red = "#F44336"
         
+        self.progress_store = ProgressStore()
         self.progress = self.load_progress()
         self.letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
         self.current_letter_index = 0
@@ -32,10 +36,20 @@ class LearningWindow(ctk.CTkToplevel):
         
         self.cap = None
         self.is_camera_running = False
+        self._camera_job = None
+        
+        self.settings = get_settings_service()
+        self.camera_index = self.settings.get("camera_index", 0)
+        self._unsubscribe_settings = self.settings.subscribe(
+            lambda changes: self.after(0, self.set_camera_index, changes["camera_index"]),
+            keys=("camera_index",)
+        )
         self.detector = None  
         self.current_detection = None
         self.current_confidence = 0.0
         self.practice_mode_active = False
+        # Letter of the attempt being held, so a held sign counts once
+        self.attempt_letter = None
         
         self.session_correct = 0
         self.session_total = 0
@@ -45,7 +59,7 @@ class LearningWindow(ctk.CTkToplevel):
         
         self.center_window()
         
-        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.protocol("WM_DELETE_WINDOW", self.close)
         
         self.try_get_detector(parent)
     
@@ -58,8 +72,9 @@ class LearningWindow(ctk.CTkToplevel):
     def try_get_detector(self, parent):
         try:
             if hasattr(parent, 'detector') and parent.detector:
-                self.detector = parent.detector
-                print("Got detector from parent")
+                # Own session on the parent's model, so detection and learning don't share state
+                self.detector = parent.detector.new_session()
+                print("Created detector session from parent")
             else:
                 from core.detector import SignLanguageDetector
                 self.detector = SignLanguageDetector()
@@ -113,7 +128,7 @@ class LearningWindow(ctk.CTkToplevel):
         back_button = ctk.CTkButton(
             header_frame,
             text="← Back",
-            command=self.on_closing,
+            command=self.close,
             width=80,
             height=35,
             fg_color="transparent",
@@ -456,19 +471,11 @@ class LearningWindow(ctk.CTkToplevel):
             return self.red
     
     def load_progress(self):
-        progress = {}
-        for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-            progress[letter] = random.randint(0, 100)
-        
-        for letter in "DEFGHIJKLMNOPQRSTUVWXYZ":
-            if random.random() > 0.3:  
-                progress[letter] = 0
-        
-        progress["A"] = 95
-        progress["B"] = 70
-        progress["C"] = 20
-        
-        return progress
+        try:
+            return self.progress_store.load_accuracy()
+        except Exception as e:
+            print(f"Could not load learning progress: {e}")
+            return {letter: 0 for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
     
     def start_camera(self):
         if self.detector is None:
@@ -477,7 +484,7 @@ class LearningWindow(ctk.CTkToplevel):
             return
         
         try:
-            self.cap = cv2.VideoCapture(0)
+            self.cap = cv2.VideoCapture(self.camera_index)
             if not self.cap.isOpened():
                 self.camera_label.configure(image="", text="Camera not available")
                 return
@@ -502,17 +509,11 @@ class LearningWindow(ctk.CTkToplevel):
                         
                         self.update_detection_display(prediction, confidence)
                         
-                        if prediction == self.current_letter and confidence > 0.7:
-                            self.session_total += 1
-                            self.session_correct += 1
-                            self.update_session_stats()
-                            
-                            self.update_letter_accuracy(True)
-                        elif prediction and confidence > 0.7:
-                            self.session_total += 1
-                            self.update_session_stats()
-                            
-                            self.update_letter_accuracy(False)
+                        decided = prediction if prediction and confidence > 0.7 else None
+                        if decided != self.attempt_letter:
+                            self.attempt_letter = decided
+                            if decided is not None:
+                                self.record_attempt(decided == self.current_letter, confidence)
                         
                         frame = processed_frame
                     except Exception as e:
@@ -527,7 +528,7 @@ class LearningWindow(ctk.CTkToplevel):
                 self.camera_label.configure(image=ctk_img, text="")
         
         if self.is_camera_running:
-            self.after(33, self.update_camera)  
+            self._camera_job = self.after(33, self.update_camera)
     
     def update_detection_display(self, prediction, confidence):
         if prediction:
@@ -555,15 +556,20 @@ class LearningWindow(ctk.CTkToplevel):
                 text=f"{self.session_correct}/{self.session_total} ({accuracy:.0f}%)"
             )
     
-    def update_letter_accuracy(self, correct):
-        current_accuracy = self.progress.get(self.current_letter, 0)
-        
+    def record_attempt(self, correct, confidence):
+        self.session_total += 1
         if correct:
-            new_accuracy = min(100, current_accuracy + 2)
-        else:
-            new_accuracy = max(0, current_accuracy - 1)
+            self.session_correct += 1
+        self.update_session_stats()
+        
+        self.update_letter_accuracy(correct, confidence)
+    
+    def update_letter_accuracy(self, correct, confidence=None):
+        current_accuracy = self.progress.get(self.current_letter, 0)
+        new_accuracy = next_accuracy(current_accuracy, correct)
         
         self.progress[self.current_letter] = new_accuracy
+        self.progress_store.record_attempt(self.current_letter, correct, confidence)
         
         self.accuracy_label.configure(
             text=f"{new_accuracy}%",
@@ -586,6 +592,7 @@ class LearningWindow(ctk.CTkToplevel):
             self.session_start_time = time.time()
             self.session_correct = 0
             self.session_total = 0
+            self.attempt_letter = None
             self.update_session_stats()
             
             if not self.is_camera_running:
@@ -621,6 +628,7 @@ class LearningWindow(ctk.CTkToplevel):
         
         self.user_sign_label.configure(text="--")
         self.match_label.configure(text="0%", text_color=self.red)
+        self.attempt_letter = None
         
         if self.practice_mode_active:
             self.practice_mode_active = False
@@ -629,13 +637,47 @@ class LearningWindow(ctk.CTkToplevel):
                 fg_color=self.green
             )
     
-    def on_closing(self):
+    def stop_camera(self):
         self.is_camera_running = False
-        self.practice_mode_active = False
-        
+        # A pending tick would otherwise run on after a restart and poll the camera twice
+        if self._camera_job is not None:
+            self.after_cancel(self._camera_job)
+            self._camera_job = None
         if self.cap:
             self.cap.release()
+            self.cap = None
+    
+    def set_camera_index(self, index):
+        if index == self.camera_index:
+            return
+        
+        self.camera_index = index
+        if self.is_camera_running:
+            self.stop_camera()
+            self.start_camera()
+    
+    def on_show(self):
+        if self.detector and not self.is_camera_running:
+            self.start_camera()
+    
+    def on_hide(self):
+        if self.practice_mode_active:
+            self.toggle_practice()
+        self.stop_camera()
+        self.camera_label.configure(image="", text="Camera paused")
+    
+    def close(self):
+        if self.window_manager is not None:
+            self.window_manager.hide(self)
+        else:
+            self.on_closing()
+    
+    def on_closing(self):
+        self._unsubscribe_settings()
+        self.practice_mode_active = False
+        self.stop_camera()
         
         print("Saving learning progress...")
+        self.progress_store.close()
         
         self.destroy()
\ No newline at end of file
@@ -1,11 +1,17 @@
 import customtkinter as ctk
 from PIL import Image, ImageDraw, ImageFont
 import os
+from utils.sign_atlas import get_sign_atlas
+
+THUMBNAIL_SIZE = (64, 64)
+DETAIL_SIZE = (150, 150)
 
 class LibraryWindow(ctk.CTkToplevel):
-    def __init__(self, parent):
+    def __init__(self, parent, window_manager=None):
         super().__init__(parent)
         
+        self.window_manager = window_manager
+        
         self.WIDTH = 390
         self.HEIGHT = 844
         
@@ -17,6 +23,9 @@ class LibraryWindow(ctk.CTkToplevel):
         self.white = "#FFFFFF"
         self.gray = "#F5F5F5"
         self.dark_gray = "#666666"
+        
+        # All thumbnails are slices of one memory-mapped atlas file
+        self.atlas = get_sign_atlas()
   
         self.setup_ui()
         
@@ -41,7 +50,7 @@ class LibraryWindow(ctk.CTkToplevel):
         back_button = ctk.CTkButton(
             header_frame,
             text="← Back",
-            command=self.destroy,
+            command=self.close,
             width=80,
             height=35,
             fg_color="transparent",
@@ -94,38 +103,59 @@ class LibraryWindow(ctk.CTkToplevel):
             content = ctk.CTkFrame(card, fg_color="transparent")
             content.pack(fill="both", expand=True, padx=10, pady=10)
             
-            letter_label = ctk.CTkLabel(
-                content,
-                text=letter,
-                font=ctk.CTkFont(size=32, weight="bold"),
-                text_color=self.primary_color
-            )
-            letter_label.pack(expand=True)
-            
-            sign_label = ctk.CTkLabel(
-                content,
-                text=f"Sign '{letter}'",
-                font=ctk.CTkFont(size=12),
-                text_color=self.dark_gray
-            )
-            sign_label.pack()
+            if self.atlas.has_image(letter):
+                letter_label = ctk.CTkLabel(
+                    content,
+                    text=letter,
+                    image=self.atlas.get_ctk_image(letter, THUMBNAIL_SIZE),
+                    compound="top",
+                    font=ctk.CTkFont(size=14, weight="bold"),
+                    text_color=self.primary_color
+                )
+                letter_label.pack(expand=True)
+                labels = [letter_label]
+            else:
+                letter_label = ctk.CTkLabel(
+                    content,
+                    text=letter,
+                    font=ctk.CTkFont(size=32, weight="bold"),
+                    text_color=self.primary_color
+                )
+                letter_label.pack(expand=True)
+                
+                sign_label = ctk.CTkLabel(
+                    content,
+                    text=f"Sign '{letter}'",
+                    font=ctk.CTkFont(size=12),
+                    text_color=self.dark_gray
+                )
+                sign_label.pack()
+                labels = [letter_label, sign_label]
             
             card.bind("<Button-1>", lambda e, l=letter: self.show_sign_detail(l))
-            letter_label.bind("<Button-1>", lambda e, l=letter: self.show_sign_detail(l))
-            sign_label.bind("<Button-1>", lambda e, l=letter: self.show_sign_detail(l))
+            for label in labels:
+                label.bind("<Button-1>", lambda e, l=letter: self.show_sign_detail(l))
+    
+    def close(self):
+        if self.window_manager is not None:
+            self.window_manager.hide(self)
+        else:
+            self.destroy()
     
     def show_sign_detail(self, letter):
         """Show detailed view for a sign"""
-        detail_window = SignDetailWindow(self, letter)
+        detail_window = SignDetailWindow(self, letter, self.atlas)
         detail_window.grab_set()
 
 
 class SignDetailWindow(ctk.CTkToplevel):
     """Popup window showing sign details"""
     
-    def __init__(self, parent, letter):
+    def __init__(self, parent, letter, atlas=None):
         super().__init__(parent)
         
+        self.atlas = atlas
+        
         self.WIDTH = 300
         self.HEIGHT = 400
         
@@ -178,11 +208,18 @@ class SignDetailWindow(ctk.CTkToplevel):
         image_frame.pack(pady=(0, 20))
         image_frame.pack_propagate(False)
 
-        ctk.CTkLabel(
-            image_frame,
-            text="👋",
-            font=ctk.CTkFont(size=60)
-        ).pack(expand=True)
+        if self.atlas is not None and self.atlas.has_image(letter):
+            ctk.CTkLabel(
+                image_frame,
+                text="",
+                image=self.atlas.get_ctk_image(letter, DETAIL_SIZE)
+            ).pack(expand=True)
+        else:
+            ctk.CTkLabel(
+                image_frame,
+                text="👋",
+                font=ctk.CTkFont(size=60)
+            ).pack(expand=True)
 
         description = self.get_sign_description(letter)
         desc_label = ctk.CTkLabel(
@@ -5,6 +5,9 @@ from ui.detection_window import DetectionWindow
 from ui.library_window import LibraryWindow
 from ui.learning_window import LearningWindow
 from ui.speech_window import SpeechWindow
+from ui.window_manager import WindowManager
+from utils.helpers import preload_letter_images
+from utils.settings_service import get_settings_service
 
 class MainWindow(ctk.CTk):
     def __init__(self):
@@ -33,9 +36,38 @@ class MainWindow(ctk.CTk):
         
         self.tts = TTSManager()
         
+        # Settings changes, including edits to settings.json, apply without a restart
+        self.settings = get_settings_service()
+        self.settings.subscribe(self.apply_settings)
+        self.apply_settings(self.settings.get_all())
+        self.settings.start_watching()
+        
+        # Warm the image cache for the sign library and speech-to-sign player
+        preload_letter_images(sizes=((150, 150), (200, 200)))
+        
+        # Feature windows are built on first use and kept around hidden
+        self.window_manager = WindowManager(self)
+        self.window_manager.register(
+            "detection", lambda manager: DetectionWindow(self, self.detector, self.tts, window_manager=manager),
+            modal=True
+        )
+        self.window_manager.register(
+            "speech", lambda manager: SpeechWindow(self, self.tts, window_manager=manager),
+            modal=True
+        )
+        self.window_manager.register(
+            "library", lambda manager: LibraryWindow(self, window_manager=manager),
+            modal=True
+        )
+        self.window_manager.register(
+            "learning", lambda manager: LearningWindow(self, window_manager=manager)
+        )
+        
         self.setup_ui()
         
         self.center_window()
+        
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
     
     def center_window(self):
         """Center the window on screen"""
@@ -157,21 +189,32 @@ class MainWindow(ctk.CTk):
     
     def open_detection(self):
         """Open Gesture Detection window"""
-        detection_window = DetectionWindow(self, self.detector, self.tts)
-        detection_window.grab_set()
+        self.window_manager.show("detection")
     
     def open_learning(self):
         """Open Learning window"""
-        learning_window = LearningWindow(self)
+        self.window_manager.show("learning")
     
     def open_speech(self):
         """Open Speech Text Conversion window"""
-        speech_window = SpeechWindow(self, self.tts)
-        speech_window.grab_set()
+        self.window_manager.show("speech")
     
     def open_library(self):
         """Open Gesture Library window"""
-        library_window = LibraryWindow(self)
-        library_window.grab_set()
+        self.window_manager.show("library")
+    
+    def apply_settings(self, changes):
+        if self.detector is not None:
+            self.detector.apply_settings(changes)
+        
+        if "tts_rate" in changes or "tts_volume" in changes:
+            self.tts.set_voice(rate=changes.get("tts_rate"), volume=changes.get("tts_volume"))
+    
+    def on_closing(self):
+        self.settings.stop_watching()
+        self.window_manager.destroy_all()
+        if self.detector is not None:
+            self.detector.stop_recording()
+        self.destroy()
     
    
\ No newline at end of file
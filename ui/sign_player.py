@@ -0,0 +1,148 @@
+import customtkinter as ctk
+import threading
+import time
+from PIL import Image
+from utils.helpers import get_letter_pil_image
+
+class SignPlayer:
+    """
+    Plays text as a fingerspelling animation of sign images
+
+    The whole frame sequence is decoded and resized to the label's pixel
+    size on a background thread, and each image is turned into a Tk photo
+    once before playback starts. A single after() timer then steps through
+    the prepared frames, so nothing is scaled while the animation runs.
+    """
+
+    def __init__(self, image_label, caption_label=None, size=(200, 200),
+                 letter_ms=700, gap_ms=150, space_ms=500):
+        self.image_label = image_label
+        self.caption_label = caption_label
+        self.size = size
+        self.letter_ms = letter_ms
+        self.gap_ms = gap_ms
+        self.space_ms = space_ms
+
+        self.frames = []
+        self.frame_index = 0
+        self.is_playing = False
+        self.prepare_time = 0.0
+
+        self._generation = 0
+        self._timer = None
+
+    def play(self, text, on_finished=None):
+        """Prepare frames for text in the background, then start playback"""
+        self.stop()
+
+        self._generation += 1
+        generation = self._generation
+
+        # Render at the size CTkImage will scale to, so showing a frame needs no resize
+        scaling = ctk.ScalingTracker.get_widget_scaling(self.image_label)
+        pixel_size = (round(self.size[0] * scaling), round(self.size[1] * scaling))
+
+        threading.Thread(
+            target=self._prepare,
+            args=(text, pixel_size, scaling, generation, on_finished),
+            daemon=True
+        ).start()
+
+    def stop(self):
+        self._generation += 1
+        self.is_playing = False
+
+        if self._timer is not None:
+            self.image_label.after_cancel(self._timer)
+            self._timer = None
+
+    def build_frames(self, text, pixel_size=None):
+        """
+        Decode and resize every image of the sequence
+
+        Args:
+            text: Text to fingerspell
+            pixel_size: Size to render at, defaults to the player size
+
+        Returns:
+            List of (PIL Image, caption, duration_ms) tuples
+        """
+        pixel_size = tuple(pixel_size or self.size)
+        blank = Image.new('RGB', pixel_size, color="#FAFAFA")
+        frames = []
+        previous = None
+
+        for char in text.upper():
+            if char.isalpha() and char.isascii():
+                if char == previous:
+                    # A short blank makes double letters visible
+                    frames.append((blank, "", self.gap_ms))
+
+                # Decoded images come from the shared image cache
+                frames.append((get_letter_pil_image(char, pixel_size), char, self.letter_ms))
+                previous = char
+
+            elif char.isspace():
+                if frames and frames[-1][1] != " ":
+                    frames.append((blank, " ", self.space_ms))
+                previous = None
+
+        return frames
+
+    def _to_ctk_frames(self, frames, scaling):
+        # Tk photos can only be made on the UI thread; make each one once, up front
+        appearance_mode = ctk.get_appearance_mode().lower()
+        images = {}
+        ctk_frames = []
+
+        for image, caption, duration in frames:
+            ctk_image = images.get(id(image))
+            if ctk_image is None:
+                ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=self.size)
+                ctk_image.create_scaled_photo_image(scaling, appearance_mode)
+                images[id(image)] = ctk_image
+            ctk_frames.append((ctk_image, caption, duration))
+
+        return ctk_frames
+
+    def _prepare(self, text, pixel_size, scaling, generation, on_finished):
+        start = time.perf_counter()
+        frames = self.build_frames(text, pixel_size)
+        prepare_time = time.perf_counter() - start
+
+        def start_playback():
+            if generation != self._generation:
+                return
+
+            self.frames = self._to_ctk_frames(frames, scaling)
+            self.frame_index = 0
+            self.prepare_time = prepare_time
+            self.is_playing = True
+            self._on_finished = on_finished
+            self._show_next()
+
+        try:
+            self.image_label.after(0, start_playback)
+        except RuntimeError:
+            # Window closed while we were preparing
+            pass
+
+    def _show_next(self):
+        if not self.is_playing:
+            return
+
+        if self.frame_index >= len(self.frames):
+            self.is_playing = False
+            self._timer = None
+            if self._on_finished:
+                self._on_finished()
+            return
+
+        image, caption, duration = self.frames[self.frame_index]
+        self.frame_index += 1
+
+        self.image_label.configure(image=image, text="")
+        if self.caption_label is not None:
+            self.caption_label.configure(text=caption.strip())
+
+        self._timer = self.image_label.after(duration, self._show_next)
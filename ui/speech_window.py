@@ -1,11 +1,19 @@
 import customtkinter as ctk
 import speech_recognition as sr
 import threading
+from core.speech_recognizer import get_recognizer_backend
+from core.speech_pipeline import RecognitionPipeline
+from utils.helpers import load_settings
+from utils.settings_service import get_settings_service
+from utils.vad import VoiceActivitySegmenter, NoiseCalibrator, CalibrationStore, create_vad
+from ui.sign_player import SignPlayer
 
 class SpeechWindow(ctk.CTkToplevel):
-    def __init__(self, parent, tts):
+    def __init__(self, parent, tts, window_manager=None):
         super().__init__(parent)
         
+        self.window_manager = window_manager
+        
         self.WIDTH = 390
         self.HEIGHT = 844
         
@@ -17,6 +25,17 @@ class SpeechWindow(ctk.CTkToplevel):
         self.recognizer = sr.Recognizer()
         self.is_listening = False
         
+        settings = load_settings()
+        backend_options = {}
+        if settings.get("speech_backend") == "vosk":
+            backend_options["model_path"] = settings.get("vosk_model_path")
+        self.recognizer_backend = get_recognizer_backend(settings.get("speech_backend"), **backend_options)
+        self.recognizer_workers = settings.get("speech_workers", 2)
+        self.vad_hangover_ms = settings.get("vad_hangover_ms", 300)
+        self.microphone_index = settings.get("microphone_index")
+        self.calibration_store = CalibrationStore(get_settings_service())
+        self.recognition_latencies = []
+        
         self.primary_color = "#2196F3"
         self.white = "#FFFFFF"
         self.gray = "#F5F5F5"
@@ -44,7 +63,7 @@ class SpeechWindow(ctk.CTkToplevel):
         back_button = ctk.CTkButton(
             header_frame,
             text="← Back",
-            command=self.destroy,
+            command=self.close,
             width=80,
             height=35,
             fg_color="transparent",
@@ -140,6 +159,56 @@ class SpeechWindow(ctk.CTkToplevel):
         self.text_display.pack(fill="x", pady=(0, 15))
         self.text_display.insert("1.0", "Hello World")
         
+        signs_card = ctk.CTkFrame(
+            self.main_container,
+            corner_radius=20,
+            fg_color=self.white,
+            border_width=1,
+            border_color="#E0E0E0"
+        )
+        signs_card.pack(fill="x", pady=(0, 20))
+        
+        signs_content = ctk.CTkFrame(signs_card, fg_color="transparent")
+        signs_content.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        ctk.CTkLabel(
+            signs_content,
+            text="Signs",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            text_color=self.primary_color
+        ).pack(anchor="w", pady=(0, 10))
+        
+        self.sign_image_label = ctk.CTkLabel(
+            signs_content,
+            text="Press \"Show Signs\" to fingerspell the text",
+            width=200,
+            height=200,
+            font=ctk.CTkFont(size=13),
+            text_color=self.dark_gray
+        )
+        self.sign_image_label.pack()
+        
+        self.sign_caption_label = ctk.CTkLabel(
+            signs_content,
+            text="",
+            font=ctk.CTkFont(size=24, weight="bold"),
+            text_color=self.primary_color
+        )
+        self.sign_caption_label.pack(pady=(5, 10))
+        
+        self.show_signs_button = ctk.CTkButton(
+            signs_content,
+            text="🤟 Show Signs",
+            command=self.toggle_signs,
+            height=45,
+            fg_color=self.primary_color,
+            hover_color="#1976D2",
+            font=ctk.CTkFont(size=15)
+        )
+        self.show_signs_button.pack(fill="x")
+        
+        self.sign_player = SignPlayer(self.sign_image_label, self.sign_caption_label)
+        
         self.input_frame = ctk.CTkFrame(
             self.main_container,
             corner_radius=20,
@@ -246,26 +315,18 @@ class SpeechWindow(ctk.CTkToplevel):
     
     def recognize_speech(self):
         try:
-            with sr.Microphone() as source:
+            backend = self.recognizer_backend
+            if not backend.is_loaded:
+                self.after(0, self.update_status, f"Loading {backend.name} recognizer...")
+            backend.load()
+            
+            with sr.Microphone(device_index=self.microphone_index) as source:
                 self.after(0, self.update_status, "Listening... Speak now")
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
                 
-                while self.is_listening:
-                    try:
-                        audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=5)
-                        
-                        self.after(0, self.update_status, "Recognizing...")
-                        text = self.recognizer.recognize_google(audio)
-                        
-                        self.after(0, self.update_display, text)
-                        self.after(0, self.update_status, "Ready")
-                        
-                    except sr.WaitTimeoutError:
-                        continue
-                    except sr.UnknownValueError:
-                        self.after(0, self.update_status, "Could not understand audio")
-                    except sr.RequestError as e:
-                        self.after(0, self.update_status, f"Recognition error: {e}")
+                if backend.streaming:
+                    self.recognize_streaming(source, backend)
+                else:
+                    self.recognize_phrases(source, backend)
         
         except Exception as e:
             self.after(0, self.update_status, f"Error: {str(e)}")
@@ -275,6 +336,92 @@ class SpeechWindow(ctk.CTkToplevel):
             text="🎤 Start Listening", fg_color=self.green
         ))
     
+    def recognize_phrases(self, source, backend):
+        # This thread only captures; recognition runs on the pipeline's workers
+        pipeline = RecognitionPipeline(backend, self.handle_phrase_result,
+                                       workers=self.recognizer_workers)
+        
+        # The noise level is remembered per microphone and keeps adapting while
+        # we listen, so there is no calibration pause before capture starts
+        device = self.microphone_name(source)
+        vad = create_vad(energy_threshold=self.recognizer.energy_threshold, sample_rate=source.SAMPLE_RATE)
+        calibrator = NoiseCalibrator(self.calibration_store.get(device), vad=vad)
+        
+        def on_noise(energy, speech_flags):
+            calibrator.update(energy, speech_flags)
+            self.calibration_store.put(device, calibrator.energy_threshold)
+        
+        # Segment on voice activity so recognition starts as soon as the user stops
+        segmenter = VoiceActivitySegmenter(
+            source.SAMPLE_RATE,
+            vad=vad,
+            hangover_ms=self.vad_hangover_ms,
+            noise_listener=on_noise
+        )
+        
+        def submit(segments):
+            for segment in segments:
+                audio = sr.AudioData(segment.pcm, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+                pipeline.submit(audio)
+                self.after(0, self.update_status, "Recognizing...")
+        
+        try:
+            while self.is_listening:
+                pcm = source.stream.read(source.CHUNK)
+                submit(segmenter.feed(pcm))
+            
+            submit(segmenter.flush())
+        finally:
+            pipeline.close(wait=True)
+            self.calibration_store.put(device, calibrator.energy_threshold, force=True)
+    
+    def microphone_name(self, source):
+        try:
+            if source.device_index is None:
+                info = source.audio.get_default_input_device_info()
+            else:
+                info = source.audio.get_device_info_by_index(source.device_index)
+            return info.get("name", "default")
+        except Exception:
+            return "default" if source.device_index is None else str(source.device_index)
+    
+    def handle_phrase_result(self, seq, result):
+        if result.error:
+            self.after(0, self.update_status, f"Recognition error: {result.error}")
+        elif result.text:
+            self.after(0, self.update_display, result.text)
+            self.report_latency(result)
+        else:
+            self.after(0, self.update_status, "Could not understand audio")
+    
+    def recognize_streaming(self, source, backend):
+        stream = backend.create_stream(source.SAMPLE_RATE)
+        
+        while self.is_listening:
+            pcm = source.stream.read(source.CHUNK)
+            result = stream.accept(pcm)
+            
+            if result is None:
+                continue
+            
+            if result.is_final:
+                if result.text:
+                    self.after(0, self.update_display, result.text)
+                    self.report_latency(result)
+            else:
+                self.after(0, self.update_display, result.text + " …")
+        
+        result = stream.finish()
+        if result and result.text:
+            self.after(0, self.update_display, result.text)
+            self.report_latency(result)
+    
+    def report_latency(self, result):
+        self.recognition_latencies.append(result.latency)
+        self.after(0, self.update_status,
+                   f"Ready ({self.recognizer_backend.name}: {result.latency * 1000:.0f} ms "
+                   f"for {result.audio_duration:.1f}s of speech)")
+    
     def speak_text(self):
         if self.mode_var.get() == "text_to_speech":
             text = self.text_input.get()
@@ -282,7 +429,39 @@ class SpeechWindow(ctk.CTkToplevel):
             text = self.text_display.get("1.0", "end-1c")
         
         if text:
-            self.tts.speak(text)
+            self.tts.speak_phrase(text)
+    
+    def toggle_signs(self):
+        if self.sign_player.is_playing:
+            self.sign_player.stop()
+            self.show_signs_button.configure(text="🤟 Show Signs")
+            return
+        
+        text = self.text_display.get("1.0", "end-1c").strip()
+        if not text:
+            return
+        
+        self.show_signs_button.configure(text="⏹ Stop Signs")
+        self.sign_player.play(text, on_finished=lambda: self.show_signs_button.configure(text="🤟 Show Signs"))
+    
+    def on_hide(self):
+        # Release the microphone while the window is hidden
+        if self.is_listening:
+            self.stop_listening()
+        if self.sign_player.is_playing:
+            self.sign_player.stop()
+            self.show_signs_button.configure(text="🤟 Show Signs")
+    
+    def close(self):
+        if self.window_manager is not None:
+            self.window_manager.hide(self)
+        else:
+            self.destroy()
+    
+    def destroy(self):
+        self.is_listening = False
+        self.sign_player.stop()
+        super().destroy()
     
     def update_display(self, text):
         self.text_display.delete("1.0", "end")
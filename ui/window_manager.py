@@ -0,0 +1,90 @@
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class WindowManager:
+    """
+    Builds each feature window once and then hides and shows it
+
+    Windows are constructed on first use. Closing a managed window only
+    withdraws it; the window's on_hide() hook is called so it can pause
+    camera or microphone work, and on_show() when it is opened again.
+    """
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.factories = {}
+        self.windows = {}
+        self.construction_times = {}
+        self.show_counts = {}
+
+    def register(self, name, factory, modal=False):
+        """
+        Register a window
+
+        Args:
+            name: Window name
+            factory: Function taking the manager and returning a new window
+            modal: Grab input while the window is shown
+        """
+        self.factories[name] = (factory, modal)
+
+    def show(self, name):
+        factory, modal = self.factories[name]
+        window = self.windows.get(name)
+
+        if window is None or not window.winfo_exists():
+            start = time.perf_counter()
+            window = factory(self)
+            elapsed = time.perf_counter() - start
+
+            self.windows[name] = window
+            self.construction_times[name] = elapsed
+            window.protocol("WM_DELETE_WINDOW", lambda: self.hide(window))
+            logger.info(f"Built {name} window in {elapsed * 1000:.0f} ms")
+        else:
+            window.deiconify()
+            window.lift()
+            if hasattr(window, "on_show"):
+                window.on_show()
+
+        self.show_counts[name] = self.show_counts.get(name, 0) + 1
+
+        if modal:
+            window.grab_set()
+
+        return window
+
+    def hide(self, window):
+        if not window.winfo_exists():
+            return
+
+        window.grab_release()
+        if hasattr(window, "on_hide"):
+            window.on_hide()
+        window.withdraw()
+
+    def is_visible(self, name):
+        window = self.windows.get(name)
+        return window is not None and window.winfo_exists() and window.winfo_viewable()
+
+    def destroy_all(self):
+        """Really close every window, releasing cameras and microphones"""
+        for window in self.windows.values():
+            if not window.winfo_exists():
+                continue
+            if hasattr(window, "on_closing"):
+                window.on_closing()
+            else:
+                window.destroy()
+        self.windows.clear()
+
+    def get_stats(self):
+        return {
+            name: {
+                "construction_time": self.construction_times.get(name),
+                "shown": self.show_counts.get(name, 0),
+            }
+            for name in self.factories
+        }
@@ -1,4 +1,13 @@
-from .hand_detector import HandDetector
-from .helpers import *
+_EXPORTS = {
+    'HandDetector': 'utils.hand_detector',
+}
 
-__all__ = ['HandDetector']
\ No newline at end of file
+__all__ = ['HandDetector']
+
+def __getattr__(name):
+    # Imported lazily so headless tools don't pay for OpenCV, MediaPipe or customtkinter;
+    # import helpers and other submodules directly
+    if name in _EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module 'utils' has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,178 @@
+import os
+import time
+import logging
+import cv2
+
+logger = logging.getLogger(__name__)
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".webm", ".m4v")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+
+class FrameSource:
+    """
+    A sequence of (frame, timestamp) pairs
+
+    read() returns the next pair or None when the source is exhausted.
+    Timestamps are in seconds; files use media time so results do not
+    depend on how fast the frames are processed.
+    """
+
+    name = "source"
+    live = False
+
+    def read(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __iter__(self):
+        while True:
+            item = self.read()
+            if item is None:
+                return
+            yield item
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class VideoFileSource(FrameSource):
+    """
+    Frames of a video file
+
+    Args:
+        path: Video file path
+        fps: Frame rate to assume when the container does not report one
+    """
+
+    def __init__(self, path, fps=30.0):
+        self.path = path
+        self.name = path
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise IOError(f"Could not open video: {path}")
+
+        reported = self.cap.get(cv2.CAP_PROP_FPS)
+        self.fps = reported if reported and reported > 0 else fps
+        self.index = 0
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if not ret:
+            return None
+        timestamp = self.index / self.fps
+        self.index += 1
+        return frame, timestamp
+
+    def close(self):
+        self.cap.release()
+
+class ImageFolderSource(FrameSource):
+    """
+    Images of a directory in name order, treated as consecutive frames
+
+    Args:
+        path: Directory of images
+        fps: Frame rate used for the timestamps
+    """
+
+    def __init__(self, path, fps=30.0):
+        self.path = path
+        self.name = path
+        self.fps = fps
+        self.files = list_images(path)
+        self.index = 0
+
+    def read(self):
+        while self.index < len(self.files):
+            file_path = self.files[self.index]
+            timestamp = self.index / self.fps
+            self.index += 1
+
+            frame = cv2.imread(file_path)
+            if frame is not None:
+                return frame, timestamp
+            logger.warning(f"Skipping unreadable image: {file_path}")
+        return None
+
+class CameraSource(FrameSource):
+    """
+    Live frames from a camera, timestamped on capture
+
+    Args:
+        index: OpenCV camera index
+    """
+
+    live = True
+
+    def __init__(self, index=0):
+        self.index = index
+        self.name = f"camera:{index}"
+        self.cap = cv2.VideoCapture(index)
+        if not self.cap.isOpened():
+            raise IOError(f"Could not open camera {index}")
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if not ret:
+            return None
+        return frame, time.monotonic()
+
+    def close(self):
+        self.cap.release()
+
+def list_images(path):
+    return sorted(
+        os.path.join(path, name) for name in os.listdir(path)
+        if name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+
+def collect_sources(paths):
+    """
+    Expand paths into frame source specs
+
+    A directory that contains images is one image sequence; other
+    directories are searched for video files.
+
+    Args:
+        paths: List of video files, image directories or directories of videos
+
+    Returns:
+        Sorted list of paths accepted by open_source
+    """
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            if list_images(path):
+                sources.append(path)
+                continue
+            for root, _, names in os.walk(path):
+                sources.extend(os.path.join(root, name) for name in names if name.lower().endswith(VIDEO_EXTENSIONS))
+        elif os.path.isfile(path):
+            sources.append(path)
+        else:
+            logger.warning(f"Skipping missing path: {path}")
+    return sorted(sources)
+
+def is_camera_spec(spec):
+    return isinstance(spec, int) or (isinstance(spec, str) and spec.isdigit())
+
+def open_source(spec, fps=30.0):
+    """
+    Open a frame source
+
+    Args:
+        spec: Camera index (int or digit string), image directory or video file
+        fps: Frame rate for image directories and videos without one
+
+    Returns:
+        FrameSource instance
+    """
+    if is_camera_spec(spec):
+        return CameraSource(int(spec))
+    if os.path.isdir(spec):
+        return ImageFolderSource(spec, fps=fps)
+    return VideoFileSource(spec, fps=fps)
@@ -85,6 +85,28 @@ class HandDetector:
         
         return landmarks
     
+    def get_landmarks_3d(self, img, hand_number=0):
+        """
+        Get hand landmarks with depth
+        
+        Args:
+            img: Input image (for dimensions)
+            hand_number: Which hand to get landmarks from (0-indexed)
+            
+        Returns:
+            Float array of shape (21, 3) in pixels, z scaled like x, or None if no hand
+        """
+        if not self.results or not self.results.multi_hand_landmarks:
+            return None
+        if hand_number >= len(self.results.multi_hand_landmarks):
+            return None
+        
+        h, w, _ = img.shape
+        hand = self.results.multi_hand_landmarks[hand_number]
+        points = np.array([[lm.x, lm.y, lm.z] for lm in hand.landmark], dtype=np.float32)
+        points *= np.array([w, h, w], dtype=np.float32)
+        return points
+    
     def get_all_landmarks(self, img):
         """
         Get landmarks for all detected hands
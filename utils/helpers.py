@@ -1,13 +1,15 @@
 import os
 import sys
+import threading
 import cv2
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
 import customtkinter as ctk
-import json
-import pickle
 from datetime import datetime
 import logging
+from utils.image_cache import image_cache
+from utils.placeholders import render_placeholder_image
+from utils.settings_service import get_settings_service
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -31,19 +33,43 @@ def create_ctk_image(image_path, size=None):
     Returns:
         CTkImage object or placeholder if image not found
     """
+    size = tuple(size) if size else None
+    cached = image_cache.get(("ctk", image_path, size))
+    if cached is not None:
+        return cached
+    
     try:
         if not os.path.exists(image_path):
             logger.warning(f"Image not found: {image_path}")
             return create_placeholder_image(size)
         
-        image = Image.open(image_path)
-        if size:
-            image = image.resize(size)
-        return ctk.CTkImage(light_image=image, dark_image=image)
+        image = load_pil_image(image_path, size)
+        ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
+        return image_cache.put(("ctk", image_path, size), ctk_image)
     except Exception as e:
         logger.error(f"Error loading image {image_path}: {e}")
         return create_placeholder_image(size)
 
+def load_pil_image(image_path, size=None):
+    """
+    Decode (and optionally resize) an image file, using the image cache
+    
+    Args:
+        image_path: Path to image file
+        size: Optional tuple (width, height) to resize image
+        
+    Returns:
+        Shared PIL Image; do not modify it
+    """
+    size = tuple(size) if size else None
+    
+    def load():
+        with Image.open(image_path) as image:
+            image = image.convert('RGBA')
+            return image.resize(size) if size else image.copy()
+    
+    return image_cache.get_or_create(("pil", image_path, size), load)
+
 def create_placeholder_image(size=(100, 100), text="Image", color="#2196F3"):
     """
     Create a placeholder image with text
@@ -56,30 +82,13 @@ def create_placeholder_image(size=(100, 100), text="Image", color="#2196F3"):
     Returns:
         CTkImage placeholder
     """
-    if not size:
-        size = (100, 100)
+    size = tuple(size) if size else (100, 100)
     
-    img = Image.new('RGB', size, color=color)
-    draw = ImageDraw.Draw(img)
+    def create():
+        img = render_placeholder_image(size, text, color)
+        return ctk.CTkImage(light_image=img, dark_image=img, size=size)
     
-    try:
-        font_size = min(size) // 4
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except:
-        font = ImageFont.load_default()
-    
-    text_bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = text_bbox[2] - text_bbox[0]
-    text_height = text_bbox[3] - text_bbox[1]
-    position = ((size[0] - text_width) // 2, (size[1] - text_height) // 2)
-    
-    bg_color = Image.new('RGB', (1, 1), color)
-    avg_color = np.array(bg_color).mean()
-    text_color = "white" if avg_color < 128 else "black"
-    
-    draw.text(position, text, fill=text_color, font=font)
-    
-    return ctk.CTkImage(light_image=img, dark_image=img)
+    return image_cache.get_or_create(("ctk_placeholder", text, size, color), create)
 
 def get_letter_image(letter, size=(150, 150)):
     """
@@ -98,6 +107,49 @@ def get_letter_image(letter, size=(150, 150)):
     
     return create_placeholder_image(size, letter, "#4CAF50")
 
+def get_letter_pil_image(letter, size=(150, 150)):
+    """
+    Get decoded and resized image for a letter sign
+    
+    Args:
+        letter: Single character A-Z
+        size: Image dimensions
+        
+    Returns:
+        PIL Image of the sign, or a placeholder
+    """
+    image_path = f"assets/signs/{letter}.png"
+    if os.path.exists(image_path):
+        try:
+            return load_pil_image(image_path, size)
+        except Exception as e:
+            logger.error(f"Error loading image {image_path}: {e}")
+    
+    return render_placeholder_image(size, letter, "#4CAF50")
+
+def preload_letter_images(sizes=((150, 150),), letters="ABCDEFGHIJKLMNOPQRSTUVWXYZ"):
+    """
+    Decode sign images for every letter and size on a background thread
+    
+    Args:
+        sizes: Image sizes to prepare
+        letters: Letters to prepare
+        
+    Returns:
+        The preloading thread
+    """
+    def run():
+        for size in sizes:
+            for letter in letters:
+                try:
+                    get_letter_pil_image(letter, tuple(size))
+                except Exception as e:
+                    logger.warning(f"Could not preload sign image for {letter}: {e}")
+    
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
 def draw_landmarks_on_image(image, landmarks, connections=None, color=(0, 255, 0), thickness=2):
     """
     Draw hand landmarks and connections on image
@@ -312,9 +364,7 @@ def save_settings(settings):
         settings: Dictionary of settings
     """
     try:
-        with open("settings.json", "w") as f:
-            json.dump(settings, f, indent=2)
-        logger.info("Settings saved successfully")
+        get_settings_service().replace(settings)
     except Exception as e:
         logger.error(f"Error saving settings: {e}")
 
@@ -328,29 +378,13 @@ def load_settings(default_settings=None):
     Returns:
         Dictionary of settings
     """
-    if default_settings is None:
-        default_settings = {
-            "camera_index": 0,
-            "confidence_threshold": 0.7,
-            "stabilization_frames": 5,
-            "tts_rate": 170,
-            "tts_volume": 0.9,
-            "theme": "light",
-            "language": "en"
-        }
+    # The shared service only re-reads the file when it has changed
+    service = get_settings_service()
     
-    try:
-        if os.path.exists("settings.json"):
-            with open("settings.json", "r") as f:
-                loaded_settings = json.load(f)
-            
-            settings = {**default_settings, **loaded_settings}
-            logger.info("Settings loaded successfully")
-            return settings
-    except Exception as e:
-        logger.error(f"Error loading settings: {e}")
+    if default_settings is None:
+        return service.get_all()
     
-    return default_settings
+    return {**default_settings, **service.get_stored()}
 
 def save_learning_progress(progress):
     """
@@ -359,14 +393,12 @@ def save_learning_progress(progress):
     Args:
         progress: Dictionary with letter -> accuracy mapping
     """
+    from utils.progress_store import ProgressStore
+    
     try:
-        progress_data = {
-            "timestamp": datetime.now().isoformat(),
-            "progress": progress
-        }
-        
-        with open("data/learning_progress.pkl", "wb") as f:
-            pickle.dump(progress_data, f)
+        store = ProgressStore()
+        store.set_accuracy(progress)
+        store.close()
         logger.info("Learning progress saved")
     except Exception as e:
         logger.error(f"Error saving learning progress: {e}")
@@ -378,12 +410,14 @@ def load_learning_progress():
     Returns:
         Dictionary with letter -> accuracy mapping
     """
+    from utils.progress_store import ProgressStore
+    
     try:
-        if os.path.exists("data/learning_progress.pkl"):
-            with open("data/learning_progress.pkl", "rb") as f:
-                progress_data = pickle.load(f)
-            logger.info("Learning progress loaded")
-            return progress_data.get("progress", {})
+        store = ProgressStore()
+        progress = store.load_accuracy()
+        store.close()
+        logger.info("Learning progress loaded")
+        return progress
     except Exception as e:
         logger.error(f"Error loading learning progress: {e}")
     
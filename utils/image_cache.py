@@ -0,0 +1,110 @@
+import threading
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+def estimate_image_bytes(image):
+    """
+    Estimate memory used by a decoded image
+
+    Args:
+        image: PIL Image or CTkImage
+
+    Returns:
+        Approximate size in bytes
+    """
+    # CTkImage keeps its source PIL image around
+    pil_image = getattr(image, "_light_image", None) or image
+
+    try:
+        width, height = pil_image.size
+        return width * height * len(pil_image.getbands())
+    except Exception:
+        return 0
+
+class ImageCache:
+    """
+    Thread-safe LRU cache of decoded images with a memory cap
+
+    Cached images are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, image):
+        size = estimate_image_bytes(image)
+
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+
+            self._entries[key] = (image, size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+        return image
+
+    def get_or_create(self, key, factory):
+        """
+        Return the cached image for key, creating it with factory() on a miss
+
+        Two threads missing the same key at once may both run factory(); the
+        last result wins, which is harmless for immutable images.
+        """
+        image = self.get(key)
+        if image is None:
+            image = self.put(key, factory())
+        return image
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+image_cache = ImageCache()
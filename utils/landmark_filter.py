@@ -0,0 +1,214 @@
+import math
+import numpy as np
+
+class OneEuroFilter:
+    """
+    One-Euro filter over a whole landmark array at once
+
+    Each coordinate gets its own adaptive cutoff: slow movement is smoothed
+    strongly (removing jitter), fast movement hardly at all (avoiding lag).
+    See Casiez et al., "1€ Filter", CHI 2012.
+
+    Args:
+        min_cutoff: Cutoff frequency in Hz at zero speed; lower is smoother
+        beta: How quickly the cutoff rises with speed; higher is less laggy
+        d_cutoff: Cutoff frequency for the speed estimate
+    """
+
+    name = "one_euro"
+
+    def __init__(self, min_cutoff=1.0, beta=0.01, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self._x = None
+        self._dx = None
+        self._t = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def __call__(self, x, timestamp):
+        x = np.asarray(x, dtype=np.float64)
+
+        if self._x is None or self._x.shape != x.shape:
+            self._x = x.copy()
+            self._dx = np.zeros_like(x)
+            self._t = timestamp
+            return self._x.copy()
+
+        dt = max(timestamp - self._t, 1e-6)
+        self._t = timestamp
+
+        a_d = self._alpha(self.d_cutoff, dt)
+        self._dx = a_d * (x - self._x) / dt + (1.0 - a_d) * self._dx
+
+        cutoff = self.min_cutoff + self.beta * np.abs(self._dx)
+        a = self._alpha(cutoff, dt)
+        self._x = a * x + (1.0 - a) * self._x
+
+        return self._x.copy()
+
+class KalmanFilter:
+    """
+    Constant-velocity Kalman filter, one independent filter per coordinate
+
+    All coordinates are updated together with array arithmetic; the 2x2
+    covariance of each coordinate is stored as three arrays.
+
+    Args:
+        process_noise: Acceleration noise (pixels/s^2)^2; higher follows faster
+        measurement_noise: Landmark noise in pixels^2; higher is smoother
+    """
+
+    name = "kalman"
+
+    def __init__(self, process_noise=5e4, measurement_noise=4.0):
+        self.q = process_noise
+        self.r = measurement_noise
+        self.reset()
+
+    def reset(self):
+        self._pos = None
+        self._t = None
+
+    def __call__(self, z, timestamp):
+        z = np.asarray(z, dtype=np.float64)
+
+        if self._pos is None or self._pos.shape != z.shape:
+            self._pos = z.copy()
+            self._vel = np.zeros_like(z)
+            self._p00 = np.full_like(z, self.r)
+            self._p01 = np.zeros_like(z)
+            self._p11 = np.full_like(z, self.q)
+            self._t = timestamp
+            return self._pos.copy()
+
+        dt = max(timestamp - self._t, 1e-6)
+        self._t = timestamp
+
+        # Predict
+        self._pos = self._pos + self._vel * dt
+        p00 = self._p00 + 2 * dt * self._p01 + dt * dt * self._p11 + self.q * dt ** 4 / 4
+        p01 = self._p01 + dt * self._p11 + self.q * dt ** 3 / 2
+        p11 = self._p11 + self.q * dt * dt
+
+        # Update with the measured position
+        s = p00 + self.r
+        k0 = p00 / s
+        k1 = p01 / s
+        residual = z - self._pos
+
+        self._pos = self._pos + k0 * residual
+        self._vel = self._vel + k1 * residual
+        self._p00 = (1 - k0) * p00
+        self._p11 = p11 - k1 * p01
+        self._p01 = (1 - k0) * p01
+
+        return self._pos.copy()
+
+LANDMARK_FILTERS = {
+    OneEuroFilter.name: OneEuroFilter,
+    KalmanFilter.name: KalmanFilter,
+}
+
+class LandmarkSmoother:
+    """
+    Keeps one filter per tracked hand
+
+    Args:
+        name: Filter type from LANDMARK_FILTERS, or None to pass landmarks through
+        **options: Options for the filter
+    """
+
+    def __init__(self, name="one_euro", **options):
+        if name is not None and name not in LANDMARK_FILTERS:
+            raise ValueError(f"Unknown landmark filter: {name}")
+
+        self.name = name
+        self.options = options
+        self.filters = {}
+
+    def smooth(self, landmarks, timestamp, hand=0):
+        """
+        Filter one frame of landmarks
+
+        Args:
+            landmarks: Array-like of shape (21, 2) or (21, 3)
+            timestamp: Frame time in seconds
+            hand: Key identifying the hand, e.g. its handedness label
+
+        Returns:
+            Smoothed float array with the same shape
+        """
+        if self.name is None:
+            return np.asarray(landmarks, dtype=np.float64)
+
+        landmark_filter = self.filters.get(hand)
+        if landmark_filter is None:
+            landmark_filter = LANDMARK_FILTERS[self.name](**self.options)
+            self.filters[hand] = landmark_filter
+
+        return landmark_filter(landmarks, timestamp)
+
+    def reset(self, hand=None):
+        """Forget filter state, for one hand or all of them when tracking is lost"""
+        if hand is None:
+            self.filters.clear()
+        else:
+            self.filters.pop(hand, None)
+
+    def keep_only(self, hands):
+        for hand in list(self.filters):
+            if hand not in hands:
+                del self.filters[hand]
+
+def measure_jitter(tracks):
+    """
+    Mean frame-to-frame landmark movement
+
+    Args:
+        tracks: Array of shape (frames, landmarks, dims)
+
+    Returns:
+        Mean displacement per landmark per frame
+    """
+    tracks = np.asarray(tracks, dtype=np.float64)
+    if len(tracks) < 2:
+        return 0.0
+    return float(np.mean(np.linalg.norm(np.diff(tracks, axis=0), axis=-1)))
+
+def synthetic_track(frames=300, fps=30.0, noise=2.0, seed=0):
+    """
+    A hand that holds still, moves, and holds still again, plus pixel noise
+
+    Returns:
+        Tuple (timestamps, clean, noisy) with landmark arrays of shape (frames, 21, 2)
+    """
+    rng = np.random.default_rng(seed)
+    timestamps = np.arange(frames) / fps
+    base = rng.uniform(200, 400, size=(21, 2))
+
+    # Smooth step of 100 pixels in the middle third
+    progress = np.clip((np.arange(frames) - frames / 3) / (frames / 3), 0, 1)
+    offset = (3 * progress ** 2 - 2 * progress ** 3)[:, None, None] * 100.0
+
+    clean = base[None] + offset
+    noisy = np.round(clean + rng.normal(0, noise, size=clean.shape))
+    return timestamps, clean, noisy
+
+if __name__ == "__main__":
+    timestamps, clean, noisy = synthetic_track()
+    print(f"raw        jitter {measure_jitter(noisy):6.2f} px/frame  "
+          f"error {np.mean(np.linalg.norm(noisy - clean, axis=-1)):5.2f} px")
+
+    for name in LANDMARK_FILTERS:
+        smoother = LandmarkSmoother(name)
+        smoothed = np.array([smoother.smooth(frame, t) for frame, t in zip(noisy, timestamps)])
+        print(f"{name:10s} jitter {measure_jitter(smoothed):6.2f} px/frame  "
+              f"error {np.mean(np.linalg.norm(smoothed - clean, axis=-1)):5.2f} px")
@@ -0,0 +1,45 @@
+import os
+
+def output_paths(sources, output_dir=None, suffix=""):
+    """
+    Choose the output file of every input file or folder
+
+    Without output_dir each file goes next to its source. In output_dir
+    the name keeps the source's path below the sources' common directory,
+    so inputs with the same name in different folders do not overwrite
+    each other.
+
+    Returns:
+        List of paths in the order of sources
+    """
+    specs = [os.path.normpath(spec) for spec in sources]
+    common = None
+    if output_dir and specs:
+        try:
+            common = os.path.commonpath([os.path.dirname(os.path.abspath(spec)) for spec in specs])
+        except ValueError:
+            # Sources on different drives share no directory
+            pass
+
+    paths = []
+    used = set()
+    for spec in specs:
+        if output_dir:
+            relative = os.path.relpath(os.path.abspath(spec), common) if common else os.path.basename(spec)
+            base = os.path.splitext(relative)[0].replace(os.sep, "_")
+            directory = output_dir
+        else:
+            base = os.path.splitext(os.path.basename(spec))[0]
+            directory = os.path.dirname(spec)
+
+        path = os.path.join(directory, f"{base}{suffix}")
+        counter = 2
+        while path in used:
+            path = os.path.join(directory, f"{base}_{counter}{suffix}")
+            counter += 1
+
+        os.makedirs(directory or ".", exist_ok=True)
+        used.add(path)
+        paths.append(path)
+
+    return paths
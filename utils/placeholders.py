@@ -0,0 +1,59 @@
+import numpy as np
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+from utils.image_cache import image_cache
+
+@lru_cache(maxsize=None)
+def _font_path():
+    # Probe for a TrueType font once per process instead of on every render
+    for candidate in ("arial.ttf", "Arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf"):
+        try:
+            ImageFont.truetype(candidate, 10)
+            return candidate
+        except Exception:
+            continue
+    return None
+
+@lru_cache(maxsize=64)
+def _get_font(font_size):
+    path = _font_path()
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, font_size)
+
+def render_placeholder_image(size=(100, 100), text="Image", color="#2196F3"):
+    """
+    Render a placeholder image with text
+
+    Args:
+        size: Image dimensions (width, height)
+        text: Text to display on placeholder
+        color: Background color
+
+    Returns:
+        Shared PIL Image; do not modify it
+    """
+    size = tuple(size) if size else (100, 100)
+    return image_cache.get_or_create(
+        ("placeholder", text, size, color),
+        lambda: _render_placeholder(size, text, color)
+    )
+
+def _render_placeholder(size, text, color):
+    img = Image.new('RGB', size, color=color)
+    draw = ImageDraw.Draw(img)
+
+    font = _get_font(max(1, min(size) // 4))
+
+    text_bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = text_bbox[2] - text_bbox[0]
+    text_height = text_bbox[3] - text_bbox[1]
+    position = ((size[0] - text_width) // 2, (size[1] - text_height) // 2)
+
+    bg_color = Image.new('RGB', (1, 1), color)
+    avg_color = np.array(bg_color).mean()
+    text_color = "white" if avg_color < 128 else "black"
+
+    draw.text(position, text, fill=text_color, font=font)
+
+    return img
@@ -0,0 +1,212 @@
+import os
+import time
+import queue
+import pickle
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = "data/learning_progress.db"
+LEGACY_PICKLE_PATH = "data/learning_progress.pkl"
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+CORRECT_STEP = 2
+WRONG_STEP = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    letter TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    confidence REAL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS letter_stats (
+    letter TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    accuracy INTEGER NOT NULL DEFAULT 0,
+    last_attempt REAL
+);
+"""
+
+# The per-letter row is updated in the same transaction as the attempt is
+# logged, so loading never has to scan the attempt history
+UPSERT_STATS = f"""
+INSERT INTO letter_stats (letter, attempts, correct, accuracy, last_attempt)
+VALUES (?, 1, ?, CASE WHEN ? THEN {CORRECT_STEP} ELSE 0 END, ?)
+ON CONFLICT(letter) DO UPDATE SET
+    attempts = attempts + 1,
+    correct = correct + excluded.correct,
+    accuracy = MAX(0, MIN(100, accuracy + CASE WHEN excluded.correct THEN {CORRECT_STEP} ELSE -{WRONG_STEP} END)),
+    last_attempt = excluded.last_attempt
+"""
+
+def next_accuracy(accuracy, correct):
+    """Accuracy after one attempt, matching what the store materializes"""
+    if correct:
+        return min(100, accuracy + CORRECT_STEP)
+    return max(0, accuracy - WRONG_STEP)
+
+def _connect(path):
+    connection = sqlite3.connect(path, timeout=5.0)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+class ProgressStore:
+    """
+    SQLite store of learning-mode practice attempts
+
+    Attempts are queued and written by a background thread in batched
+    transactions, so recording from the camera loop never blocks on disk.
+    Per-letter aggregates live in their own table and are updated with
+    each attempt, which keeps load() proportional to the number of letters.
+    """
+
+    def __init__(self, path=DB_PATH, legacy_path=LEGACY_PICKLE_PATH, batch_size=64):
+        self.path = path
+        self.batch_size = batch_size
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = _connect(path)
+        try:
+            connection.executescript(SCHEMA)
+            self._migrate_pickle(connection, legacy_path)
+            connection.commit()
+        finally:
+            connection.close()
+
+        self.written = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def _migrate_pickle(self, connection, legacy_path):
+        if not legacy_path or not os.path.exists(legacy_path):
+            return
+
+        count = connection.execute("SELECT COUNT(*) FROM letter_stats").fetchone()[0]
+        if count == 0:
+            try:
+                with open(legacy_path, "rb") as f:
+                    progress = pickle.load(f).get("progress", {})
+                connection.executemany(
+                    "INSERT INTO letter_stats (letter, accuracy) VALUES (?, ?)",
+                    [(letter, int(value)) for letter, value in progress.items()]
+                )
+                logger.info(f"Imported learning progress from {legacy_path}")
+            except Exception as e:
+                logger.error(f"Could not import {legacy_path}: {e}")
+                return
+
+        os.replace(legacy_path, legacy_path + ".migrated")
+
+    def record_attempt(self, letter, correct, confidence=None):
+        """Queue one practice attempt for writing"""
+        if self._closed:
+            return
+        self._queue.put((letter, 1 if correct else 0, confidence, time.time()))
+
+    def set_accuracy(self, progress):
+        """Overwrite the accuracy of letters, e.g. when importing progress"""
+        if self._closed:
+            return
+        self._queue.put(("set", dict(progress)))
+
+    def load(self):
+        """
+        Load per-letter aggregates
+
+        Returns:
+            Dictionary letter -> {"accuracy", "attempts", "correct", "last_attempt"}
+        """
+        stats = {letter: {"accuracy": 0, "attempts": 0, "correct": 0, "last_attempt": None}
+                 for letter in LETTERS}
+
+        connection = _connect(self.path)
+        try:
+            rows = connection.execute(
+                "SELECT letter, accuracy, attempts, correct, last_attempt FROM letter_stats"
+            ).fetchall()
+        finally:
+            connection.close()
+
+        for letter, accuracy, attempts, correct, last_attempt in rows:
+            stats[letter] = {
+                "accuracy": accuracy,
+                "attempts": attempts,
+                "correct": correct,
+                "last_attempt": last_attempt,
+            }
+
+        return stats
+
+    def load_accuracy(self):
+        return {letter: entry["accuracy"] for letter, entry in self.load().items()}
+
+    def flush(self):
+        """Block until every queued attempt is on disk"""
+        self._queue.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join(timeout=5.0)
+
+    def _write_loop(self):
+        connection = _connect(self.path)
+
+        while True:
+            item = self._queue.get()
+            batch = [item]
+
+            # Drain whatever else is waiting into the same transaction
+            while item is not None and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            stop = batch[-1] is None
+            items = [entry for entry in batch if entry is not None]
+
+            try:
+                with connection:
+                    for entry in items:
+                        self._apply(connection, entry)
+                self.written += len(items)
+            except Exception as e:
+                logger.error(f"Error saving learning progress: {e}")
+
+            for _ in batch:
+                self._queue.task_done()
+
+            if stop:
+                break
+
+        connection.close()
+
+    def _apply(self, connection, entry):
+        if entry[0] == "set":
+            connection.executemany(
+                "INSERT INTO letter_stats (letter, accuracy) VALUES (?, ?) "
+                "ON CONFLICT(letter) DO UPDATE SET accuracy = excluded.accuracy",
+                [(letter, int(value)) for letter, value in entry[1].items()]
+            )
+            return
+
+        letter, correct, confidence, created_at = entry
+        connection.execute(
+            "INSERT INTO attempts (letter, correct, confidence, created_at) VALUES (?, ?, ?, ?)",
+            (letter, correct, confidence, created_at)
+        )
+        connection.execute(UPSERT_STATS, (letter, correct, correct, created_at))
@@ -0,0 +1,245 @@
+import os
+import json
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+SETTINGS_PATH = "settings.json"
+
+DEFAULT_SETTINGS = {
+    "camera_index": 0,
+    "confidence_threshold": 0.7,
+    "stabilization_frames": 5,
+    "stabilizer": "weighted",
+    "stabilization_window_ms": 150,
+    "stabilization_min_samples": 3,
+    "landmark_filter": "one_euro",
+    "record_landmarks": False,
+    "tts_rate": 170,
+    "tts_volume": 0.9,
+    "speech_backend": None,
+    "vosk_model_path": "models/vosk",
+    "speech_workers": 2,
+    "vad_hangover_ms": 300,
+    "microphone_index": None,
+    "mic_calibration": {},
+    "theme": "light",
+    "language": "en"
+}
+
+class SettingsService:
+    """
+    Cached view of settings.json with change notification
+
+    The file is read once and only re-read when its modification time
+    changes. Writes go to a temporary file that is renamed over the
+    settings file, so readers never see a half-written file. Subscribers
+    are called with a dictionary of the keys that changed, whether the
+    change came from update() or from another process editing the file.
+
+    Subscribers may be called from the watcher thread and must hand any
+    widget updates over to the Tk main loop themselves.
+    """
+
+    def __init__(self, path=SETTINGS_PATH, defaults=None, check_interval=0.5):
+        self.path = path
+        self.defaults = dict(DEFAULT_SETTINGS if defaults is None else defaults)
+        self.check_interval = check_interval
+
+        self._settings = dict(self.defaults)
+        self._stored = {}
+        self._mtime = None
+        self._last_check = float("-inf")
+        self._subscribers = []
+        self._lock = threading.RLock()
+        self._watcher = None
+        self._stop_watching = threading.Event()
+
+        self.reload()
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_file(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Error loading settings: {e}")
+            return None
+
+    def reload(self, force=False):
+        """
+        Re-read the file if it changed on disk
+
+        Returns:
+            Dictionary of changed keys and their new values
+        """
+        with self._lock:
+            self._last_check = time.monotonic()
+            mtime = self._file_mtime()
+            if not force and mtime == self._mtime:
+                return {}
+
+            loaded = self._read_file()
+            if loaded is None:
+                # Keep the last good settings if the file is unreadable
+                return {}
+
+            self._mtime = mtime
+            self._stored = loaded
+            settings = {**self.defaults, **loaded}
+            changes = self._diff(settings)
+            self._settings = settings
+
+        self._notify(changes)
+        return changes
+
+    def _check(self):
+        if time.monotonic() - self._last_check >= self.check_interval:
+            self.reload()
+
+    def get(self, key, default=None):
+        self._check()
+        with self._lock:
+            return self._settings.get(key, default)
+
+    def get_all(self):
+        """Return a copy of all settings"""
+        self._check()
+        with self._lock:
+            return dict(self._settings)
+
+    def get_stored(self):
+        """Return a copy of only the settings present in the file"""
+        self._check()
+        with self._lock:
+            return dict(self._stored)
+
+    def update(self, changes=None, **kwargs):
+        """Change some settings, write them to disk and notify subscribers"""
+        changes = {**(changes or {}), **kwargs}
+
+        with self._lock:
+            self._check()
+            settings = {**self._settings, **changes}
+            changed = self._diff(settings)
+            if not changed:
+                return {}
+
+            # Only keys already in the file or being changed are written, so defaults stay defaults
+            stored = {**self._stored, **changes}
+            self._write(stored)
+            self._stored = stored
+            self._settings = settings
+
+        self._notify(changed)
+        return changed
+
+    def replace(self, settings):
+        """Write a complete settings dictionary"""
+        with self._lock:
+            self._write(settings)
+            self._stored = dict(settings)
+            settings = {**self.defaults, **settings}
+            changed = self._diff(settings)
+            self._settings = settings
+
+        self._notify(changed)
+        return changed
+
+    def _diff(self, settings):
+        keys = set(settings) | set(self._settings)
+        return {key: settings.get(key) for key in keys if settings.get(key) != self._settings.get(key)}
+
+    def _write(self, settings):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp_path = os.path.join(directory, f".{os.path.basename(self.path)}.tmp")
+
+        with open(tmp_path, "w") as f:
+            json.dump(settings, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        self._mtime = self._file_mtime()
+        logger.info("Settings saved successfully")
+
+    def subscribe(self, callback, keys=None):
+        """
+        Call callback(changes) whenever settings change
+
+        Args:
+            callback: Function taking a dictionary of changed settings
+            keys: Only notify about these keys (default: all)
+
+        Returns:
+            Function that removes the subscription
+        """
+        entry = (callback, frozenset(keys) if keys is not None else None)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+
+        return unsubscribe
+
+    def _notify(self, changes):
+        if not changes:
+            return
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for callback, keys in subscribers:
+            relevant = changes if keys is None else {k: v for k, v in changes.items() if k in keys}
+            if not relevant:
+                continue
+            try:
+                callback(relevant)
+            except Exception as e:
+                logger.error(f"Settings subscriber failed: {e}")
+
+    def start_watching(self, interval=1.0):
+        """Poll the file in the background so external edits apply live"""
+        if self._watcher is not None:
+            return
+
+        self._stop_watching.clear()
+
+        def watch():
+            while not self._stop_watching.wait(interval):
+                self.reload()
+
+        self._watcher = threading.Thread(target=watch, daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop_watching.set()
+        self._watcher = None
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_settings_service():
+    """
+    Get the process-wide settings service
+
+    Returns:
+        SettingsService for settings.json
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = SettingsService()
+        return _service
@@ -0,0 +1,243 @@
+import os
+import json
+import logging
+import threading
+import numpy as np
+from PIL import Image
+from utils.image_cache import image_cache
+from utils.placeholders import render_placeholder_image
+
+logger = logging.getLogger(__name__)
+
+SIGNS_DIR = "assets/signs"
+ATLAS_PATH = "data/sign_atlas.bin"
+INDEX_PATH = "data/sign_atlas.json"
+ATLAS_VERSION = 1
+ATLAS_SIZES = ((64, 64), (150, 150), (200, 200))
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+PLACEHOLDER_COLOR = "#4CAF50"
+
+def scan_sources(source_dir=SIGNS_DIR, letters=LETTERS):
+    """
+    Describe the sign images currently on disk
+
+    Returns:
+        Dictionary letter -> [mtime_ns, size] for every existing image
+    """
+    sources = {}
+    for letter in letters:
+        path = os.path.join(source_dir, f"{letter}.png")
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        sources[letter] = [stat.st_mtime_ns, stat.st_size]
+    return sources
+
+def build_atlas(source_dir=SIGNS_DIR, atlas_path=ATLAS_PATH, index_path=INDEX_PATH,
+                sizes=ATLAS_SIZES, letters=LETTERS):
+    """
+    Pack every sign image at every UI size into one RGBA file
+
+    Letters without an image get the usual placeholder so the atlas is
+    always complete. The index records the byte offset and shape of each
+    size block and the state of the sources it was built from.
+
+    Returns:
+        The index dictionary
+    """
+    sources = scan_sources(source_dir, letters)
+    blocks = []
+    offset = 0
+
+    directory = os.path.dirname(atlas_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = atlas_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        for width, height in sizes:
+            block = np.zeros((len(letters), height, width, 4), dtype=np.uint8)
+
+            for i, letter in enumerate(letters):
+                image = None
+                if letter in sources:
+                    try:
+                        with Image.open(os.path.join(source_dir, f"{letter}.png")) as source:
+                            image = source.convert('RGBA').resize((width, height))
+                    except Exception as e:
+                        logger.error(f"Could not read sign image for {letter}: {e}")
+
+                if image is None:
+                    image = render_placeholder_image((width, height), letter, PLACEHOLDER_COLOR).convert('RGBA')
+
+                block[i] = np.asarray(image)
+
+            f.write(block.tobytes())
+            blocks.append({"size": [width, height], "offset": offset, "shape": list(block.shape)})
+            offset += block.nbytes
+
+    os.replace(tmp_path, atlas_path)
+
+    index = {
+        "version": ATLAS_VERSION,
+        "letters": letters,
+        "blocks": blocks,
+        "sources": sources,
+    }
+
+    with open(index_path, "w") as f:
+        json.dump(index, f, indent=2)
+
+    logger.info(f"Built sign atlas with {len(letters)} letters at {len(sizes)} sizes ({offset} bytes)")
+    return index
+
+class SignAtlas:
+    """
+    Memory-mapped sign thumbnail atlas
+
+    Opening the atlas costs a stat() per source image and one mmap, no
+    matter how many thumbnails are shown. The atlas is rebuilt first when
+    any source in assets/signs has been added, removed or changed.
+    """
+
+    def __init__(self, source_dir=SIGNS_DIR, atlas_path=ATLAS_PATH, index_path=INDEX_PATH,
+                 sizes=ATLAS_SIZES, letters=LETTERS):
+        self.source_dir = source_dir
+        self.atlas_path = atlas_path
+        self.index_path = index_path
+        self.sizes = tuple(tuple(size) for size in sizes)
+        self.letters = letters
+
+        self.index = None
+        self._data = None
+        self._blocks = {}
+        self._lock = threading.Lock()
+
+    def is_stale(self, index):
+        if index is None or index.get("version") != ATLAS_VERSION:
+            return True
+        if index.get("letters") != self.letters:
+            return True
+        if set(tuple(b["size"]) for b in index.get("blocks", [])) != set(self.sizes):
+            return True
+        if not os.path.exists(self.atlas_path):
+            return True
+        return index.get("sources") != scan_sources(self.source_dir, self.letters)
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _release(self):
+        # The views share the mapping, so every reference has to go for it to be unmapped
+        self._blocks = {}
+        self._data = None
+        self.index = None
+
+    def close(self):
+        """
+        Unmap the atlas
+
+        Windows cannot replace a file that is still mapped, so open() also
+        drops the old mapping before rebuilding or mapping again. Arrays
+        returned by get_array() keep the mapping alive until they are
+        dropped.
+        """
+        with self._lock:
+            self._release()
+
+    def open(self):
+        """Map the atlas into memory, rebuilding it if the sources changed"""
+        with self._lock:
+            self._release()
+            index = self._read_index()
+            if self.is_stale(index):
+                index = build_atlas(self.source_dir, self.atlas_path, self.index_path,
+                                    self.sizes, self.letters)
+
+            self.index = index
+            self._data = np.memmap(self.atlas_path, dtype=np.uint8, mode="r")
+            self._blocks = {}
+            for block in index["blocks"]:
+                count = int(np.prod(block["shape"]))
+                view = self._data[block["offset"]:block["offset"] + count].reshape(block["shape"])
+                self._blocks[tuple(block["size"])] = view
+
+        return self
+
+    def ensure_open(self):
+        """Map the atlas unless it is already mapped and up to date"""
+        if self.index is None or self.is_stale(self.index):
+            return self.open()
+        return self
+
+    def has_image(self, letter):
+        """True if the letter has a real sign image rather than a placeholder"""
+        if self.index is None:
+            self.open()
+        return letter in self.index["sources"]
+
+    def get_array(self, letter, size):
+        if self.index is None:
+            self.open()
+        return self._blocks[tuple(size)][self.letters.index(letter)]
+
+    def get_pil_image(self, letter, size):
+        return Image.fromarray(np.array(self.get_array(letter, size)), 'RGBA')
+
+    def get_ctk_image(self, letter, size):
+        if self.index is None:
+            self.open()
+
+        size = tuple(size)
+        key = ("atlas", self.atlas_path, tuple(self.index["sources"].get(letter, ())), letter, size)
+
+        def create():
+            import customtkinter as ctk
+            image = self.get_pil_image(letter, size)
+            return ctk.CTkImage(light_image=image, dark_image=image, size=size)
+
+        return image_cache.get_or_create(key, create)
+
+_default_atlas = None
+_default_atlas_lock = threading.Lock()
+
+def get_sign_atlas():
+    """
+    Get the shared atlas for assets/signs, checking it is up to date
+
+    The mapping is reused across calls and only reopened when the sources
+    have changed.
+
+    Returns:
+        Opened SignAtlas
+    """
+    global _default_atlas
+    with _default_atlas_lock:
+        if _default_atlas is None:
+            _default_atlas = SignAtlas()
+        atlas = _default_atlas
+
+    return atlas.ensure_open()
+
+def add_arguments(parser):
+    parser.add_argument("--source-dir", default=SIGNS_DIR, help="Directory of <LETTER>.png sign images")
+    parser.add_argument("--output", default=ATLAS_PATH, help="Atlas file to write")
+    parser.add_argument("--index", default=INDEX_PATH, help="Atlas index file to write")
+
+def run(args):
+    index = build_atlas(args.source_dir, args.output, args.index)
+    print(f"Wrote {args.output} ({len(index['sources'])} sign images, "
+          f"{len(index['letters']) - len(index['sources'])} placeholders)")
+    return 0
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the sign thumbnail atlas")
+    add_arguments(parser)
+    raise SystemExit(run(parser.parse_args()))
@@ -0,0 +1,375 @@
+import time
+import wave
+import logging
+from collections import deque
+import numpy as np
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRAME_MS = 30
+SAMPLE_WIDTH = 2
+WEBRTC_SAMPLE_RATES = (8000, 16000, 32000, 48000)
+
+def frame_features(samples, frame_length):
+    """
+    Compute per-frame RMS energy and zero-crossing rate
+
+    Args:
+        samples: 1-D int16 numpy array, length a multiple of frame_length
+        frame_length: Samples per frame
+
+    Returns:
+        Tuple (energy, zcr) of float arrays, one value per frame
+    """
+    frames = samples[:len(samples) - len(samples) % frame_length].reshape(-1, frame_length)
+    frames = frames.astype(np.float32)
+
+    energy = np.sqrt(np.mean(frames * frames, axis=1))
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+    return energy, zcr
+
+class EnergyVAD:
+    """
+    Energy / zero-crossing voice activity detector
+
+    A frame is speech when its RMS energy is above the threshold and its
+    zero-crossing rate is below max_zcr, which rejects broadband hiss.
+    The energy threshold uses the same scale as
+    speech_recognition.Recognizer.energy_threshold.
+    """
+
+    def __init__(self, energy_threshold=300.0, max_zcr=0.35):
+        self.energy_threshold = energy_threshold
+        self.max_zcr = max_zcr
+
+    def classify(self, samples, frame_length, sample_rate):
+        energy, zcr = frame_features(samples, frame_length)
+        return (energy > self.energy_threshold) & (zcr < self.max_zcr), energy
+
+class WebRTCVAD:
+    """Google WebRTC voice activity detector, when webrtcvad is installed"""
+
+    def __init__(self, aggressiveness=2):
+        if webrtcvad is None:
+            raise RuntimeError("webrtcvad is not installed")
+        self.vad = webrtcvad.Vad(aggressiveness)
+
+    def classify(self, samples, frame_length, sample_rate):
+        frames = samples[:len(samples) - len(samples) % frame_length].reshape(-1, frame_length)
+        flags = np.array([self.vad.is_speech(frame.tobytes(), sample_rate) for frame in frames], dtype=bool)
+        energy, _ = frame_features(samples, frame_length)
+        return flags, energy
+
+def create_vad(prefer_webrtc=True, energy_threshold=300.0, sample_rate=None):
+    """
+    Create the best available voice activity detector
+
+    Args:
+        prefer_webrtc: Use webrtcvad when it is installed
+        energy_threshold: Threshold for the energy based fallback
+        sample_rate: Rate of the audio to classify. webrtcvad only accepts
+            8, 16, 32 and 48 kHz, so other rates (e.g. 44.1 kHz) get the
+            energy detector.
+
+    Returns:
+        EnergyVAD or WebRTCVAD instance
+    """
+    if prefer_webrtc and webrtcvad is not None:
+        if sample_rate is None or sample_rate in WEBRTC_SAMPLE_RATES:
+            return WebRTCVAD()
+        logger.info(f"webrtcvad does not support {sample_rate} Hz, using the energy VAD")
+    return EnergyVAD(energy_threshold=energy_threshold)
+
+class SpeechSegment:
+    """A run of speech cut out of a PCM stream"""
+
+    def __init__(self, pcm, start_sample, sample_rate):
+        self.pcm = pcm
+        self.start_sample = start_sample
+        self.sample_rate = sample_rate
+
+    @property
+    def start(self):
+        return self.start_sample / float(self.sample_rate)
+
+    @property
+    def duration(self):
+        return len(self.pcm) / float(SAMPLE_WIDTH * self.sample_rate)
+
+    @property
+    def end(self):
+        return self.start + self.duration
+
+    def __repr__(self):
+        return f"SpeechSegment({self.start:.2f}s - {self.end:.2f}s)"
+
+class VoiceActivitySegmenter:
+    """
+    Cuts a stream of 16-bit mono PCM into speech segments
+
+    A segment opens on the first speech frame (plus pre_roll_ms of audio
+    before it) and closes once hangover_ms of non-speech has followed, so a
+    segment is emitted as soon as the speaker stops rather than after a
+    fixed timeout. Segments longer than max_segment_s are split.
+    """
+
+    def __init__(self, sample_rate, vad=None, frame_ms=DEFAULT_FRAME_MS, hangover_ms=300,
+                 pre_roll_ms=150, min_speech_ms=120, max_segment_s=15.0, noise_listener=None):
+        self.sample_rate = sample_rate
+        self.vad = vad if vad is not None else create_vad(sample_rate=sample_rate)
+        self.noise_listener = noise_listener
+        self.frame_length = int(sample_rate * frame_ms / 1000)
+        self.frame_bytes = self.frame_length * SAMPLE_WIDTH
+
+        self.hangover_frames = max(1, int(hangover_ms / frame_ms))
+        self.pre_roll_frames = int(pre_roll_ms / frame_ms)
+        self.min_speech_frames = max(1, int(min_speech_ms / frame_ms))
+        self.max_segment_frames = int(max_segment_s * 1000 / frame_ms)
+
+        self.reset()
+
+    def reset(self):
+        self._buffer = b""
+        self._frames_seen = 0
+        self._pre_roll = []
+        self._segment = None
+        self._segment_start = 0
+        self._speech_frames = 0
+        self._silent_frames = 0
+
+    def feed(self, pcm):
+        """
+        Feed raw PCM bytes
+
+        Returns:
+            List of SpeechSegment objects completed by this chunk
+        """
+        self._buffer += pcm
+        usable = len(self._buffer) - len(self._buffer) % self.frame_bytes
+        if usable == 0:
+            return []
+
+        data, self._buffer = self._buffer[:usable], self._buffer[usable:]
+        samples = np.frombuffer(data, dtype=np.int16)
+        flags, energy = self.vad.classify(samples, self.frame_length, self.sample_rate)
+
+        if self.noise_listener is not None:
+            self.noise_listener(energy, flags)
+
+        segments = []
+        for index, is_speech in enumerate(flags):
+            frame = data[index * self.frame_bytes:(index + 1) * self.frame_bytes]
+            segment = self._process_frame(frame, bool(is_speech))
+            if segment is not None:
+                segments.append(segment)
+
+        return segments
+
+    def flush(self):
+        """Close any open segment at the end of the stream"""
+        segment = self._close_segment() if self._segment is not None else None
+        self.reset()
+        return [segment] if segment is not None else []
+
+    def _process_frame(self, frame, is_speech):
+        frame_index = self._frames_seen
+        self._frames_seen += 1
+
+        if self._segment is None:
+            if not is_speech:
+                self._pre_roll.append(frame)
+                if len(self._pre_roll) > self.pre_roll_frames:
+                    self._pre_roll.pop(0)
+                return None
+
+            self._segment = self._pre_roll + [frame]
+            self._segment_start = frame_index - len(self._pre_roll)
+            self._pre_roll = []
+            self._speech_frames = 1
+            self._silent_frames = 0
+            return None
+
+        self._segment.append(frame)
+        if is_speech:
+            self._speech_frames += 1
+            self._silent_frames = 0
+        else:
+            self._silent_frames += 1
+
+        if self._silent_frames >= self.hangover_frames or len(self._segment) >= self.max_segment_frames:
+            return self._close_segment()
+        return None
+
+    def _close_segment(self):
+        frames, speech_frames = self._segment, self._speech_frames
+        start = self._segment_start
+
+        # Trim the trailing hangover, keeping a little tail for natural endings
+        keep_tail = min(self._silent_frames, self.pre_roll_frames)
+        if self._silent_frames > keep_tail:
+            frames = frames[:len(frames) - (self._silent_frames - keep_tail)]
+
+        self._segment = None
+        self._speech_frames = 0
+        self._silent_frames = 0
+
+        if speech_frames < self.min_speech_frames:
+            return None
+
+        return SpeechSegment(b"".join(frames), start * self.frame_length, self.sample_rate)
+
+class NoiseCalibrator:
+    """
+    Tracks the ambient noise level of a microphone
+
+    The noise floor follows the energy of non-speech frames. When every
+    frame looks like speech for a while (threshold far too low), the
+    minimum frame energy over the last few seconds is used instead. The
+    resulting energy threshold is pushed into the VAD and can be persisted
+    per device, so listening never has to block on a calibration pass.
+    """
+
+    def __init__(self, energy_threshold=None, vad=None, ratio=1.5, min_threshold=50.0,
+                 smoothing=0.05, window_s=5.0, frame_ms=DEFAULT_FRAME_MS):
+        self.ratio = ratio
+        self.min_threshold = min_threshold
+        self.smoothing = smoothing
+        self.vad = vad
+        self.noise_floor = energy_threshold / ratio if energy_threshold else None
+        self.frames_seen = 0
+        self._recent_minimums = deque(maxlen=max(1, int(window_s * 1000 / frame_ms)))
+
+        if self.noise_floor is not None:
+            self._apply()
+
+    @property
+    def energy_threshold(self):
+        if self.noise_floor is None:
+            return None
+        return max(self.min_threshold, self.noise_floor * self.ratio)
+
+    def update(self, energy, speech_flags):
+        """Feed per-frame energies and speech flags from the VAD"""
+        if len(energy) == 0:
+            return
+
+        self._recent_minimums.extend(energy)
+        noise = energy[~speech_flags]
+
+        if len(noise):
+            # Adapt quickly until we have a few seconds of data, then slowly
+            alpha = max(self.smoothing, 1.0 / (self.frames_seen + len(noise)))
+            level = float(np.mean(noise))
+            if self.noise_floor is None:
+                self.noise_floor = level
+            else:
+                self.noise_floor += alpha * (level - self.noise_floor)
+            self.frames_seen += len(noise)
+
+        elif len(self._recent_minimums) == self._recent_minimums.maxlen:
+            floor = float(np.min(self._recent_minimums))
+            threshold = self.energy_threshold
+            if threshold is None or floor > threshold:
+                self.noise_floor = floor
+
+        self._apply()
+
+    def _apply(self):
+        if self.vad is not None and hasattr(self.vad, "energy_threshold"):
+            self.vad.energy_threshold = self.energy_threshold
+
+class CalibrationStore:
+    """
+    Persists per-device energy thresholds in the settings file
+
+    Only the mic_calibration key is written, through the settings
+    service, so a put() from the audio thread cannot overwrite settings
+    changed elsewhere in the meantime.
+
+    Args:
+        settings: SettingsService
+        min_interval: Minimum seconds between writes
+    """
+
+    def __init__(self, settings, min_interval=30.0):
+        self.settings = settings
+        self.min_interval = min_interval
+        self._last_saved = {}
+
+    def get(self, device):
+        return (self.settings.get("mic_calibration") or {}).get(device)
+
+    def put(self, device, energy_threshold, force=False):
+        if energy_threshold is None:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_saved.get(device, float("-inf")) < self.min_interval:
+            return
+
+        calibration = dict(self.settings.get("mic_calibration") or {})
+        calibration[device] = round(float(energy_threshold), 1)
+        self.settings.update(mic_calibration=calibration)
+        self._last_saved[device] = now
+
+def read_wav_pcm(path):
+    """
+    Read a 16-bit mono WAV file
+
+    Args:
+        path: Path to WAV file
+
+    Returns:
+        Tuple (pcm_bytes, sample_rate)
+    """
+    with wave.open(path, "rb") as wav:
+        if wav.getsampwidth() != SAMPLE_WIDTH:
+            raise ValueError(f"{path}: expected 16-bit samples, got {wav.getsampwidth() * 8}-bit")
+
+        pcm = wav.readframes(wav.getnframes())
+        sample_rate = wav.getframerate()
+
+        if wav.getnchannels() > 1:
+            samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, wav.getnchannels())
+            pcm = samples.mean(axis=1).astype(np.int16).tobytes()
+
+    return pcm, sample_rate
+
+def segment_wav_file(path, vad=None, chunk_ms=500, **segmenter_options):
+    """
+    Split a WAV file into speech segments
+
+    Args:
+        path: Path to 16-bit WAV file
+        vad: Optional voice activity detector
+        chunk_ms: Size of the chunks fed to the segmenter, like a live stream
+        **segmenter_options: Options for VoiceActivitySegmenter
+
+    Returns:
+        List of SpeechSegment objects
+    """
+    pcm, sample_rate = read_wav_pcm(path)
+    segmenter = VoiceActivitySegmenter(sample_rate, vad=vad, **segmenter_options)
+
+    chunk_bytes = int(sample_rate * chunk_ms / 1000) * SAMPLE_WIDTH
+    segments = []
+    for offset in range(0, len(pcm), chunk_bytes):
+        segments.extend(segmenter.feed(pcm[offset:offset + chunk_bytes]))
+    segments.extend(segmenter.flush())
+
+    return segments
+
+if __name__ == "__main__":
+    import sys
+
+    for wav_path in sys.argv[1:]:
+        print(f"{wav_path}:")
+        for segment in segment_wav_file(wav_path):
+            print(f"  {segment.start:7.2f}s - {segment.end:7.2f}s  ({segment.duration:.2f}s)")